@@ -0,0 +1,22 @@
+"""Shared helpers for moving Arrow tables into pandas frames."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# pandas' Arrow-backed "str" dtype; Arrow string columns map onto it without
+# creating Python str objects.
+ARROW_STRING_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)
+
+
+def arrow_string_types(arrow_type: pa.DataType) -> pd.StringDtype | None:
+    """``types_mapper`` for ``to_pandas`` that keeps Arrow strings Arrow-backed.
+
+    String and large-string columns become ARROW_STRING_DTYPE; every other
+    type falls back to the default conversion.
+    """
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return ARROW_STRING_DTYPE
+    return None
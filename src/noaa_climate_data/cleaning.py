@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import repeat
 import logging
 import re
-from typing import Iterable
+from typing import Iterable, Iterator, Literal
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 # Module-level logger for strict parsing warnings
 logger = logging.getLogger(__name__)
 
+from .arrow_utils import ARROW_STRING_DTYPE, arrow_string_types
 from .constants import (
-    ADDITIONAL_DATA_PREFIXES,
     DATA_SOURCE_FLAGS,
     EQD_ELEMENT_NAMES,
     EQD_FLAG1_CODES,
@@ -27,17 +34,21 @@ from .constants import (
     QC_PROCESS_CODES,
     QC_STATUS_VALUES,
     QC_REASON_ENUM,
+    QC_CODE_SIGNALS,
     USABILITY_METRIC_INDICATORS,
     REPORT_TYPE_CODES,
     FieldPartRule,
-    get_expected_part_count,
-    get_field_registry_entry,
-    get_field_rule,
-    get_token_width_rules,
+    ParserPlan,
+    PartParserPlan,
+    SpecialCaseRule,
+    can_hold_missing_sentinel,
+    get_output_columns,
+    get_parser_plan,
     is_valid_eqd_identifier,
     is_valid_repeated_identifier,
     is_valid_section_identifier_token,
     to_friendly_column,
+    to_internal_column,
 )
 
 
@@ -95,72 +106,27 @@ def enforce_domain(value: str, part_rule: FieldPartRule | None) -> str | None:
 
 
 def _quality_for_part(prefix: str, part_index: int, parts: list[str]) -> str | None:
-    rule = get_field_rule(prefix)
-    if not rule:
-        return None
-    part_rule = rule.parts.get(part_index)
-    if not part_rule or part_rule.quality_part is None:
-        return None
-    quality_index = part_rule.quality_part
-    if quality_index > len(parts):
-        return None
-    return parts[quality_index - 1]
-
-
-def _allowed_quality_set(prefix: str, quality_part_index: int) -> set[str]:
-    rule = get_field_rule(prefix)
-    if rule is None:
-        return QUALITY_FLAGS
-    quality_rule = rule.parts.get(quality_part_index)
-    if quality_rule and quality_rule.allowed_quality:
-        return quality_rule.allowed_quality
-    return QUALITY_FLAGS
-
+    return _plan_quality_for_part(get_parser_plan(prefix), part_index, parts)
 
-def _allowed_quality_for_value(prefix: str, part_index: int) -> set[str]:
-    rule = get_field_rule(prefix)
-    if rule is None:
-        return QUALITY_FLAGS
-    part_rule = rule.parts.get(part_index)
-    if part_rule is None or part_rule.quality_part is None:
-        return QUALITY_FLAGS
-    return _allowed_quality_set(prefix, part_rule.quality_part)
 
-
-def _additional_data_fixed_width(
-    prefix: str, part_rule: FieldPartRule | None
-) -> int | None:
-    if part_rule is None or part_rule.kind != "numeric":
-        return None
-    prefix_key = prefix[:2]
-    if prefix_key not in ADDITIONAL_DATA_PREFIXES:
+def _plan_quality_for_part(plan: ParserPlan, part_index: int, parts: list[str]) -> str | None:
+    part_plan = plan.parts.get(part_index)
+    if part_plan is None or part_plan.quality_part is None:
         return None
-    if not part_rule.missing_values:
+    if part_plan.quality_part > len(parts):
         return None
-    lengths = {
-        len(value)
-        for value in part_rule.missing_values
-        if value.isdigit()
-    }
-    return next(iter(lengths)) if len(lengths) == 1 else None
+    return parts[part_plan.quality_part - 1]
 
 
-def _single_quality_part(prefix: str) -> int | None:
-    rule = get_field_rule(prefix)
-    if not rule:
-        return None
-    quality_parts = {
-        part.quality_part
-        for part in rule.parts.values()
-        if part.quality_part is not None
-    }
-    if len(quality_parts) == 1:
-        return next(iter(quality_parts))
-    return None
+def _allowed_quality_for_value(plan: ParserPlan, part_index: int) -> set[str]:
+    part_plan = plan.parts.get(part_index)
+    return part_plan.allowed_quality if part_plan is not None else QUALITY_FLAGS
 
 
-def _is_eqd_prefix(prefix: str) -> bool:
-    return len(prefix) == 3 and prefix[0] in {"Q", "P", "R", "C", "D", "N"} and prefix[1:].isdigit()
+def _special_case_matches(special: SpecialCaseRule, parts: list[str]) -> bool:
+    if len(parts) < max(index for index, _ in special.conditions):
+        return False
+    return all(parts[index - 1].strip().upper() == token for index, token in special.conditions)
 
 
 def _is_valid_eqd_parameter_code(prefix: str, value: str) -> bool:
@@ -254,11 +220,167 @@ def parse_field(raw: str) -> ParsedField:
     return ParsedField(parts=parts, raw_parts=raw_parts, values=values, quality=quality)
 
 
+# ── Rejection accounting ─────────────────────────────────────────────────
+#
+# Strict-mode rejections are counted by (identifier, part, reason) instead of
+# logging one warning per cell. clean_noaa_dataframe logs one summary line per
+# key and column and can return the structured ParseReport. Called without a
+# report, the per-cell functions keep logging each rejection immediately.
+
+RejectionReason = Literal[
+    "malformed_section_identifier",
+    "invalid_eqd_identifier",
+    "invalid_repeated_identifier",
+    "unknown_identifier",
+    "truncated_payload",
+    "extra_payload",
+    "whitespace_padding",
+    "token_width",
+    "token_pattern",
+    "control_header",
+    "record_length_mismatch",
+]
+RejectionKey = tuple[str, int | None, str]
+
+
+def _rejection_subject(identifier: str, part: int | None) -> str:
+    return f"{identifier} part {part}" if part is not None else identifier
+
+
+@dataclass
+class ParseReport:
+    """Strict-mode rejection counts keyed by (identifier, part, reason).
+
+    ``details`` keeps the distinct messages behind each key (for example each
+    offending token width); ``examples`` holds up to ``max_examples`` raw
+    values per key and is only filled when sampled verbose logging is on.
+    """
+
+    max_examples: int = 0
+    counts: Counter[RejectionKey] = field(default_factory=Counter)
+    details: dict[RejectionKey, Counter[str]] = field(default_factory=dict)
+    examples: dict[RejectionKey, list[str]] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def record(
+        self,
+        identifier: str,
+        part: int | None,
+        reason: RejectionReason,
+        detail: str,
+        count: int = 1,
+        examples: Iterable[object] = (),
+    ) -> None:
+        if count <= 0:
+            return
+        key = (identifier, part, reason)
+        self.counts[key] += count
+        self.details.setdefault(key, Counter())[detail] += count
+        if self.max_examples > 0:
+            sample = self.examples.setdefault(key, [])
+            for example in examples:
+                if len(sample) >= self.max_examples:
+                    break
+                sample.append(str(example))
+
+    def merge(self, other: ParseReport) -> None:
+        for key, details in other.details.items():
+            for detail, count in details.items():
+                self.record(*key, detail, count=count, examples=other.examples.get(key, ()))
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per (identifier, part, reason) with its rejection count."""
+        rows = [
+            {"identifier": identifier, "part": part, "reason": reason, "count": count}
+            for (identifier, part, reason), count in self.counts.items()
+        ]
+        return pd.DataFrame(rows, columns=["identifier", "part", "reason", "count"])
+
+    def log_summary(self) -> None:
+        """Log one [PARSE_STRICT] line per key, plus sampled examples."""
+        for key, details in self.details.items():
+            identifier, part, reason = key
+            subject = _rejection_subject(identifier, part)
+            summary = "; ".join(f"{detail} ({count} value(s))" for detail, count in details.items())
+            logger.warning(f"[PARSE_STRICT] Rejected {subject}: {summary}")
+            for example in self.examples.get(key, ()):
+                logger.warning(f"[PARSE_STRICT] Example {subject} ({reason}): {example!r}")
+
+
+def _reject(
+    report: ParseReport | None,
+    identifier: str,
+    part: int | None,
+    reason: RejectionReason,
+    detail: str,
+    count: int = 1,
+    examples: Iterable[object] = (),
+) -> None:
+    if report is None:
+        logger.warning(f"[PARSE_STRICT] Rejected {_rejection_subject(identifier, part)}: {detail}")
+        return
+    report.record(identifier, part, reason, detail, count=count, examples=examples)
+
+
+def _identifier_accepted(
+    plan: ParserPlan,
+    strict_mode: bool,
+    report: ParseReport | None,
+    count: int = 1,
+    examples: Iterable[object] = (),
+) -> bool:
+    """Identifier-level gates from clean_value_quality (A2)."""
+    prefix = plan.identifier
+    if strict_mode and plan.section_token_valid is False:
+        _reject(
+            report, prefix, None, "malformed_section_identifier",
+            "malformed section identifier token (expected 3 upper-case alphanumeric chars)",
+            count=count, examples=examples,
+        )
+        return False
+    if plan.rule is None:
+        if plan.eqd_valid is False:
+            if strict_mode:
+                _reject(
+                    report, prefix, None, "invalid_eqd_identifier",
+                    "invalid EQD identifier format", count=count, examples=examples,
+                )
+            return False
+        if plan.repeated_valid is False:
+            if strict_mode:
+                _reject(
+                    report, prefix, None, "invalid_repeated_identifier",
+                    "invalid repeated identifier format", count=count, examples=examples,
+                )
+            return False
+    return True
+
+
+def _reject_arity(
+    report: ParseReport | None,
+    prefix: str,
+    expected_parts: int,
+    part_count: int,
+    count: int = 1,
+    examples: Iterable[object] = (),
+) -> None:
+    kind = "truncated" if part_count < expected_parts else "extra"
+    _reject(
+        report, prefix, None, f"{kind}_payload",
+        f"{kind} payload - expected {expected_parts} parts, got {part_count}",
+        count=count, examples=examples,
+    )
+
+
 def _expand_parsed(
     parsed: ParsedField,
     prefix: str,
     allow_quality: bool,
     strict_mode: bool = True,
+    report: ParseReport | None = None,
 ) -> dict[str, object]:
     """Expand multi-part parsed field into column dictionary with QC signals.
 
@@ -279,73 +401,43 @@ def _expand_parsed(
         prefix: Field identifier (e.g., "WND", "MA1", "GE1")
         allow_quality: Whether to include quality column if present
         strict_mode: If True, enforce token width validation (A4) and log rejections
+        report: Optional ParseReport that counts rejections instead of logging them
 
     Returns:
         Dict mapping output column names to values
     """
+    plan = get_parser_plan(prefix)
     payload: dict[str, object] = {}
     malformed_parts: set[int] = set()
-    is_variable_direction = (
-        prefix == "WND"
-        and len(parsed.parts) >= 3
-        and parsed.parts[0].strip() == "999"
-        and parsed.parts[2].strip().upper() == "V"
-    )
-    if prefix == "WND":
-        payload["WND__direction_variable"] = is_variable_direction
-    is_od_calm = (
-        prefix.startswith("OD")
-        and len(parsed.parts) >= 4
-        and parsed.parts[2].strip() == "999"
-        and parsed.parts[3].strip() == "0000"
-    )
-    is_wnd_calm = (
-        prefix == "WND"
-        and len(parsed.parts) >= 4
-        and parsed.parts[2].strip() == "9"
-        and parsed.parts[3].strip() == "0000"
-    )
-    is_oe_calm = (
-        prefix.startswith("OE")
-        and len(parsed.parts) >= 4
-        and parsed.parts[2].strip() == "00000"
-        and parsed.parts[3].strip() == "999"
-    )
-    is_eqd = _is_eqd_prefix(prefix)
-    field_rule = get_field_rule(prefix)
+    is_variable_direction = False
+    if plan.variable_direction is not None:
+        is_variable_direction = _special_case_matches(plan.variable_direction, parsed.parts)
+        payload[f"{prefix}__direction_variable"] = is_variable_direction
+    calm_overrides = {
+        special.target_part: special.value
+        for special in plan.calm
+        if _special_case_matches(special, parsed.parts)
+    }
     quality_value = None
-    if allow_quality:
-        quality_part_index = _single_quality_part(prefix)
-        if quality_part_index is not None and quality_part_index <= len(parsed.parts):
-            quality_value = parsed.parts[quality_part_index - 1].strip()
-            if quality_value == "":
-                quality_value = None
-    allowed_quality = QUALITY_FLAGS
-    if allow_quality and quality_part_index is not None:
-        allowed_quality = _allowed_quality_set(prefix, quality_part_index)
+    if allow_quality and plan.quality_part is not None and plan.quality_part <= len(parsed.parts):
+        quality_value = parsed.parts[plan.quality_part - 1].strip() or None
     invalid_quality = (
         allow_quality
         and quality_value is not None
-        and quality_value not in allowed_quality
+        and quality_value not in plan.allowed_quality
     )
     for idx, (part, value) in enumerate(zip(parsed.parts, parsed.values), start=1):
-        entry = get_field_registry_entry(prefix, idx, suffix="part")
-        key = entry.internal_name if entry else f"{prefix}__part{idx}"
-        part_rule = field_rule.parts.get(idx) if field_rule else None
-        if is_variable_direction and idx == 1:
-            payload[key] = None
-            continue
-        if is_wnd_calm and idx == 3:
-            payload[key] = "C"
-            continue
-        if is_od_calm and idx == 3:
-            payload[key] = 0.0
+        key = plan.part_key(idx)
+        part_plan = plan.parts.get(idx)
+        part_rule = part_plan.rule if part_plan else None
+        if is_variable_direction and idx == plan.variable_direction.target_part:
+            payload[key] = plan.variable_direction.value
             continue
-        if is_oe_calm and idx == 4:
-            payload[key] = 0.0
+        if idx in calm_overrides:
+            payload[key] = calm_overrides[idx]
             continue
-        part_quality = _quality_for_part(prefix, idx, parsed.parts) if allow_quality else None
-        allowed_for_part = _allowed_quality_for_value(prefix, idx)
+        part_quality = _plan_quality_for_part(plan, idx, parsed.parts) if allow_quality else None
+        allowed_for_part = _allowed_quality_for_value(plan, idx)
         if part_quality is not None and part_quality not in allowed_for_part:
             payload[key] = None
             continue
@@ -359,20 +451,20 @@ def _expand_parsed(
             continue
         
         # A4: Strict mode token width/format validation
-        if strict_mode:
-            width_rules = get_token_width_rules(prefix, idx)
-            if width_rules:
+        if strict_mode and part_plan is not None:
+            if part_plan.token_width is not None or part_plan.token_pattern is not None:
                 part_stripped = part.strip()
                 raw_part = parsed.raw_parts[idx - 1] if idx - 1 < len(parsed.raw_parts) else part
                 # Check token width
-                if 'width' in width_rules:
-                    expected_width = width_rules['width']
+                if part_plan.token_width is not None:
+                    expected_width = part_plan.token_width
                     if part_rule and part_rule.kind == "numeric":
                         # Reject space-padded numeric tokens in strict mode.
                         if raw_part != raw_part.strip():
-                            logger.warning(
-                                f"[PARSE_STRICT] Rejected {prefix} part {idx}: "
-                                "token contains leading/trailing whitespace"
+                            _reject(
+                                report, prefix, idx, "whitespace_padding",
+                                "token contains leading/trailing whitespace",
+                                examples=[",".join(parsed.raw_parts)],
                             )
                             malformed_parts.add(idx)
                             payload[key] = None
@@ -383,20 +475,21 @@ def _expand_parsed(
                         # Preserve raw token width for fixed-width categorical/quality tokens.
                         test_value = raw_part
                     if len(test_value) != expected_width:
-                        logger.warning(
-                            f"[PARSE_STRICT] Rejected {prefix} part {idx}: "
-                            f"token width {len(test_value)}, expected {expected_width}"
+                        _reject(
+                            report, prefix, idx, "token_width",
+                            f"token width {len(test_value)}, expected {expected_width}",
+                            examples=[",".join(parsed.raw_parts)],
                         )
                         malformed_parts.add(idx)
                         payload[key] = None
                         continue
                 # Check token pattern
-                if 'pattern' in width_rules:
-                    pattern = width_rules['pattern']
-                    if not pattern.fullmatch(part_stripped):
-                        logger.warning(
-                            f"[PARSE_STRICT] Rejected {prefix} part {idx}: "
-                            f"token format mismatch (pattern validation failed)"
+                if part_plan.token_pattern is not None:
+                    if not part_plan.token_pattern.fullmatch(part_stripped):
+                        _reject(
+                            report, prefix, idx, "token_pattern",
+                            "token format mismatch (pattern validation failed)",
+                            examples=[",".join(parsed.raw_parts)],
                         )
                         malformed_parts.add(idx)
                         payload[key] = None
@@ -406,7 +499,7 @@ def _expand_parsed(
             if part.strip().upper() not in part_rule.allowed_quality:
                 payload[key] = None
                 continue
-        fixed_width = _additional_data_fixed_width(prefix, part_rule)
+        fixed_width = part_plan.fixed_width if part_plan else None
         if fixed_width is not None:
             normalized = part.strip()
             if not normalized.isdigit() or len(normalized) != fixed_width:
@@ -416,7 +509,7 @@ def _expand_parsed(
         if domain_value is None:
             payload[key] = None
             continue
-        if is_eqd and idx == 3:
+        if plan.is_eqd and idx == 3:
             param_code = domain_value
             if param_code != "" and not _is_valid_eqd_parameter_code(prefix, param_code):
                 payload[key] = None
@@ -441,11 +534,11 @@ def _expand_parsed(
     
     # Add QC signals for numeric parts in multi-part fields
     for idx, (part, value) in enumerate(zip(parsed.parts, parsed.values), start=1):
-        part_rule = field_rule.parts.get(idx) if field_rule else None
-        if part_rule is None or part_rule.kind != "numeric":
+        part_plan = plan.parts.get(idx)
+        if part_plan is None or part_plan.rule.kind != "numeric":
             continue
-        entry = get_field_registry_entry(prefix, idx, suffix="part")
-        key = entry.internal_name if entry else f"{prefix}__part{idx}"
+        part_rule = part_plan.rule
+        key = part_plan.key
         if key not in payload:
             continue
         
@@ -453,9 +546,8 @@ def _expand_parsed(
         is_sentinel = _is_missing_value(part, part_rule)
         
         # Check quality for this part
-        part_quality = _quality_for_part(prefix, idx, parsed.parts) if allow_quality else None
-        allowed_for_part = _allowed_quality_for_value(prefix, idx)
-        bad_quality = part_quality is not None and part_quality not in allowed_for_part
+        part_quality = _plan_quality_for_part(plan, idx, parsed.parts) if allow_quality else None
+        bad_quality = part_quality is not None and part_quality not in part_plan.allowed_quality
         
         # Check range (value is pre-scale)
         out_of_range = False
@@ -477,22 +569,10 @@ def _expand_parsed(
         payload[f"{key}__qc_reason"] = qc_reason
     
     if allow_quality and quality_value is not None:
-        payload[f"{prefix}__quality"] = quality_value
+        payload[plan.quality_key] = quality_value
     return payload
 
 
-def _is_value_quality_field(prefix: str, part_count: int) -> bool:
-    if part_count != 2:
-        return False
-    rule = get_field_rule(prefix)
-    if rule is None:
-        return False
-    part_rule = rule.parts.get(1)
-    if part_rule is None or part_rule.quality_part is None:
-        return False
-    return len(rule.parts) == 1
-
-
 def _compute_qc_signals(
     is_sentinel: bool, bad_quality: bool, out_of_range: bool, malformed_token: bool
 ) -> tuple[bool, str, str | None]:
@@ -538,7 +618,12 @@ def _compute_qc_signals(
     return True, "PASS", None
 
 
-def clean_value_quality(raw: str, prefix: str, strict_mode: bool = True) -> dict[str, object]:
+def clean_value_quality(
+    raw: str,
+    prefix: str,
+    strict_mode: bool = True,
+    report: ParseReport | None = None,
+) -> dict[str, object]:
     """Parse and validate a comma-encoded 2-part NOAA value/quality field.
 
     Applies range validation (pre-scale), quality code checking, and sentinel detection
@@ -563,6 +648,8 @@ def clean_value_quality(raw: str, prefix: str, strict_mode: bool = True) -> dict
         prefix: Field identifier used to look up FieldPartRule (e.g., "OC1", "MA1")
         strict_mode: If True, enforce validation rules (A2-A4) with [PARSE_STRICT] logging.
                      If False, use permissive parsing (legacy mode).
+        report: Optional ParseReport that counts strict-mode rejections instead
+                of logging each one.
 
     Returns:
         Dict with keys like {PREFIX}__value, {PREFIX}__quality, {PREFIX}__qc_*
@@ -574,81 +661,46 @@ def clean_value_quality(raw: str, prefix: str, strict_mode: bool = True) -> dict
         >>> clean_value_quality("1101,1", "OC1")  # 1101 > max 1100
         {'OC1__value': None, 'OC1__qc_pass': False, 'OC1__qc_reason': 'OUT_OF_RANGE', ...}
     """
-    field_rule = get_field_rule(prefix)
-    if strict_mode:
-        section_identifier_valid = is_valid_section_identifier_token(prefix)
-        if section_identifier_valid is False:
-            logger.warning(
-                f"[PARSE_STRICT] Rejected {prefix}: malformed section identifier token (expected 3 upper-case alphanumeric chars)"
-            )
-            return {}
-    if field_rule is None:
-        eqd_valid = is_valid_eqd_identifier(prefix)
-        if eqd_valid is False:
-            if strict_mode:
-                logger.warning(f"[PARSE_STRICT] Rejected {prefix}: invalid EQD identifier format")
-            return {}
-        repeated_valid = is_valid_repeated_identifier(prefix)
-        if repeated_valid is False:
-            if strict_mode:
-                logger.warning(f"[PARSE_STRICT] Rejected {prefix}: invalid repeated identifier format")
-            return {}
+    plan = get_parser_plan(prefix)
+    if not _identifier_accepted(plan, strict_mode, report, examples=[raw]):
+        return {}
     parsed = parse_field(raw)
+    is_value_quality = plan.value_quality and len(parsed.parts) == 2
     
     # A3: Strict mode arity validation - check expected vs actual part count
     # Skip validation for value/quality fields (they have special 2-part handling)
-    if strict_mode and not _is_value_quality_field(prefix, len(parsed.parts)):
-        expected_parts = get_expected_part_count(prefix)
+    if strict_mode and not is_value_quality:
+        expected_parts = plan.expected_part_count
         if expected_parts is not None and len(parsed.parts) != expected_parts:
-            if len(parsed.parts) < expected_parts:
-                logger.warning(
-                    f"[PARSE_STRICT] Rejected {prefix}: truncated payload - "
-                    f"expected {expected_parts} parts, got {len(parsed.parts)}"
-                )
-            else:
-                logger.warning(
-                    f"[PARSE_STRICT] Rejected {prefix}: extra payload - "
-                    f"expected {expected_parts} parts, got {len(parsed.parts)}"
-                )
+            _reject_arity(report, prefix, expected_parts, len(parsed.parts), examples=[raw])
             return {}
     
-    if len(parsed.parts) != 2:
-        return _expand_parsed(parsed, prefix, allow_quality=True, strict_mode=strict_mode)
-    if not _is_value_quality_field(prefix, len(parsed.parts)):
-        return _expand_parsed(parsed, prefix, allow_quality=True, strict_mode=strict_mode)
-    part_rule = field_rule.parts.get(1) if field_rule else None
-    entry = get_field_registry_entry(prefix, 1, suffix="value")
-    value_key = entry.internal_name if entry else f"{prefix}__value"
+    if not is_value_quality:
+        return _expand_parsed(
+            parsed, prefix, allow_quality=True, strict_mode=strict_mode, report=report
+        )
+    part_plan = plan.parts[1]
+    part_rule = part_plan.rule
+    value_key = plan.value_key
     quality = parsed.quality
-    quality_index = part_rule.quality_part if part_rule else None
-    if quality_index is not None and quality_index <= len(parsed.parts):
+    quality_index = part_rule.quality_part
+    if quality_index <= len(parsed.parts):
         quality = parsed.parts[quality_index - 1].strip() or None
-    allowed_quality = (
-        _allowed_quality_set(prefix, quality_index)
-        if quality_index is not None
-        else QUALITY_FLAGS
-    )
-    if (
-        quality_index is not None
-        and allowed_quality == QUALITY_FLAGS
-        and part_rule
-        and part_rule.allowed_quality
-    ):
-        allowed_quality = part_rule.allowed_quality
+    allowed_quality = plan.value_allowed_quality
     
     # A4: Token width validation for value/quality fields
     if strict_mode:
-        width_rules = get_token_width_rules(prefix, 1)
-        if width_rules:
+        if part_plan.token_width is not None or part_plan.token_pattern is not None:
             part_stripped = parsed.parts[0].strip()
             # Check token width (handling signed values)
-            if 'width' in width_rules:
-                expected_width = width_rules['width']
+            if part_plan.token_width is not None:
+                expected_width = part_plan.token_width
                 raw_part = parsed.raw_parts[0] if parsed.raw_parts else parsed.parts[0]
                 if raw_part != raw_part.strip():
-                    logger.warning(
-                        f"[PARSE_STRICT] Rejected {prefix} part 1: "
-                        "token contains leading/trailing whitespace"
+                    _reject(
+                        report, prefix, 1, "whitespace_padding",
+                        "token contains leading/trailing whitespace",
+                        examples=[raw],
                     )
                     qc_pass, qc_status, qc_reason = _compute_qc_signals(
                         is_sentinel=False,
@@ -665,9 +717,10 @@ def clean_value_quality(raw: str, prefix: str, strict_mode: bool = True) -> dict
                     }
                 test_value = part_stripped.lstrip('+-')
                 if len(test_value) != expected_width:
-                    logger.warning(
-                        f"[PARSE_STRICT] Rejected {prefix} part 1: "
-                        f"token width {len(test_value)}, expected {expected_width}"
+                    _reject(
+                        report, prefix, 1, "token_width",
+                        f"token width {len(test_value)}, expected {expected_width}",
+                        examples=[raw],
                     )
                     qc_pass, qc_status, qc_reason = _compute_qc_signals(
                         is_sentinel=False,
@@ -683,12 +736,12 @@ def clean_value_quality(raw: str, prefix: str, strict_mode: bool = True) -> dict
                         f"{prefix}__qc_reason": qc_reason,
                     }
             # Check token pattern
-            if 'pattern' in width_rules:
-                pattern = width_rules['pattern']
-                if not pattern.fullmatch(part_stripped):
-                    logger.warning(
-                        f"[PARSE_STRICT] Rejected {prefix} part 1: "
-                        f"token format mismatch (pattern validation failed)"
+            if part_plan.token_pattern is not None:
+                if not part_plan.token_pattern.fullmatch(part_stripped):
+                    _reject(
+                        report, prefix, 1, "token_pattern",
+                        "token format mismatch (pattern validation failed)",
+                        examples=[raw],
                     )
                     qc_pass, qc_status, qc_reason = _compute_qc_signals(
                         is_sentinel=False,
@@ -754,6 +807,812 @@ def clean_value_quality(raw: str, prefix: str, strict_mode: bool = True) -> dict
     }
 
 
+# ── Column-wise parsing engine ───────────────────────────────────────────
+#
+# The vectorized engine below applies the same rules as clean_value_quality /
+# _expand_parsed to a whole identifier column at once. Rows are grouped by
+# comma-part count (which decides the value/quality vs multi-part path and the
+# strict arity gate), and every sentinel, width, quality, domain, range and
+# scale rule is evaluated as a Series/ndarray operation. The per-cell functions
+# remain the reference implementation; _expand_column_reference runs them row
+# by row and the test suite checks both engines produce identical frames.
+# The memoized engine factorizes the column and parses each distinct raw token
+# once through an LRU cache shared across columns and stations.
+
+ParseEngine = Literal["vectorized", "reference", "memoized"]
+
+_SIMPLE_NUMBER_PATTERN = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)")
+_ALL_NINES_PATTERN = re.compile(r"9{2,}")
+
+
+def _vector_is_missing(parts: pd.Series, rule: FieldPartRule | None) -> np.ndarray:
+    """Vectorized _is_missing_value over stripped part tokens."""
+    stripped = parts.str.replace(".", "", regex=False).str.replace("+", "", regex=False)
+    if rule and rule.missing_values is not None:
+        negative = stripped.str.startswith("-")
+        body = stripped.where(~negative, stripped.str.slice(1)).str.lstrip("0")
+        body = body.where(body.ne(""), "0")
+        normalized = body.where(~negative, "-" + body)
+        return normalized.isin(rule.missing_values).to_numpy(dtype=bool)
+    return stripped.str.fullmatch(_ALL_NINES_PATTERN).to_numpy(dtype=bool)
+
+
+def _vector_to_float(parts: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized _to_float returning (values, is_numeric).
+
+    Plain signed decimal tokens are converted in one numpy cast; anything else
+    that is non-empty (exponents, underscores, ``nan``) falls back to _to_float
+    so Python float() semantics are preserved exactly.
+    """
+    values = np.full(len(parts), np.nan)
+    numeric = np.zeros(len(parts), dtype=bool)
+    body = parts.where(~parts.str.startswith("+"), parts.str.slice(1))
+    simple = body.str.fullmatch(_SIMPLE_NUMBER_PATTERN).to_numpy(dtype=bool)
+    if simple.any():
+        values[simple] = body[simple].astype("float64").to_numpy()
+        numeric[simple] = True
+    other = ~simple & parts.ne("").to_numpy(dtype=bool)
+    if other.any():
+        for position, token in zip(np.flatnonzero(other), parts.array[other]):
+            converted = _to_float(token)
+            if converted is not None:
+                values[position] = converted
+                numeric[position] = True
+    return values, numeric
+
+
+def _vector_fullmatch(parts: pd.Series, pattern: re.Pattern[str] | str) -> np.ndarray:
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern)
+    return parts.str.fullmatch(pattern).to_numpy(dtype=bool)
+
+
+def _vector_domain_ok(parts: pd.Series, part_rule: FieldPartRule | None) -> np.ndarray:
+    """Vectorized enforce_domain: True where the token passes the domain rule."""
+    ok = np.ones(len(parts), dtype=bool)
+    if part_rule is None:
+        return ok
+    if part_rule.allowed_values:
+        ok &= parts.str.upper().isin(part_rule.allowed_values).to_numpy(dtype=bool)
+    if part_rule.allowed_pattern:
+        ok &= _vector_fullmatch(parts, part_rule.allowed_pattern)
+    return ok
+
+
+def _vector_valid_eqd_parameter_code(prefix: str, parts: pd.Series) -> np.ndarray:
+    if prefix.startswith("N"):
+        return (
+            parts.str.len().eq(6)
+            & parts.str.slice(0, 4).isin(EQD_ELEMENT_NAMES)
+            & parts.str.slice(4, 5).isin(EQD_FLAG1_CODES)
+            & parts.str.slice(5, 6).isin(EQD_FLAG2_CODES)
+        ).to_numpy(dtype=bool)
+    normalized = parts.str.strip().str.upper()
+    valid = normalized.isin(LEGACY_EQD_PARAMETER_CODES).to_numpy(dtype=bool)
+    if prefix.startswith("R"):
+        valid = valid | _vector_fullmatch(normalized, LEGACY_EQD_MSD_PATTERN)
+    return valid
+
+
+# qc_status/qc_reason are categoricals over QC_STATUS_VALUES and
+# QC_REASON_ENUM. The vectorized engine writes int8 codes into these
+# categories; code -1 marks a None reason or a row the identifier did not
+# produce.
+_QC_STATUS_DTYPE = pd.CategoricalDtype(sorted(QC_STATUS_VALUES))
+_QC_REASON_DTYPE = pd.CategoricalDtype(sorted(reason for reason in QC_REASON_ENUM if reason))
+
+
+def _qc_dtype(column: str) -> pd.CategoricalDtype | None:
+    if column.endswith("__qc_status"):
+        return _QC_STATUS_DTYPE
+    if column.endswith("__qc_reason"):
+        return _QC_REASON_DTYPE
+    return None
+
+
+def _qc_as_categories(frame: pd.DataFrame) -> pd.DataFrame:
+    """Cast ``__qc_status``/``__qc_reason`` columns of ``frame`` to their categoricals."""
+    updates = {}
+    for column in frame.columns:
+        dtype = _qc_dtype(column)
+        if dtype is not None and frame[column].dtype != dtype:
+            updates[column] = frame[column].astype(dtype)
+    return frame.assign(**updates) if updates else frame
+
+
+def _vector_qc_signals(
+    is_sentinel: np.ndarray,
+    bad_quality: np.ndarray,
+    out_of_range: np.ndarray,
+    malformed_token: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized _compute_qc_signals with the same priority order.
+
+    Returns a bool qc_pass array and int8 codes into the categories of
+    _QC_STATUS_DTYPE and _QC_REASON_DTYPE.
+    """
+    conditions = [malformed_token, bad_quality, is_sentinel, out_of_range]
+    qc_pass = ~(malformed_token | bad_quality | is_sentinel | out_of_range)
+    status = _QC_STATUS_DTYPE.categories.get_loc
+    reason = _QC_REASON_DTYPE.categories.get_loc
+    invalid = status("INVALID")
+    qc_status = np.select(
+        conditions, [invalid, invalid, status("MISSING"), invalid], status("PASS")
+    ).astype(np.int8)
+    qc_reason = np.select(
+        conditions,
+        [
+            reason("MALFORMED_TOKEN"),
+            reason("BAD_QUALITY_CODE"),
+            reason("SENTINEL_MISSING"),
+            reason("OUT_OF_RANGE"),
+        ],
+        -1,
+    ).astype(np.int8)
+    return qc_pass, qc_status, qc_reason
+
+
+def _reject_widths(
+    report: ParseReport | None,
+    prefix: str,
+    idx: int,
+    widths: np.ndarray,
+    expected_width: int,
+    raw_values: pd.api.extensions.ExtensionArray,
+) -> None:
+    distinct, counts = np.unique(widths, return_counts=True)
+    for width, count in zip(distinct.tolist(), counts.tolist()):
+        _reject(
+            report, prefix, idx, "token_width",
+            f"token width {width}, expected {expected_width}",
+            count=count, examples=raw_values[widths == width],
+        )
+
+
+class _PartResolver:
+    """First-match-wins assignment of one output part across a row group.
+
+    Numeric results go to a float64 buffer; an object buffer is only
+    allocated once a text value (raw token or calm code) is settled.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.floats = np.full(size, np.nan)
+        self.has_float = False
+        self.texts: np.ndarray | None = None
+        self.decided = np.zeros(size, dtype=bool)
+
+    def settle(self, mask: np.ndarray, value: object) -> np.ndarray:
+        pending = mask & ~self.decided
+        if pending.any():
+            if isinstance(value, np.ndarray) and value.dtype.kind == "f":
+                self.floats[pending] = value[pending]
+                self.has_float = True
+            elif isinstance(value, float):
+                self.floats[pending] = value
+                self.has_float = True
+            elif value is not None:
+                if self.texts is None:
+                    self.texts = np.full(len(self.decided), None, dtype=object)
+                if isinstance(value, (np.ndarray, pd.api.extensions.ExtensionArray)):
+                    value = np.asarray(value[pending], dtype=object)
+                self.texts[pending] = value
+            self.decided |= pending
+        return pending
+
+    @property
+    def values(self) -> np.ndarray:
+        if self.texts is None:
+            return self.floats if self.has_float else np.full(len(self.decided), None, dtype=object)
+        values = self.texts.copy()
+        if self.has_float:
+            is_float = ~np.isnan(self.floats)
+            values[is_float] = self.floats[is_float].tolist()
+        return values
+
+
+def _floats_as_objects(values: np.ndarray) -> np.ndarray:
+    """Box a float chunk for an object column; NaN marks a None payload value."""
+    boxed = values.astype(object)
+    boxed[np.isnan(values)] = None
+    return boxed
+
+
+class _ColumnBuffers:
+    """Typed output columns for one identifier, preallocated to the input length.
+
+    Chunks from each part-count group are written by row position: float64
+    chunks into NaN-filled float buffers, bool chunks (qc_pass) into bool
+    buffers, int8 chunks (qc_status/qc_reason) as category codes, anything
+    else into object buffers. ``frame`` assembles the columns with the same
+    dtypes the per-cell engines produce; the category codes become
+    categoricals directly, without boxing a string per row.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.columns: dict[str, np.ndarray] = {}
+        self.written: dict[str, np.ndarray] = {}
+
+    def write(self, key: str, rows: np.ndarray, chunk: np.ndarray) -> None:
+        target = self.columns.get(key)
+        if target is None:
+            if chunk.dtype.kind == "f":
+                target = np.full(self.size, np.nan)
+            elif chunk.dtype.kind == "b":
+                target = np.zeros(self.size, dtype=bool)
+            elif chunk.dtype.kind == "i":
+                target = np.full(self.size, -1, dtype=np.int8)
+            else:
+                target = np.full(self.size, np.nan, dtype=object)
+            self.columns[key] = target
+            self.written[key] = np.zeros(self.size, dtype=bool)
+        elif target.dtype.kind == "f" and chunk.dtype == object:
+            if pd.notna(chunk).any():
+                target = self._as_object(key)
+            else:
+                chunk = np.full(len(chunk), np.nan)
+        elif target.dtype == object and chunk.dtype.kind == "f":
+            chunk = _floats_as_objects(chunk)
+        target[rows] = chunk
+        self.written[key][rows] = True
+
+    def _as_object(self, key: str) -> np.ndarray:
+        column = _floats_as_objects(self.columns[key])
+        column[~self.written[key]] = np.nan
+        self.columns[key] = column
+        return column
+
+    def _materialize(self, key: str) -> np.ndarray | pd.Categorical:
+        column = self.columns[key]
+        if column.dtype.kind == "b":
+            if self.written[key].all():
+                return column
+            values = column.astype(object)
+            values[~self.written[key]] = np.nan
+            return values
+        if column.dtype.kind == "i":
+            return pd.Categorical.from_codes(column, dtype=_qc_dtype(key), validate=False)
+        return column
+
+    def frame(self, keys: list[str], index: pd.Index) -> pd.DataFrame:
+        frame = pd.DataFrame(
+            {key: self._materialize(key) for key in keys}, index=index, copy=False
+        )
+        return frame.infer_objects()
+
+
+def _expand_group_vectorized(
+    raw_parts: list[pd.Series],
+    plan: ParserPlan,
+    strict_mode: bool,
+    raw_values: pd.api.extensions.ExtensionArray,
+    report: ParseReport | None = None,
+) -> tuple[dict[str, np.ndarray], np.ndarray]:
+    """Vectorized _expand_parsed for rows sharing the same part count.
+
+    Returns the payload columns and a mask of rows that carry a
+    ``{PREFIX}__quality`` entry (the only row-dependent key).
+    """
+    prefix = plan.identifier
+    part_count = len(raw_parts)
+    size = len(raw_parts[0])
+    parts = [raw.str.strip() for raw in raw_parts]
+    no_rows = np.zeros(size, dtype=bool)
+
+    def _matches(special: SpecialCaseRule | None) -> np.ndarray:
+        if special is None or part_count < max(index for index, _ in special.conditions):
+            return no_rows
+        matched = np.ones(size, dtype=bool)
+        for index, token in special.conditions:
+            matched = matched & parts[index - 1].str.upper().eq(token).to_numpy(dtype=bool)
+        return matched
+
+    payload: dict[str, np.ndarray] = {}
+    is_variable_direction = _matches(plan.variable_direction)
+    if plan.variable_direction is not None:
+        payload[f"{prefix}__direction_variable"] = is_variable_direction
+    calm_masks = [(special, _matches(special)) for special in plan.calm]
+
+    quality_values: pd.Series | None = None
+    quality_present = no_rows
+    if plan.quality_part is not None and plan.quality_part <= part_count:
+        quality_values = parts[plan.quality_part - 1]
+        quality_present = quality_values.ne("").to_numpy(dtype=bool)
+    invalid_quality = no_rows
+    if quality_values is not None:
+        invalid_quality = quality_present & ~quality_values.isin(plan.allowed_quality).to_numpy(dtype=bool)
+
+    sentinel_by_part: dict[int, np.ndarray] = {}
+    bad_quality_by_part: dict[int, np.ndarray] = {}
+    malformed_by_part: dict[int, np.ndarray] = {}
+    floats_by_part: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+
+    for idx in range(1, part_count + 1):
+        key = plan.part_key(idx)
+        part = parts[idx - 1]
+        raw_part = raw_parts[idx - 1]
+        part_plan = plan.parts.get(idx)
+        part_rule = part_plan.rule if part_plan else None
+        resolver = _PartResolver(size)
+        if plan.variable_direction is not None and idx == plan.variable_direction.target_part:
+            resolver.settle(is_variable_direction, plan.variable_direction.value)
+        for special, matched in calm_masks:
+            if idx == special.target_part:
+                resolver.settle(matched, special.value)
+
+        quality_index = part_plan.quality_part if part_plan else None
+        has_part_quality = quality_index is not None and quality_index <= part_count
+        bad_quality = no_rows
+        if has_part_quality:
+            bad_quality = ~parts[quality_index - 1].isin(part_plan.allowed_quality).to_numpy(dtype=bool)
+            resolver.settle(bad_quality, None)
+        elif idx == 1:
+            resolver.settle(invalid_quality, None)
+        bad_quality_by_part[idx] = bad_quality
+
+        is_sentinel = _vector_is_missing(part, part_rule)
+        sentinel_by_part[idx] = is_sentinel
+        resolver.settle(is_sentinel, None)
+
+        malformed = no_rows
+        if strict_mode and part_plan is not None:
+            if part_plan.token_width is not None:
+                expected_width = part_plan.token_width
+                if part_rule.kind == "numeric":
+                    padded = raw_part.ne(raw_part.str.strip()).to_numpy(dtype=bool)
+                    rejected = resolver.settle(padded, None)
+                    if rejected.any():
+                        _reject(
+                            report, prefix, idx, "whitespace_padding",
+                            "token contains leading/trailing whitespace",
+                            count=int(rejected.sum()), examples=raw_values[rejected],
+                        )
+                    malformed = malformed | rejected
+                    widths = part.str.lstrip("+-").str.len().to_numpy()
+                else:
+                    widths = raw_part.str.len().to_numpy()
+                rejected = resolver.settle(widths != expected_width, None)
+                if rejected.any():
+                    _reject_widths(
+                        report, prefix, idx, widths[rejected], expected_width, raw_values[rejected]
+                    )
+                malformed = malformed | rejected
+            if part_plan.token_pattern is not None:
+                mismatch = ~_vector_fullmatch(part, part_plan.token_pattern)
+                rejected = resolver.settle(mismatch, None)
+                if rejected.any():
+                    _reject(
+                        report, prefix, idx, "token_pattern",
+                        "token format mismatch (pattern validation failed)",
+                        count=int(rejected.sum()), examples=raw_values[rejected],
+                    )
+                malformed = malformed | rejected
+        malformed_by_part[idx] = malformed
+
+        if part_rule and part_rule.kind == "quality" and part_rule.allowed_quality:
+            resolver.settle(
+                ~part.str.upper().isin(part_rule.allowed_quality).to_numpy(dtype=bool),
+                None,
+            )
+        if part_plan is not None and part_plan.fixed_width is not None:
+            resolver.settle(
+                ~(part.str.isdigit() & part.str.len().eq(part_plan.fixed_width)).to_numpy(dtype=bool),
+                None,
+            )
+        resolver.settle(~_vector_domain_ok(part, part_rule), None)
+        if plan.is_eqd and idx == 3:
+            resolver.settle(
+                part.ne("").to_numpy(dtype=bool) & ~_vector_valid_eqd_parameter_code(prefix, part),
+                None,
+            )
+        values, is_numeric = _vector_to_float(part)
+        floats_by_part[idx] = (values, is_numeric)
+        resolver.settle(~is_numeric, part.array)
+        if part_rule:
+            with np.errstate(invalid="ignore"):
+                if part_rule.min_value is not None:
+                    resolver.settle(values < part_rule.min_value, None)
+                if part_rule.max_value is not None:
+                    resolver.settle(values > part_rule.max_value, None)
+        scale = part_rule.scale if part_rule else None
+        scaled = values * scale if scale is not None else values
+        if prefix == "CIG" and idx == 1:
+            scaled = np.where(scaled > 22000, 22000.0, scaled)
+        if prefix == "VIS" and idx == 1:
+            scaled = np.where(scaled > 160000, 160000.0, scaled)
+        resolver.settle(np.ones(size, dtype=bool), scaled)
+        payload[key] = resolver.values
+
+    for idx in range(1, part_count + 1):
+        part_plan = plan.parts.get(idx)
+        if part_plan is None or part_plan.rule.kind != "numeric":
+            continue
+        part_rule = part_plan.rule
+        key = part_plan.key
+        values, is_numeric = floats_by_part[idx]
+        out_of_range = np.zeros(size, dtype=bool)
+        with np.errstate(invalid="ignore"):
+            if part_rule.min_value is not None:
+                out_of_range |= is_numeric & (values < part_rule.min_value)
+            if part_rule.max_value is not None:
+                out_of_range |= is_numeric & (values > part_rule.max_value)
+        qc_pass, qc_status, qc_reason = _vector_qc_signals(
+            is_sentinel=sentinel_by_part[idx],
+            bad_quality=bad_quality_by_part[idx],
+            out_of_range=out_of_range,
+            malformed_token=malformed_by_part[idx],
+        )
+        payload[f"{key}__qc_pass"] = qc_pass
+        payload[f"{key}__qc_status"] = qc_status
+        payload[f"{key}__qc_reason"] = qc_reason
+
+    if quality_values is not None:
+        payload[plan.quality_key] = quality_values.to_numpy(dtype=object)
+    return payload, quality_present
+
+
+def _value_quality_group_vectorized(
+    raw_parts: list[pd.Series],
+    plan: ParserPlan,
+    strict_mode: bool,
+    raw_values: pd.api.extensions.ExtensionArray,
+    report: ParseReport | None = None,
+) -> dict[str, np.ndarray]:
+    """Vectorized value/quality branch of clean_value_quality (2-part rows)."""
+    prefix = plan.identifier
+    size = len(raw_parts[0])
+    parts = [raw.str.strip() for raw in raw_parts]
+    no_rows = np.zeros(size, dtype=bool)
+    part_plan = plan.parts[1]
+    part_rule = part_plan.rule
+
+    quality_index = part_rule.quality_part
+    if quality_index <= len(parts):
+        quality_series = parts[quality_index - 1]
+        quality_series = quality_series.where(quality_series.ne(""), None)
+    else:
+        quality_series = parts[-1].where(parts[-1].str.len().eq(1), None)
+    quality = quality_series.to_numpy(dtype=object)
+    quality_present = quality_series.notna().to_numpy(dtype=bool)
+    allowed_quality = plan.value_allowed_quality
+
+    part = parts[0]
+    malformed = no_rows
+    if strict_mode:
+        if part_plan.token_width is not None:
+            expected_width = part_plan.token_width
+            raw_part = raw_parts[0]
+            padded = raw_part.ne(raw_part.str.strip()).to_numpy(dtype=bool)
+            if padded.any():
+                _reject(
+                    report, prefix, 1, "whitespace_padding",
+                    "token contains leading/trailing whitespace",
+                    count=int(padded.sum()), examples=raw_values[padded],
+                )
+            widths = part.str.lstrip("+-").str.len().to_numpy()
+            wrong_width = ~padded & (widths != expected_width)
+            if wrong_width.any():
+                _reject_widths(
+                    report, prefix, 1, widths[wrong_width], expected_width, raw_values[wrong_width]
+                )
+            malformed = padded | wrong_width
+        if part_plan.token_pattern is not None:
+            mismatch = ~malformed & ~_vector_fullmatch(part, part_plan.token_pattern)
+            if mismatch.any():
+                _reject(
+                    report, prefix, 1, "token_pattern",
+                    "token format mismatch (pattern validation failed)",
+                    count=int(mismatch.sum()), examples=raw_values[mismatch],
+                )
+            malformed = malformed | mismatch
+
+    is_sentinel = _vector_is_missing(part, part_rule)
+    values, is_numeric = _vector_to_float(part)
+    has_value = ~malformed & ~is_sentinel & _vector_domain_ok(part, part_rule) & is_numeric
+    bad_quality = quality_present & ~pd.Series(quality).isin(allowed_quality).to_numpy(dtype=bool)
+    has_value &= ~bad_quality
+    out_of_range = no_rows
+    if part_rule.kind == "numeric":
+        out_of_range = np.zeros(size, dtype=bool)
+        with np.errstate(invalid="ignore"):
+            if part_rule.min_value is not None:
+                out_of_range |= has_value & (values < part_rule.min_value)
+            if part_rule.max_value is not None:
+                out_of_range |= has_value & (values > part_rule.max_value)
+        has_value &= ~out_of_range
+    if part_rule.scale is not None:
+        values = values * part_rule.scale
+    if has_value.any():
+        value = np.where(has_value, values, np.nan)
+    else:
+        value = np.full(size, None, dtype=object)
+
+    qc_pass, qc_status, qc_reason = _vector_qc_signals(
+        is_sentinel=is_sentinel & ~malformed,
+        bad_quality=bad_quality & ~malformed,
+        out_of_range=out_of_range,
+        malformed_token=malformed,
+    )
+    return {
+        plan.value_key: value,
+        plan.quality_key: quality,
+        f"{prefix}__qc_pass": qc_pass,
+        f"{prefix}__qc_status": qc_status,
+        f"{prefix}__qc_reason": qc_reason,
+    }
+
+
+def _expand_column_reference(
+    series: pd.Series,
+    prefix: str,
+    strict_mode: bool = True,
+    rejected_mask: pd.Series | None = None,
+    report: ParseReport | None = None,
+) -> pd.DataFrame:
+    """Per-cell reference engine: run clean_value_quality on every row."""
+    rejected = (
+        rejected_mask.to_numpy(dtype=bool)
+        if rejected_mask is not None
+        else np.zeros(len(series), dtype=bool)
+    )
+    parsed_rows = []
+    for is_rejected, value in zip(rejected, series.fillna("").astype(str)):
+        if is_rejected or value == "":
+            parsed_rows.append({})
+            continue
+        parsed_rows.append(
+            clean_value_quality(value, prefix, strict_mode=strict_mode, report=report)
+        )
+    return _qc_as_categories(pd.DataFrame(parsed_rows, index=series.index))
+
+
+def _expand_column_vectorized(
+    series: pd.Series,
+    prefix: str,
+    strict_mode: bool = True,
+    rejected_mask: pd.Series | None = None,
+    report: ParseReport | None = None,
+) -> pd.DataFrame:
+    """Column-wise engine producing the same frame as _expand_column_reference.
+
+    Values stay Arrow-backed strings, so the ``.str`` operations below run as
+    pyarrow.compute kernels and Python ``str`` objects are only created for
+    output text and sampled rejection examples.
+    """
+    text = series.fillna("").astype(str)
+    active = text.ne("").to_numpy(dtype=bool)
+    if rejected_mask is not None:
+        active = active & ~rejected_mask.to_numpy(dtype=bool)
+    plan = get_parser_plan(prefix)
+    if not active.any():
+        return pd.DataFrame(index=series.index, columns=pd.Index([], dtype=object))
+    values = text[active].reset_index(drop=True)
+    raw_values = values.array
+    if not _identifier_accepted(
+        plan, strict_mode, report, count=len(raw_values), examples=raw_values
+    ):
+        return pd.DataFrame(index=series.index, columns=pd.Index([], dtype=object))
+
+    row_positions = np.flatnonzero(active)
+    split = values.str.split(",", expand=True)
+    part_counts = values.str.count(",").to_numpy() + 1
+
+    buffers = _ColumnBuffers(len(series))
+    key_orders: list[tuple[int, list[str]]] = []
+
+    def _store(payload: dict[str, np.ndarray], positions: np.ndarray, present: np.ndarray | None = None) -> None:
+        for key, column in payload.items():
+            if present is not None and key == plan.quality_key:
+                buffers.write(key, row_positions[positions[present]], column[present])
+            else:
+                buffers.write(key, row_positions[positions], column)
+
+    for part_count in pd.unique(part_counts):
+        positions = np.flatnonzero(part_counts == part_count)
+        is_value_quality = plan.value_quality and part_count == 2
+        if strict_mode and not is_value_quality:
+            expected_parts = plan.expected_part_count
+            if expected_parts is not None and part_count != expected_parts:
+                _reject_arity(
+                    report, prefix, expected_parts, int(part_count),
+                    count=len(positions), examples=raw_values[positions],
+                )
+                continue
+        raw_parts = [
+            split.iloc[positions, column].reset_index(drop=True)
+            for column in range(int(part_count))
+        ]
+        if is_value_quality:
+            payload = _value_quality_group_vectorized(
+                raw_parts, plan, strict_mode, raw_values[positions], report
+            )
+            key_orders.append((int(positions[0]), list(payload)))
+            _store(payload, positions)
+            continue
+        payload, quality_present = _expand_group_vectorized(
+            raw_parts, plan, strict_mode, raw_values[positions], report
+        )
+        base_keys = [key for key in payload if key != plan.quality_key]
+        if (~quality_present).any():
+            key_orders.append((int(positions[np.argmin(quality_present)]), base_keys))
+        if quality_present.any():
+            key_orders.append((int(positions[np.argmax(quality_present)]), list(payload)))
+        _store(payload, positions, quality_present)
+
+    ordered_keys: list[str] = []
+    for _, keys in sorted(key_orders, key=lambda item: item[0]):
+        ordered_keys.extend(key for key in keys if key not in ordered_keys)
+    return buffers.frame(ordered_keys, series.index)
+
+
+@dataclass(frozen=True)
+class ParseCacheStats:
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ParseCache:
+    """LRU cache of clean_value_quality payloads keyed by (prefix, strict_mode, raw).
+
+    Each entry also keeps the strict-mode rejections its parse produced so the
+    memoized engine can replay them for every occurrence of the token.
+    Payloads are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, maxsize: int = 250_000) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[
+            tuple[str, bool, str], tuple[dict[str, object], ParseReport]
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_payload(self, raw: str, prefix: str, strict_mode: bool) -> dict[str, object]:
+        return self.get_entry(raw, prefix, strict_mode)[0]
+
+    def get_entry(
+        self, raw: str, prefix: str, strict_mode: bool
+    ) -> tuple[dict[str, object], ParseReport]:
+        """Return the cached payload and the rejections recorded while parsing it."""
+        key = (prefix, strict_mode, raw)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+        self.misses += 1
+        rejections = ParseReport()
+        payload = clean_value_quality(raw, prefix, strict_mode=strict_mode, report=rejections)
+        entry = (payload, rejections)
+        self._entries[key] = entry
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return entry
+
+    def stats(self) -> ParseCacheStats:
+        return ParseCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            size=len(self._entries),
+            maxsize=self.maxsize,
+        )
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Process-wide cache used by the memoized engine; batch jobs cleaning many
+# stations in one process reuse parses of common tokens such as "+9999,9".
+PARSE_CACHE = ParseCache()
+
+
+def _expand_column_memoized(
+    series: pd.Series,
+    prefix: str,
+    strict_mode: bool = True,
+    rejected_mask: pd.Series | None = None,
+    cache: ParseCache | None = None,
+    report: ParseReport | None = None,
+) -> pd.DataFrame:
+    """Parse each distinct raw token once and broadcast payloads back by code.
+
+    Rejections recorded for a token are replayed into ``report`` once per
+    occurrence, so counts match the per-cell engines.
+    """
+    cache = PARSE_CACHE if cache is None else cache
+    text = series.fillna("").astype(str)
+    active = text.ne("").to_numpy(dtype=bool)
+    if rejected_mask is not None:
+        active = active & ~rejected_mask.to_numpy(dtype=bool)
+    codes, uniques = pd.factorize(text[active])
+    entries = [cache.get_entry(raw, prefix, strict_mode) for raw in uniques]
+    payloads = [payload for payload, _ in entries]
+    frequencies = np.bincount(codes, minlength=len(uniques))
+    for raw, (_, rejections), frequency in zip(uniques, entries, frequencies.tolist()):
+        for key, details in rejections.details.items():
+            for detail, count in details.items():
+                _reject(report, *key, detail, count=count * frequency, examples=(raw,))
+
+    ordered_keys: list[str] = []
+    for payload in payloads:
+        ordered_keys.extend(key for key in payload if key not in ordered_keys)
+    row_positions = np.flatnonzero(active)
+    columns: dict[str, np.ndarray] = {}
+    for key in ordered_keys:
+        unique_values = np.empty(len(payloads), dtype=object)
+        unique_values[:] = [payload.get(key, np.nan) for payload in payloads]
+        column = np.full(len(series), np.nan, dtype=object)
+        column[row_positions] = unique_values[codes]
+        columns[key] = column
+    if not columns:
+        return pd.DataFrame(index=series.index, columns=pd.Index([], dtype=object))
+    return _qc_as_categories(pd.DataFrame(columns, index=series.index).infer_objects())
+
+
+def _expand_column(
+    series: pd.Series,
+    prefix: str,
+    strict_mode: bool = True,
+    rejected_mask: pd.Series | None = None,
+    engine: ParseEngine = "vectorized",
+    report: ParseReport | None = None,
+) -> pd.DataFrame:
+    if engine not in ("reference", "memoized", "vectorized"):
+        raise ValueError(f"Unknown parse engine: {engine}")
+    column_report = ParseReport() if report is None else report
+    if engine == "reference":
+        expanded = _expand_column_reference(series, prefix, strict_mode, rejected_mask, column_report)
+    elif engine == "memoized":
+        expanded = _expand_column_memoized(
+            series, prefix, strict_mode, rejected_mask, report=column_report
+        )
+    else:
+        expanded = _expand_column_vectorized(series, prefix, strict_mode, rejected_mask, column_report)
+    if report is None:
+        column_report.log_summary()
+    return expanded
+
+
+def _expand_column_task(
+    values: np.ndarray,
+    rejected: np.ndarray,
+    prefix: str,
+    strict_mode: bool,
+    engine: ParseEngine,
+    log_examples: int,
+) -> tuple[pd.DataFrame, ParseReport]:
+    """Expand one identifier column; runs in a worker process when workers > 1.
+
+    Only the column's values and the rejected-row mask cross the process
+    boundary; the caller restores the frame index.
+    """
+    report = ParseReport(max_examples=log_examples)
+    expanded = _expand_column(
+        pd.Series(values, dtype=object),
+        prefix,
+        strict_mode=strict_mode,
+        rejected_mask=pd.Series(rejected),
+        engine=engine,
+        report=report,
+    )
+    return expanded, report
+
+
 def _should_parse_column(values: Iterable[str]) -> bool:
     for value in values:
         if isinstance(value, str) and "," in value:
@@ -761,6 +1620,21 @@ def _should_parse_column(values: Iterable[str]) -> bool:
     return False
 
 
+def _has_comma_payload(series: pd.Series) -> bool:
+    """Only text columns whose first non-null values contain commas are expanded."""
+    if not pd.api.types.is_object_dtype(series) and not pd.api.types.is_string_dtype(series):
+        return False
+    sample = series.dropna().astype(str).head(200)
+    return not sample.empty and _should_parse_column(sample)
+
+
+def _add_marker_redundant(series: pd.Series) -> bool:
+    """True when the ADD column holds nothing but the "ADD" section marker."""
+    add_series = series.astype(str).str.strip().str.upper()
+    add_mask = add_series.replace("", pd.NA).dropna().eq("ADD")
+    return add_mask.empty or add_mask.all()
+
+
 def _record_length_mismatch(raw_line: object) -> bool:
     """Validate Part 02 TOTAL-VARIABLE-CHARACTERS against full record length."""
     if raw_line is None or (isinstance(raw_line, float) and pd.isna(raw_line)):
@@ -918,6 +1792,380 @@ def _validate_control_header(raw_line: object) -> str | None:
     return None
 
 
+_CONTROL_HEADER_WIDTH = 60
+_LATITUDE_MISSING = b"+99999"
+_LONGITUDE_MISSING = b"+999999"
+_ELEVATION_MISSING = b"+9999"
+_REPORT_TYPE_BYTES = np.array(
+    sorted(code.encode() for code in REPORT_TYPE_CODES | {"99999"} if len(code) == 5),
+    dtype="S5",
+)
+_QC_PROCESS_BYTES = np.array([b"9999", b"V01 ", b"V02 ", b"V03 "], dtype="S4")
+_SOURCE_FLAG_LOOKUP = np.zeros(256, dtype=bool)
+_SOURCE_FLAG_LOOKUP[[ord(flag) for flag in DATA_SOURCE_FLAGS]] = True
+_MONTH_LENGTHS = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int64)
+
+
+def _byte_matrix(values: pa.Array, width: int) -> np.ndarray:
+    """View a string array whose entries are all ``width`` bytes as an (n, width) uint8 matrix."""
+    if len(values) == 0:
+        return np.zeros((0, width), dtype=np.uint8)
+    offset_type = np.int64 if pa.types.is_large_string(values.type) else np.int32
+    _, offsets_buffer, data_buffer = values.buffers()
+    offsets = np.frombuffer(offsets_buffer, dtype=offset_type)[
+        values.offset : values.offset + len(values) + 1
+    ]
+    data = np.frombuffer(data_buffer, dtype=np.uint8)[offsets[0] : offsets[-1]]
+    return data.reshape(len(values), width)
+
+
+def _field_bytes(matrix: np.ndarray, start: int, stop: int) -> np.ndarray:
+    return np.ascontiguousarray(matrix[:, start:stop]).view(f"S{stop - start}").ravel()
+
+
+def _all_digits(digits: np.ndarray, start: int, stop: int) -> np.ndarray:
+    """``digits`` is the byte matrix minus ord("0"); ASCII digits are the entries below 10."""
+    return (digits[:, start:stop] < 10).all(axis=1)
+
+
+def _digits_value(digits: np.ndarray, start: int, stop: int) -> np.ndarray:
+    weights = 10 ** np.arange(stop - start - 1, -1, -1, dtype=np.int64)
+    return digits[:, start:stop] @ weights
+
+
+def _all_nines_field(matrix: np.ndarray, start: int, stop: int) -> np.ndarray:
+    """Array form of _all_nines for a fixed-width field."""
+    block = matrix[:, start:stop]
+    leading_sign = np.logical_and.accumulate((block == 0x2B) | (block == 0x2D), axis=1)
+    return (leading_sign | (block == 0x39)).all(axis=1) & ~leading_sign[:, -1]
+
+
+def _control_header_errors(matrix: np.ndarray) -> np.ndarray:
+    """Array form of _validate_control_header for ASCII headers of at least 60 characters.
+
+    Checks run in the scalar function's order; a row keeps the first error it hits.
+    """
+    errors = np.full(len(matrix), None, dtype=object)
+    pending = np.ones(len(matrix), dtype=bool)
+    digits = matrix - np.uint8(0x30)
+
+    def flag(condition: np.ndarray, error: str) -> None:
+        hit = pending & condition
+        errors[hit] = error
+        pending[hit] = False
+
+    flag(
+        ~(
+            _all_digits(digits, 0, 4)
+            & _all_digits(digits, 10, 15)
+            & _all_digits(digits, 15, 23)
+            & _all_digits(digits, 23, 27)
+        ),
+        "control_header_invalid_width",
+    )
+
+    signed = {}
+    bad_sentinel = np.zeros(len(matrix), dtype=bool)
+    for start, stop, missing in (
+        (28, 34, _LATITUDE_MISSING),
+        (34, 41, _LONGITUDE_MISSING),
+        (41, 46, _ELEVATION_MISSING),
+    ):
+        sign = matrix[:, start]
+        matches = ((sign == 0x2B) | (sign == 0x2D)) & _all_digits(digits, start + 1, stop)
+        is_missing = _field_bytes(matrix, start, stop) == missing
+        sentinel = _all_nines_field(matrix, start, stop) & ~is_missing
+        flag(~matches & sentinel, "control_header_invalid_sentinel")
+        flag(~matches, "control_header_invalid_width")
+        bad_sentinel |= sentinel
+        value = _digits_value(digits, start + 1, stop)
+        signed[start] = (np.where(sign == 0x2D, -value, value), is_missing)
+    flag(bad_sentinel, "control_header_invalid_sentinel")
+    if not pending.any():
+        return errors
+
+    year = _digits_value(digits, 15, 19)
+    month = _digits_value(digits, 19, 21)
+    day = _digits_value(digits, 21, 23)
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    month_length = _MONTH_LENGTHS[np.minimum(month, 12)] + ((month == 2) & leap)
+    latitude, latitude_missing = signed[28]
+    longitude, longitude_missing = signed[34]
+    elevation, elevation_missing = signed[41]
+    flag(
+        ~_SOURCE_FLAG_LOOKUP[matrix[:, 27]]
+        | ~np.isin(_field_bytes(matrix, 46, 51), _REPORT_TYPE_BYTES)
+        | ~np.isin(_field_bytes(matrix, 56, 60), _QC_PROCESS_BYTES)
+        | (month < 1)
+        | (month > 12)
+        | (day < 1)
+        | (day > month_length)
+        | (_digits_value(digits, 23, 25) > 23)
+        | (_digits_value(digits, 25, 27) > 59)
+        | (~latitude_missing & ((latitude < -90000) | (latitude > 90000)))
+        | (~longitude_missing & ((longitude < -179999) | (longitude > 180000)))
+        | (~elevation_missing & ((elevation < -400) | (elevation > 8850))),
+        "control_header_invalid_domain",
+    )
+    return errors
+
+
+def _scalar_null(value: object) -> bool:
+    """True for the null values the scalar raw-line validators and REM/QNN parsers skip."""
+    return value is None or (isinstance(value, float) and pd.isna(value))
+
+
+# infer_dtype results (skipna=True) for object columns that may hold str among other values.
+_MIXED_INFERRED_TYPES = {"mixed", "mixed-integer"}
+
+
+def _column_text(column: pd.Series) -> tuple[pa.Array, np.ndarray]:
+    """The str values of a column as an Arrow string array, with their row positions."""
+    empty = np.zeros(0, dtype=np.int64)
+    if isinstance(column.dtype, pd.StringDtype):
+        values = pa.array(column.array, type=pa.large_string())
+        if values.null_count == 0:
+            return values, np.arange(len(column))
+        valid = values.is_valid()
+        return values.filter(valid), np.flatnonzero(valid.to_numpy(zero_copy_only=False))
+    if not pd.api.types.is_object_dtype(column):
+        return pa.array([], type=pa.large_string()), empty
+
+    objects = column.to_numpy(dtype=object)
+    inferred = pd.api.types.infer_dtype(objects, skipna=True)
+    if inferred in {"string", "empty"}:
+        values = pa.array(objects, type=pa.large_string(), from_pandas=True)
+        valid = values.is_valid()
+        return values.filter(valid), np.flatnonzero(valid.to_numpy(zero_copy_only=False))
+    if inferred not in _MIXED_INFERRED_TYPES:
+        return pa.array([], type=pa.large_string()), empty
+    is_text = np.fromiter(map(isinstance, objects, repeat(str)), dtype=bool, count=len(objects))
+    return pa.array(objects[is_text], type=pa.large_string()), np.flatnonzero(is_text)
+
+
+def _text_as_arrow(column: pd.Series) -> tuple[pa.Array, np.ndarray, np.ndarray]:
+    """Split a column into text for the array parsers and rows needing the scalar ones.
+
+    Returns the non-null text as an Arrow string array, the row positions of
+    that text, and the row positions of values the array path cannot
+    reproduce exactly (non-string objects and pandas.NA-like nulls). Nulls
+    the scalar parsers skip (None and NaN) appear in neither set.
+    """
+    values, positions = _column_text(column)
+    is_text = np.zeros(len(column), dtype=bool)
+    is_text[positions] = True
+    others = np.flatnonzero(~is_text)
+    if isinstance(column.dtype, pd.StringDtype):
+        fallback = others if not _scalar_null(column.dtype.na_value) else others[:0]
+    elif not pd.api.types.is_object_dtype(column):
+        fallback = others
+    else:
+        objects = column.to_numpy(dtype=object)
+        fallback = np.array(
+            [position for position in others if not _scalar_null(objects[position])], dtype=np.int64
+        )
+    return values, positions, fallback
+
+
+def _validate_raw_lines(raw_lines: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """Array form of _validate_control_header and _record_length_mismatch over a column.
+
+    ASCII lines are checked as a fixed-width byte matrix of their first 60
+    characters. Non-ASCII lines, non-string values and lines whose length
+    prefix is not four digits go through the scalar validators, so codes and
+    precedence match them exactly.
+    """
+    size = len(raw_lines)
+    control_error = np.full(size, None, dtype=object)
+    mismatch = np.zeros(size, dtype=bool)
+
+    values, positions, fallback = _text_as_arrow(raw_lines)
+    is_ascii = pc.string_is_ascii(values).to_numpy(zero_copy_only=False)
+    if not is_ascii.all():
+        fallback = np.concatenate([fallback, positions[~is_ascii]])
+        positions = positions[is_ascii]
+        values = values.filter(pa.array(is_ascii))
+    text = pc.ascii_rtrim(values, characters="\r\n")
+    lengths = pc.binary_length(text).to_numpy(zero_copy_only=False).astype(np.int64)
+    header = pc.utf8_slice_codeunits(text, 0, _CONTROL_HEADER_WIDTH)
+    long_enough = lengths >= _CONTROL_HEADER_WIDTH
+    if not long_enough.all():
+        header = pc.utf8_rpad(header, width=_CONTROL_HEADER_WIDTH, padding=" ")
+    matrix = _byte_matrix(header, _CONTROL_HEADER_WIDTH)
+
+    if long_enough.all():
+        control_error[positions] = _control_header_errors(matrix)
+    else:
+        control_error[positions[~long_enough]] = "control_header_short"
+        control_error[positions[long_enough]] = _control_header_errors(matrix[long_enough])
+
+    # Only the first ``length`` bytes of a padded header are real.
+    digits = matrix[:, :4] - np.uint8(0x30)
+    numeric_prefix = (lengths >= 4) & _all_digits(digits, 0, 4)
+    mismatch[positions] = np.where(
+        numeric_prefix, lengths != 105 + _digits_value(digits, 0, 4), lengths < 4
+    )
+    fallback = np.concatenate([fallback, positions[(lengths >= 4) & ~numeric_prefix]])
+
+    fallback = np.unique(fallback)
+    for position, value in zip(fallback, raw_lines.iloc[fallback].to_numpy(dtype=object)):
+        control_error[position] = _validate_control_header(value)
+        mismatch[position] = _record_length_mismatch(value)
+    return (
+        pd.Series(control_error, index=raw_lines.index, dtype="object"),
+        pd.Series(mismatch, index=raw_lines.index),
+    )
+
+
+# Characters str.strip() and the ``\s`` class of re treat as whitespace in ASCII text.
+_ASCII_WHITESPACE = " \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+_ASCII_WHITESPACE_RUN = "[ \\t\\n\\r\\x0b\\x0c\\x1c-\\x1f]+"
+_QNN_ELEMENT_LOOKUP = np.zeros(256, dtype=bool)
+_QNN_ELEMENT_LOOKUP[[ord(element) for element in QNN_ELEMENT_IDENTIFIERS]] = True
+_ALNUM_LOOKUP = np.zeros(256, dtype=bool)
+_ALNUM_LOOKUP[[ord(char) for char in "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"]] = True
+
+
+def _ascii_text(column: pd.Series) -> tuple[pa.Array, np.ndarray, np.ndarray]:
+    """_text_as_arrow restricted to ASCII text, stripped like str.strip().
+
+    Non-ASCII text joins the scalar fallback rows, so Unicode whitespace and
+    case rules stay those of Python.
+    """
+    values, positions, fallback = _text_as_arrow(column)
+    is_ascii = pc.string_is_ascii(values).to_numpy(zero_copy_only=False)
+    if not is_ascii.all():
+        fallback = np.concatenate([fallback, positions[~is_ascii]])
+        positions = positions[is_ascii]
+        values = values.filter(pa.array(is_ascii))
+    text = pc.ascii_trim(values, characters=_ASCII_WHITESPACE)
+    blank = pc.is_in(text, value_set=pa.array(["", "nan", "None"], type=pa.large_string()))
+    if not pc.any(blank).as_py():
+        return text, positions, fallback
+    keep = pc.invert(blank)
+    return text.filter(keep), positions[keep.to_numpy(zero_copy_only=False)], fallback
+
+
+def _text_series(
+    values: pa.Array,
+    positions: np.ndarray,
+    fallback: dict[int, str | None],
+    index: pd.Index,
+) -> pd.Series:
+    """Place parsed text at ``positions`` (and scalar results at ``fallback``) in a column.
+
+    The dtype is the one pandas infers when a frame column is assigned the
+    equivalent list of str/None: the string dtype, object when every row is
+    None, and float64 for an empty frame.
+    """
+    take = np.full(len(index), -1, dtype=np.int64)
+    take[positions] = np.arange(len(positions))
+    series = pd.Series(
+        values.take(pa.array(take, mask=take < 0)), index=index, dtype=ARROW_STRING_DTYPE
+    )
+    if fallback:
+        series.iloc[list(fallback)] = list(fallback.values())
+    if series.isna().all():
+        dtype = "object" if len(index) else "float64"
+        return pd.Series([None] * len(index), index=index, dtype=dtype)
+    return series
+
+
+def _parse_remark_column(remarks: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """Array form of _parse_remark over a column; returns (REM__type, REM__text)."""
+    text, positions, fallback = _ascii_text(remarks)
+    prefix = pc.ascii_upper(pc.utf8_slice_codeunits(text, 0, 3))
+    typed = pc.is_in(prefix, value_set=pa.array(sorted(REM_TYPE_CODES), type=pa.large_string()))
+    remainder = pc.ascii_trim(pc.utf8_replace_slice(text, 0, 3, ""), characters=_ASCII_WHITESPACE)
+    remainder = pc.if_else(pc.equal(remainder, ""), pa.scalar(None, pa.large_string()), remainder)
+    remark_type = pc.if_else(typed, prefix, pa.scalar(None, pa.large_string()))
+    remark_text = pc.if_else(typed, remainder, text)
+
+    parsed = {
+        int(position): _parse_remark(value)
+        for position, value in zip(fallback, remarks.iloc[fallback].to_numpy(dtype=object))
+    }
+    return (
+        _text_series(remark_type, positions, {key: value[0] for key, value in parsed.items()}, remarks.index),
+        _text_series(remark_text, positions, {key: value[1] for key, value in parsed.items()}, remarks.index),
+    )
+
+
+def _join_groups(
+    data: np.ndarray, starts: np.ndarray, counts: np.ndarray, stride: int, width: int
+) -> pa.Array:
+    """Comma-join ``counts[i]`` groups of ``width`` bytes, ``stride`` apart from ``starts[i]``."""
+    rows = np.repeat(np.arange(len(counts)), counts)
+    first = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype(np.int64)
+    group = np.arange(len(rows), dtype=np.int64) - first[rows]
+    sources = (starts[rows] + group * stride)[:, None] + np.arange(width)
+    joined = np.full((len(rows), width + 1), ord(","), dtype=np.uint8)
+    joined[:, :width] = data[sources]
+    offsets = np.concatenate([[0], np.cumsum(counts * (width + 1))]).astype(np.int64)
+    values = pa.LargeStringArray.from_buffers(
+        len(counts), pa.py_buffer(offsets), pa.py_buffer(joined)
+    )
+    # Drop each row's trailing separator.
+    return pc.utf8_slice_codeunits(values, 0, -1)
+
+
+def _parse_qnn_column(qnn: pd.Series) -> tuple[pd.Series, pd.Series, pd.Series]:
+    """Array form of _parse_qnn over a column.
+
+    The element/flag groups are tokenized one group per round across all
+    payloads; returns (QNN__elements, QNN__source_flags, QNN__data_values).
+    """
+    text, positions, fallback = _ascii_text(qnn)
+    upper = pc.ascii_upper(text)
+    marked = pc.starts_with(upper, "QNN").to_numpy(zero_copy_only=False)
+    payload = pc.replace_substring_regex(
+        pc.utf8_replace_slice(upper.filter(pa.array(marked)), 0, 3, ""), _ASCII_WHITESPACE_RUN, ""
+    )
+    positions = positions[marked]
+
+    offset_type = np.int64 if pa.types.is_large_string(payload.type) else np.int32
+    _, offsets_buffer, data_buffer = payload.buffers()
+    offsets = np.frombuffer(offsets_buffer, dtype=offset_type)[
+        payload.offset : payload.offset + len(payload) + 1
+    ].astype(np.int64)
+    data = np.frombuffer(data_buffer, dtype=np.uint8) if data_buffer is not None else np.zeros(0, np.uint8)
+    starts = offsets[:-1]
+    lengths = np.diff(offsets)
+
+    consumed = np.zeros(len(payload), dtype=np.int64)
+    invalid = np.zeros(len(payload), dtype=bool)
+    active = np.flatnonzero(lengths >= 5)
+    while len(active):
+        at = starts[active] + consumed[active]
+        is_element = _QNN_ELEMENT_LOOKUP[data[at]]
+        active, at = active[is_element], at[is_element]
+        flags_ok = _ALNUM_LOOKUP[data[at[:, None] + np.arange(1, 5)]].all(axis=1)
+        invalid[active[~flags_ok]] = True
+        active = active[flags_ok]
+        consumed[active] += 5
+        active = active[consumed[active] + 5 <= lengths[active]]
+
+    counts = consumed // 5
+    remainder = lengths - consumed
+    valid = ~invalid & (counts > 0) & ((remainder == 0) | (remainder == 6 * counts))
+    starts, counts, remainder = starts[valid], counts[valid], remainder[valid]
+    positions = positions[valid]
+    has_values = remainder > 0
+    elements = _join_groups(data, starts, counts, 5, 1)
+    source_flags = _join_groups(data, starts + 1, counts, 5, 4)
+    data_values = _join_groups(data, starts + 5 * counts, counts * has_values, 6, 6)
+    data_values = pc.if_else(pa.array(has_values), data_values, pa.scalar(None, pa.large_string()))
+
+    parsed = {
+        int(position): _parse_qnn(value)
+        for position, value in zip(fallback, qnn.iloc[fallback].to_numpy(dtype=object))
+    }
+    return tuple(
+        _text_series(values, positions, {key: value[part] for key, value in parsed.items()}, qnn.index)
+        for part, values in enumerate((elements, source_flags, data_values))
+    )
+
+
 def _normalize_control_fields(df: pd.DataFrame) -> pd.DataFrame:
     work = df.copy()
 
@@ -1066,19 +2314,141 @@ def _normalize_control_fields(df: pd.DataFrame) -> pd.DataFrame:
     return work
 
 
+# Part 02 control and station columns; kept whatever identifiers are selected.
+_CONTROL_COLUMNS = frozenset(
+    {
+        "STATION",
+        "DATE",
+        "TIME",
+        "SOURCE",
+        "LATITUDE",
+        "LONGITUDE",
+        "ELEVATION",
+        "NAME",
+        "REPORT_TYPE",
+        "CALL_SIGN",
+        "QUALITY_CONTROL",
+        "QC_PROCESS",
+    }
+)
+_SECTION_COLUMNS = frozenset({"REM", "QNN", "EQD"})
+
+
+def _is_identifier_column(column: object) -> bool:
+    if not isinstance(column, str) or column in _CONTROL_COLUMNS:
+        return False
+    return (
+        column in KNOWN_IDENTIFIERS
+        or column in _SECTION_COLUMNS
+        or is_valid_eqd_identifier(column) is not None
+        or is_valid_repeated_identifier(column) is not None
+    )
+
+
+def select_identifier_columns(columns: Iterable[str], identifiers: Iterable[str]) -> list[str]:
+    """Return the columns to keep when only ``identifiers`` are cleaned.
+
+    Identifier columns (mandatory and additional-data families, EQD, REM and
+    QNN) are kept only if requested. Control and station columns and columns
+    that are not NOAA identifiers (``raw_line``, ``YEAR``, ...) are always
+    kept. Raises ValueError for requested names that are not identifiers.
+    """
+    requested = set(identifiers)
+    unknown = sorted(
+        str(name) for name in requested if not _is_identifier_column(name) and name not in _CONTROL_COLUMNS
+    )
+    if unknown:
+        raise ValueError(f"Unknown identifier(s): {', '.join(unknown)}")
+    return [column for column in columns if column in requested or not _is_identifier_column(column)]
+
+
+# Normalized control columns that are not text (see _normalize_control_fields).
+_CONTROL_DTYPES = {"LATITUDE": "float64", "LONGITUDE": "float64", "ELEVATION": "float64"}
+
+
+def _expands_identifier(column: str, strict_mode: bool) -> bool:
+    if column in _CONTROL_COLUMNS or not get_output_columns(column):
+        return False
+    if not strict_mode:
+        return True
+    return is_valid_section_identifier_token(column) is not False and (
+        column in KNOWN_IDENTIFIERS
+        or is_valid_eqd_identifier(column) is True
+        or is_valid_repeated_identifier(column) is True
+    )
+
+
+def output_schema(
+    columns: Iterable[str],
+    keep_raw: bool = True,
+    strict_mode: bool = True,
+) -> pd.Series:
+    """Return the ordered output columns and dtypes for raw input ``columns``.
+
+    The schema depends only on which columns are present, not on their
+    values: every registry identifier contributes all the columns its
+    FieldRule can produce (see get_output_columns), named as in the cleaned
+    output. Control columns get their normalized dtypes, other raw columns
+    are text, and passthrough columns are object. ADD is left out because
+    the cleaner drops the bare section marker. Expansions of unknown
+    identifiers in permissive mode are not covered.
+
+    The result has the shape of ``DataFrame.dtypes`` and can be passed as
+    ``schema`` to clean_noaa_dataframe or iter_clean_noaa, so frames from
+    different chunks, stations or years concatenate without realignment.
+    """
+    columns = [column for column in columns if column != "ADD"]
+    expanding = [column for column in columns if _expands_identifier(column, strict_mode)]
+    dtypes: dict[str, object] = {}
+    for column in columns:
+        if keep_raw or column not in expanding:
+            if column in _CONTROL_COLUMNS:
+                dtypes[column] = _CONTROL_DTYPES.get(column, "str")
+            elif column in _SECTION_COLUMNS or _is_identifier_column(column):
+                dtypes[column] = "str"
+            else:
+                dtypes[column] = "object"
+    if "raw_line" in columns or "RAW_LINE" in columns:
+        dtypes["__parse_error"] = "str"
+    if "REM" in columns:
+        dtypes.update({"REM__type": "str", "REM__text": "str"})
+    for column in expanding:
+        dtypes.update(
+            (name, _qc_dtype(name) or dtype) for name, dtype in get_output_columns(column)
+        )
+    if "QNN" in columns:
+        dtypes.update(dict.fromkeys(_QNN_OUTPUT_COLUMNS, "str"))
+    if any(column.endswith("__qc_pass") for column in dtypes):
+        dtypes.update({column: str(dtype) for column, dtype in _USABILITY_DTYPES.items()})
+    return pd.Series(
+        [pd.api.types.pandas_dtype(dtype) for dtype in dtypes.values()],
+        index=[to_friendly_column(column) for column in dtypes],
+        dtype=object,
+    )
+
+
 def clean_noaa_dataframe(
     df: pd.DataFrame,
     keep_raw: bool = True,
     strict_mode: bool = True,
-) -> pd.DataFrame:
+    engine: ParseEngine = "vectorized",
+    return_report: bool = False,
+    log_examples: int = 0,
+    workers: int | None = None,
+    shard_rows: int | None = None,
+    identifiers: Iterable[str] | None = None,
+    schema: pd.Series | None = None,
+    packed_qc: bool = False,
+    compact: bool = False,
+) -> pd.DataFrame | tuple[pd.DataFrame, ParseReport]:
     """Expand NOAA comma-encoded fields into parsed numeric columns with QC signals.
 
     For fields with the pattern value,quality this will create:
     - `<column>__value`: Numeric value (scaled, None if invalid)
     - `<column>__quality`: NOAA quality code
     - `<column>__qc_pass`: Boolean - all validations passed
-    - `<column>__qc_status`: String - "PASS" or "INVALID"
-    - `<column>__qc_reason`: String - reason for failure (or None if PASS)
+    - `<column>__qc_status`: Categorical over QC_STATUS_VALUES
+    - `<column>__qc_reason`: Categorical over QC_REASON_ENUM (NaN if PASS)
 
     For multi-part fields, creates:
     - `<column>__partN`: Component values
@@ -1095,17 +2465,735 @@ def clean_noaa_dataframe(
         strict_mode: If True, only expand known NOAA identifiers and enforce
                      validation rules (A1-A4). If False, use legacy permissive
                      parsing. Rejections are logged with [PARSE_STRICT] prefix.
+        engine: "vectorized" (default) parses each identifier column with
+                array operations; "memoized" parses each distinct raw token
+                once through the shared PARSE_CACHE; "reference" runs
+                clean_value_quality per cell. All engines produce identical
+                output.
+        return_report: If True, also return the ParseReport with rejection
+                       counts keyed by (identifier, part, reason).
+        log_examples: Number of raw example values to log per rejection key
+                      alongside the summary lines (0 disables sampling).
+        workers: Number of worker processes used to expand identifier
+                 columns in parallel (or to clean row shards when
+                 ``shard_rows`` is set). None or 1 runs serially.
+        shard_rows: If set and ``df`` is longer, clean contiguous blocks of
+                    this many rows independently and stitch them back under
+                    one schema; usability metrics are recomputed on the
+                    stitched frame. Which columns are expanded is decided
+                    once on the full frame. Nulls in object columns that
+                    were numeric in some shards come back as NaN rather
+                    than None.
+        identifiers: If set, only these identifier columns (e.g.
+                     ``["TMP", "DEW", "AA1"]``) are cleaned; other
+                     identifier columns are dropped before parsing, so
+                     usability metrics cover the selection. Control,
+                     station and non-identifier columns are always kept
+                     (see select_identifier_columns).
+        schema: If set (e.g. from output_schema), the cleaned frame is
+                conformed to these columns and dtypes: missing columns are
+                null, columns outside it are dropped and values that do not
+                fit a numeric dtype become null.
+        packed_qc: If True, each part's ``__qc_pass``/``__qc_status``/
+                   ``__qc_reason`` triple is replaced by one uint8
+                   ``__qc_code`` column and ``qc_pass_mask_<n>`` bitmasks
+                   back the usability metrics (see pack_qc; unpack_qc
+                   restores the default layout).
+        compact: If True, store QC signals and quality codes as categoricals
+                 and booleans and measurements as float32 where the rule
+                 allows it (see compact_dtypes). The per-column savings
+                 are in the result's ``attrs["memory_savings"]``.
 
     Returns:
-        DataFrame with expanded, cleaned, and QC columns
+        DataFrame with expanded, cleaned, and QC columns, or a
+        ``(DataFrame, ParseReport)`` tuple when ``return_report`` is True.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be a positive integer")
+    if identifiers is not None:
+        df = df[select_identifier_columns(df.columns, identifiers)]
+    if shard_rows is not None:
+        if shard_rows < 1:
+            raise ValueError("shard_rows must be a positive integer")
+        if len(df) > shard_rows:
+            cleaned, report = _clean_sharded(
+                df, shard_rows, keep_raw, strict_mode, engine, log_examples, workers
+            )
+            cleaned = _apply_output_options(cleaned, schema, packed_qc, compact)
+            return (cleaned, report) if return_report else cleaned
+    cleaned, report = _clean_frame(df, keep_raw, strict_mode, engine, log_examples, workers)
+    cleaned = _apply_output_options(cleaned, schema, packed_qc, compact)
+    if return_report:
+        return cleaned, report
+    return cleaned
+
+
+def _apply_output_options(
+    cleaned: pd.DataFrame,
+    schema: pd.Series | None,
+    packed_qc: bool,
+    compact: bool,
+) -> pd.DataFrame:
+    if schema is not None:
+        cleaned = _conform_to_schema(cleaned, _stream_schema(schema))
+    if packed_qc:
+        cleaned = pack_qc(cleaned)
+    if compact:
+        cleaned = compact_dtypes(cleaned)
+    return cleaned
+
+
+def clean_arrow_table(
+    table: pa.Table,
+    keep_raw: bool = True,
+    strict_mode: bool = True,
+    engine: ParseEngine = "vectorized",
+    workers: int | None = None,
+    shard_rows: int | None = None,
+    identifiers: Iterable[str] | None = None,
+) -> pa.Table:
+    """Clean a raw NOAA pyarrow Table and return the cleaned Table.
+
+    String columns are viewed as Arrow-backed pandas strings, so the
+    vectorized engine parses them with pyarrow.compute kernels, and
+    string outputs convert back to Arrow without a copy. Output matches
+    clean_noaa_dataframe, except that parts mixing parsed numbers with
+    raw-text fallbacks (possible with ``strict_mode=False``) become string
+    columns, which Arrow requires. With ``identifiers``, unselected
+    columns are dropped before conversion.
     """
+    if identifiers is not None:
+        table = table.select(select_identifier_columns(table.column_names, identifiers))
+    frame = table.to_pandas(types_mapper=arrow_string_types)
+    cleaned = clean_noaa_dataframe(
+        frame,
+        keep_raw=keep_raw,
+        strict_mode=strict_mode,
+        engine=engine,
+        workers=workers,
+        shard_rows=shard_rows,
+    )
+    cleaned = _fallbacks_as_text(cleaned, _text_fallback_columns(cleaned))
+    return pa.Table.from_pandas(cleaned, preserve_index=False)
+
+
+def iter_clean_noaa(
+    chunks: Iterable[pd.DataFrame | pa.Table | pa.RecordBatch],
+    keep_raw: bool = True,
+    strict_mode: bool = True,
+    engine: ParseEngine = "vectorized",
+    workers: int | None = None,
+    shard_rows: int | None = None,
+    identifiers: Iterable[str] | None = None,
+    schema: pd.Series | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Clean raw NOAA chunks one at a time and yield them under one schema.
+
+    ``chunks`` may be DataFrames (e.g. ``pd.read_csv(..., chunksize=N)``),
+    pyarrow Tables or RecordBatches (e.g. ``ParquetFile.iter_batches()``).
+    Each chunk is cleaned like clean_noaa_dataframe and released before the
+    next is read, so peak memory follows the chunk size.
+
+    Every yielded frame has the columns and dtypes of ``schema`` (column
+    name to dtype, as ``DataFrame.dtypes``), which defaults to the
+    output_schema of the first chunk's columns. output_schema does not
+    cover unknown identifiers, so with ``strict_mode=False`` the default is
+    the first cleaned chunk instead. Boolean columns are widened to object
+    so later chunks can carry nulls; columns a chunk lacks are null,
+    columns outside the schema are dropped with a warning, and usability
+    metrics are recomputed over the schema's QC columns.
+    """
+    if identifiers is not None:
+        identifiers = list(identifiers)
+    if schema is not None:
+        schema = _stream_schema(schema)
+    for chunk in chunks:
+        if isinstance(chunk, (pa.Table, pa.RecordBatch)):
+            chunk = chunk.to_pandas(types_mapper=arrow_string_types)
+        if schema is None and strict_mode:
+            columns = list(chunk.columns)
+            if identifiers is not None:
+                columns = select_identifier_columns(columns, identifiers)
+            schema = _stream_schema(output_schema(columns, keep_raw, strict_mode))
+        cleaned = clean_noaa_dataframe(
+            chunk,
+            keep_raw=keep_raw,
+            strict_mode=strict_mode,
+            engine=engine,
+            workers=workers,
+            shard_rows=shard_rows,
+            identifiers=identifiers,
+        )
+        if schema is None:
+            schema = _stream_schema(cleaned.dtypes)
+        yield _conform_to_schema(cleaned, schema)
+
+
+# Usability metrics are recomputed per chunk, so they never carry nulls.
+_USABILITY_DTYPES = {
+    "row_has_any_usable_metric": np.dtype(bool),
+    "usable_metric_count": np.dtype("int64"),
+    "usable_metric_fraction": np.dtype("float64"),
+}
+
+
+def _stream_schema(dtypes: pd.Series) -> pd.Series:
+    schema = dtypes.map(lambda dtype: np.dtype(object) if dtype == bool else dtype)
+    for column, dtype in _USABILITY_DTYPES.items():
+        if column in schema.index:
+            schema[column] = dtype
+    return schema
+
+
+def _conform_to_schema(cleaned: pd.DataFrame, schema: pd.Series) -> pd.DataFrame:
+    extra = [
+        column for column in cleaned.columns
+        if column not in schema.index and cleaned[column].notna().any()
+    ]
+    if extra:
+        logger.warning(
+            f"[PARSE_STRICT] Dropping {len(extra)} column(s) outside the schema: "
+            f"{', '.join(extra)}"
+        )
+    usability = [column for column in _USABILITY_DTYPES if column in schema.index]
+    conformed = cleaned.reindex(columns=schema.index.drop(usability))
+    if usability:
+        conformed = _add_usability_metrics(conformed)[schema.index]
+    for column, dtype in schema.items():
+        if conformed[column].dtype != dtype:
+            conformed[column] = _cast_column(conformed[column], dtype)
+    return conformed
+
+
+def _cast_column(series: pd.Series, dtype: object) -> pd.Series:
+    try:
+        return series.astype(dtype)
+    except (TypeError, ValueError):
+        if not pd.api.types.is_numeric_dtype(dtype):
+            raise
+    # Numeric parts fall back to their raw text when a token is not a number.
+    # That text is kept, so the column stays object rather than losing it.
+    text = int((pd.to_numeric(series, errors="coerce").isna() & series.notna()).sum())
+    logger.warning(
+        f"[PARSE_STRICT] {series.name}: {text} non-numeric value(s) kept as text instead of {dtype}"
+    )
+    return series.astype(object)
+
+
+def _text_fallback_columns(frame: pd.DataFrame) -> list[str]:
+    """Object columns that mix parsed numbers with raw-text fallbacks.
+
+    Arrow has no type for such a column, so writers store it as text.
+    """
+    return [
+        column for column in frame.columns
+        if frame[column].dtype == object
+        and pd.api.types.infer_dtype(frame[column], skipna=True) in ("mixed", "mixed-integer")
+    ]
+
+
+def _fallbacks_as_text(frame: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
+    columns = [column for column in columns if column in frame.columns]
+    if not columns:
+        return frame
+    return frame.assign(
+        **{column: frame[column].map(str, na_action="ignore").astype("str") for column in columns}
+    )
+
+
+def _stream_template(
+    chunks: Iterable[pa.Table | pa.RecordBatch], strict_mode: bool = True
+) -> pd.DataFrame:
+    """Small raw frame whose cleaned output has every column a pass over ``chunks`` would produce.
+
+    Expansion is column-wise and per value, so the cleaned columns and
+    dtypes are fixed by the distinct values of each identifier column.
+    Those are collected in full; REM, QNN and other columns contribute
+    their first value, which fixes their (value-independent) outputs.
+    With ``strict_mode=False`` any non-control column may expand, so all of
+    them except raw_line are collected in full.
+    """
+    order: list[str] = []
+    distinct: dict[str, list[pa.Array]] = {}
+    first: dict[str, pa.Scalar] = {}
+    for chunk in chunks:
+        order = order or list(chunk.column_names)
+        for name, column in zip(chunk.column_names, chunk.columns):
+            expands = _is_identifier_column(name) or (
+                not strict_mode and name not in _CONTROL_COLUMNS and name not in ("raw_line", "RAW_LINE")
+            )
+            if expands and name not in _SECTION_COLUMNS:
+                distinct.setdefault(name, []).append(pc.unique(column))
+            elif name not in first or not first[name].is_valid:
+                valid = column.drop_null()
+                first[name] = valid[0] if len(valid) else column[0] if len(column) else pa.scalar(None)
+    values = {
+        name: pc.unique(pa.chunked_array(arrays, type=arrays[0].type))
+        for name, arrays in distinct.items()
+    }
+    rows = max((len(array) for array in values.values()), default=1) or 1
+    columns: dict[str, pa.Array] = {}
+    for name in order:
+        if name in values:
+            array = values[name]
+            columns[name] = pa.concat_arrays([array, pa.nulls(rows - len(array), array.type)])
+        else:
+            columns[name] = pa.repeat(first[name], rows)
+    return pa.table(columns).to_pandas(types_mapper=arrow_string_types)
+
+
+
+# ── Compact dtypes ───────────────────────────────────────────────────────
+#
+# By default quality codes are text or object columns and every measurement
+# is float64. The compact policy stores the fixed
+# vocabularies as categoricals, pass flags as nullable booleans and
+# measurements as float32 where the rule's range allows it.
+
+# float32 has a 24-bit significand, so raw integer tokens below 2**23 keep
+# every decimal their scale allows (error under half a scale unit).
+_FLOAT32_RAW_LIMIT = 2**23
+
+
+def _quality_dtype(allowed: set[str] | None) -> pd.CategoricalDtype:
+    return pd.CategoricalDtype(sorted(QUALITY_FLAGS | (allowed or set())))
+
+
+def _fits_float32(part: PartParserPlan) -> bool:
+    """True if every in-range value of ``part`` survives a float32 round trip."""
+    rule = part.rule
+    if rule.kind != "numeric":
+        # Codes parsed as numbers are short digit tokens.
+        return True
+    if rule.min_value is not None and rule.max_value is not None:
+        limit = max(abs(rule.min_value), abs(rule.max_value))
+    else:
+        width = part.token_width or part.fixed_width
+        if width is None:
+            return False
+        limit = 10**width
+    return limit < _FLOAT32_RAW_LIMIT
+
+
+@lru_cache(maxsize=None)
+def _compact_column_dtypes(identifier: str) -> dict[str, object]:
+    """Compact dtype of each internal column *identifier* expands to."""
+    plan = get_parser_plan(identifier)
+    dtypes: dict[str, object] = {}
+    for column, dtype in get_output_columns(identifier):
+        if column.endswith(("__qc_pass", "__direction_variable")):
+            dtypes[column] = pd.BooleanDtype()
+        elif column.endswith(("__qc_status", "__qc_reason")):
+            dtypes[column] = _qc_dtype(column)
+        elif column == plan.quality_key:
+            allowed = plan.value_allowed_quality if plan.value_quality else plan.allowed_quality
+            dtypes[column] = _quality_dtype(allowed)
+    if plan.value_quality and 1 in plan.parts and _fits_float32(plan.parts[1]):
+        dtypes[plan.value_key] = np.dtype("float32")
+    if not plan.value_quality:
+        output = dict(get_output_columns(identifier))
+        for part in plan.parts.values():
+            if output.get(part.key) == "float64" and _fits_float32(part):
+                dtypes[part.key] = np.dtype("float32")
+            elif part.rule.kind == "quality" and output.get(part.key) == "object":
+                dtypes[part.key] = _quality_dtype(part.rule.allowed_quality)
+    return dtypes
+
+
+def _compact_dtype(column: str) -> object | None:
+    internal = to_internal_column(column)
+    return _compact_column_dtypes(internal.split("__", 1)[0]).get(internal)
+
+
+def _compact_target(series: pd.Series, dtype: object) -> object | None:
+    """The compact dtype ``series`` can take without losing values, if any."""
+    if isinstance(dtype, pd.CategoricalDtype):
+        if series.dropna().isin(dtype.categories).all():
+            return dtype
+        # Digit-only quality codes come out of the parser as numbers.
+        return np.dtype("float32") if pd.api.types.is_float_dtype(series.dtype) else None
+    if isinstance(dtype, pd.BooleanDtype):
+        return dtype if pd.api.types.infer_dtype(series, skipna=True) in {"boolean", "empty"} else None
+    return dtype if pd.api.types.is_float_dtype(series.dtype) else None
+
+
+def compact_dtypes(cleaned: pd.DataFrame) -> pd.DataFrame:
+    """Return ``cleaned`` with compact dtypes for its registry columns.
+
+    ``__qc_status`` and ``__qc_reason`` become categoricals over
+    QC_STATUS_VALUES and QC_REASON_ENUM (the cleaner already emits them so),
+    quality codes categoricals over QUALITY_FLAGS plus the governing rule's
+    allowed flags, ``__qc_pass`` and ``__direction_variable`` nullable
+    booleans, and numeric parts float32 when the rule's range (pre-scale
+    min/max, else token width) fits a float32 significand (quality codes
+    parsed as numbers are float32 too). A column is only converted
+    when all its values fit the compact dtype, so no value changes beyond
+    float32 rounding; passthrough, text and usability columns are left
+    alone.
+
+    The per-column savings (see memory_savings) are attached to the result
+    as ``attrs["memory_savings"]``.
+    """
+    compacted = cleaned.copy(deep=False)
+    for column in cleaned.columns:
+        dtype = _compact_dtype(column)
+        if dtype is None:
+            continue
+        series = cleaned[column]
+        dtype = _compact_target(series, dtype)
+        if dtype is not None and series.dtype != dtype:
+            compacted[column] = series.astype(dtype)
+    compacted.attrs["memory_savings"] = memory_savings(cleaned, compacted)
+    return compacted
+
+
+def memory_savings(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """Per-column memory of two versions of a frame, for columns whose dtype changed.
+
+    One row per column with ``dtype_before``, ``dtype_after``,
+    ``bytes_before``, ``bytes_after`` and ``bytes_saved`` (deep memory
+    usage), sorted by ``bytes_saved`` descending.
+    """
+    changed = [
+        column for column in after.columns
+        if column in before.columns and before[column].dtype != after[column].dtype
+    ]
+    bytes_before = before[changed].memory_usage(index=False, deep=True)
+    bytes_after = after[changed].memory_usage(index=False, deep=True)
+    report = pd.DataFrame(
+        {
+            "dtype_before": [str(before[column].dtype) for column in changed],
+            "dtype_after": [str(after[column].dtype) for column in changed],
+            "bytes_before": bytes_before.to_numpy(dtype=np.int64),
+            "bytes_after": bytes_after.to_numpy(dtype=np.int64),
+        },
+        index=pd.Index(changed, name="column", dtype=object),
+    )
+    report["bytes_saved"] = report["bytes_before"] - report["bytes_after"]
+    return report.sort_values("bytes_saved", ascending=False, kind="stable")
+
+
+
+# ── Packed QC ────────────────────────────────────────────────────────────
+#
+# Every numeric part carries three QC columns. Packed mode keeps one uint8
+# code per part (an index into QC_CODE_SIGNALS) plus row-level uint64 masks
+# of the passing parts, and derives the usability metrics from the masks.
+
+_QC_SIGNAL_COLUMNS = ("__qc_pass", "__qc_status", "__qc_reason")
+_QC_CODE_SUFFIX = "__qc_code"
+_QC_MASK_PREFIX = "qc_pass_mask_"
+_QC_PASS_CODE = QC_CODE_SIGNALS.index(("PASS", None))
+_BYTE_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+
+
+def _qc_codes(status: pd.Series, reason: pd.Series) -> np.ndarray:
+    codes = np.zeros(len(status), dtype=np.uint8)
+    present = status.notna().to_numpy()
+    reason = reason.astype(object).where(reason.notna(), None)
+    for code, signals in enumerate(QC_CODE_SIGNALS):
+        if signals is not None:
+            matched = present & status.eq(signals[0]).to_numpy(dtype=bool)
+            if signals[1] is None:
+                matched &= reason.isna().to_numpy()
+            else:
+                matched &= reason.eq(signals[1]).to_numpy(dtype=bool)
+            codes[matched] = code
+    unknown = present & (codes == 0)
+    if unknown.any():
+        example = (status[unknown].iloc[0], reason[unknown].iloc[0])
+        raise ValueError(f"{status.name}: QC signals {example!r} have no packed code")
+    return codes
+
+
+def _pass_masks(codes: np.ndarray) -> np.ndarray:
+    """Pack the ``codes == PASS`` matrix (rows x parts) into uint64 words per row."""
+    words = -(-codes.shape[1] // 64)
+    packed = np.packbits(codes == _QC_PASS_CODE, axis=1, bitorder="little")
+    padded = np.zeros((codes.shape[0], words * 8), dtype=np.uint8)
+    padded[:, : packed.shape[1]] = packed
+    return padded.view("<u8")
+
+
+def _add_packed_usability_metrics(packed: pd.DataFrame, masks: np.ndarray, total: int) -> pd.DataFrame:
+    for word in range(masks.shape[1]):
+        packed[f"{_QC_MASK_PREFIX}{word}"] = masks[:, word]
+    counts = _BYTE_POPCOUNT[masks.view(np.uint8)].sum(axis=1).astype(np.int64)
+    packed["row_has_any_usable_metric"] = (masks != 0).any(axis=1)
+    packed["usable_metric_count"] = counts
+    packed["usable_metric_fraction"] = counts / total
+    return packed
+
+
+def pack_qc(cleaned: pd.DataFrame) -> pd.DataFrame:
+    """Replace each part's QC triple with a uint8 ``__qc_code`` column.
+
+    ``<part>__qc_pass``, ``__qc_status`` and ``__qc_reason`` collapse into
+    ``<part>__qc_code`` (see QC_CODE_SIGNALS) at the position of
+    ``__qc_pass``. The usability metrics are rebuilt from
+    ``qc_pass_mask_<n>`` uint64 columns whose bit ``i % 64`` of word
+    ``i // 64`` is set when the i-th ``__qc_code`` column passed. Frames
+    without QC columns are returned unchanged; unpack_qc reverses it.
+    """
+    pass_columns = [column for column in cleaned.columns if column.endswith("__qc_pass")]
+    if not pass_columns:
+        return cleaned
+    packed_columns: dict[str, object] = {}
+    for column in cleaned.columns:
+        if column.endswith("__qc_pass"):
+            base = column[: -len("__qc_pass")]
+            packed_columns[base + _QC_CODE_SUFFIX] = _qc_codes(
+                cleaned[base + "__qc_status"], cleaned[base + "__qc_reason"]
+            )
+        elif not column.endswith(_QC_SIGNAL_COLUMNS[1:]) and column not in _USABILITY_DTYPES:
+            packed_columns[column] = cleaned[column]
+    packed = pd.DataFrame(packed_columns, index=cleaned.index)
+    code_columns = [base[: -len("__qc_pass")] + _QC_CODE_SUFFIX for base in pass_columns]
+    codes = packed[code_columns].to_numpy(dtype=np.uint8)
+    return _add_packed_usability_metrics(packed, _pass_masks(codes), len(code_columns))
+
+
+def decode_qc_codes(codes: pd.Series) -> pd.DataFrame:
+    """Decode a ``__qc_code`` column into ``qc_pass``, ``qc_status`` and ``qc_reason``.
+
+    Code 0 (part absent) decodes to nulls in all three columns.
+    """
+    values = codes.to_numpy(dtype=np.uint8)
+    if values.size and values.max() >= len(QC_CODE_SIGNALS):
+        raise ValueError(f"{codes.name}: unknown packed QC code {int(values.max())}")
+    signals = [(None, None, None)] + [
+        (status == "PASS", status, reason) for status, reason in QC_CODE_SIGNALS[1:]
+    ]
+    qc_pass, qc_status, qc_reason = (
+        np.array([signal[i] for signal in signals], dtype=object)[values] for i in range(3)
+    )
+    if (values != 0).all():
+        qc_pass = qc_pass.astype(bool)
+    return pd.DataFrame(
+        {
+            "qc_pass": qc_pass,
+            "qc_status": pd.Categorical(qc_status, dtype=_QC_STATUS_DTYPE),
+            "qc_reason": pd.Categorical(qc_reason, dtype=_QC_REASON_DTYPE),
+        },
+        index=codes.index,
+    )
+
+
+def unpack_qc(packed: pd.DataFrame) -> pd.DataFrame:
+    """Restore the ``__qc_pass``/``__qc_status``/``__qc_reason`` columns of pack_qc output.
+
+    Each ``__qc_code`` column is decoded in place, the ``qc_pass_mask_<n>``
+    columns are dropped and the usability metrics are recomputed from the
+    decoded pass flags.
+    """
+    columns: dict[str, object] = {}
+    for column in packed.columns:
+        if column.endswith(_QC_CODE_SUFFIX):
+            base = column[: -len(_QC_CODE_SUFFIX)]
+            decoded = decode_qc_codes(packed[column])
+            for suffix in _QC_SIGNAL_COLUMNS:
+                columns[base + suffix] = decoded[suffix[2:]]
+        elif not column.startswith(_QC_MASK_PREFIX) and column not in _USABILITY_DTYPES:
+            columns[column] = packed[column]
+    return _add_usability_metrics(pd.DataFrame(columns, index=packed.index))
+
+
+
+# ── Long format ──────────────────────────────────────────────────────────
+#
+# Most additional-data families are null in nearly every row, yet the wide
+# frame holds a dense column for each of their parts and QC signals. The
+# long format has one row per observed part instead: each identifier column
+# is parsed over its non-null rows only and never joined into a wide frame.
+
+LONG_FORMAT_DTYPES: dict[str, str] = {
+    "station_id": "str",
+    "timestamp": "datetime64[us, UTC]",
+    "identifier": "str",
+    "part": "int8",
+    "value": "float64",
+    "value_text": "str",
+    "quality": "str",
+    "qc_code": "uint8",
+}
+
+
+def _long_parts(plan: ParserPlan) -> list[tuple[int, str, str | None, str | None]]:
+    """``(part, value column, quality column, QC prefix)`` of each value-bearing part."""
+    if plan.value_quality:
+        return [(1, plan.value_key, plan.quality_key, plan.identifier)]
+    parts = []
+    for part in plan.parts.values():
+        if part.rule.kind == "quality":
+            continue
+        quality = plan.part_key(part.quality_part) if part.quality_part is not None else None
+        parts.append((part.index, part.key, quality, part.key if part.rule.kind == "numeric" else None))
+    return parts
+
+
+def _is_text(series: pd.Series) -> bool:
+    return pd.api.types.infer_dtype(series, skipna=True) in ("string", "empty")
+
+
+def _split_values(series: pd.Series) -> tuple[np.ndarray, pd.Series]:
+    """Numeric part values as floats; text values (raw fallbacks, letter codes) apart."""
+    if pd.api.types.is_float_dtype(series.dtype):
+        return series.to_numpy(dtype=np.float64), pd.Series(np.nan, index=series.index, dtype="str")
+    if _is_text(series):
+        return np.full(len(series), np.nan), series.astype("str")
+    # Object parts mix parsed numbers with raw-text fallbacks.
+    values = pd.to_numeric(series, errors="coerce")
+    text = series.where(values.isna() & series.notna())
+    return values.to_numpy(dtype=np.float64), text.astype("str")
+
+
+def _code_text(series: pd.Series) -> pd.Series:
+    """Quality codes as text; digit codes come out of the parser as floats."""
+    if pd.api.types.is_float_dtype(series.dtype):
+        return series.astype("Int64").astype("str")
+    if _is_text(series):
+        return series.astype("str")
+    codes = pd.to_numeric(series, errors="coerce")
+    digits = codes.astype("Int64").astype("str")
+    return series.astype(object).where(codes.isna(), digits).astype("str")
+
+
+def _long_observations(
+    raw: pd.Series,
+    identifier: str,
+    strict_mode: bool,
+    engine: ParseEngine,
+    stations: pd.Series,
+    timestamps: pd.Series,
+    rejected: np.ndarray,
+) -> pd.DataFrame | None:
+    present = raw.notna().to_numpy()
+    raw = raw[present]
+    if not _has_comma_payload(raw):
+        return None
+    expanded, report = _expand_column_task(
+        raw.to_numpy(dtype=object), rejected[present], identifier, strict_mode, engine, 0
+    )
+    report.log_summary()
+    expanded = _sweep_missing_sentinels(expanded)
+    null = pd.Series(np.nan, index=expanded.index, dtype=object)
+    frames = []
+    for part, value_key, quality_key, qc_prefix in _long_parts(get_parser_plan(identifier)):
+        value, value_text = _split_values(expanded.get(value_key, null))
+        quality = _code_text(expanded.get(quality_key, null) if quality_key is not None else null)
+        qc_code = np.zeros(len(expanded), dtype=np.uint8)
+        if qc_prefix is not None and f"{qc_prefix}__qc_status" in expanded:
+            qc_code = _qc_codes(expanded[f"{qc_prefix}__qc_status"], expanded[f"{qc_prefix}__qc_reason"])
+        observed = (~np.isnan(value) | value_text.notna() | quality.notna()).to_numpy() | (qc_code != 0)
+        frames.append(
+            pd.DataFrame(
+                {
+                    "station_id": stations.to_numpy()[present][observed],
+                    "timestamp": timestamps.to_numpy()[present][observed],
+                    "identifier": identifier,
+                    "part": part,
+                    "value": value[observed],
+                    "value_text": value_text.to_numpy()[observed],
+                    "quality": quality.to_numpy()[observed],
+                    "qc_code": qc_code[observed],
+                }
+            )
+        )
+    return pd.concat(frames, ignore_index=True) if frames else None
+
+
+def _rejected_raw_lines(df: pd.DataFrame) -> np.ndarray:
+    """Rows whose raw_line fails the control-header or record-length checks."""
+    raw_line_col = "raw_line" if "raw_line" in df.columns else ("RAW_LINE" if "RAW_LINE" in df.columns else None)
+    if raw_line_col is None:
+        return np.zeros(len(df), dtype=bool)
+    control_error, mismatch_mask = _validate_raw_lines(df[raw_line_col])
+    rejected = (control_error.notna() | mismatch_mask).to_numpy(dtype=bool)
+    if rejected.any():
+        logger.warning(f"[PARSE_STRICT] Rejected {int(rejected.sum())} record(s) failing raw_line checks")
+    return rejected
+
+
+def _long_identifiers(columns: Iterable[str], strict_mode: bool) -> list[str]:
+    return [column for column in columns if column != "ADD" and _expands_identifier(column, strict_mode)]
+
+
+def clean_noaa_long(
+    df: pd.DataFrame,
+    strict_mode: bool = True,
+    engine: ParseEngine = "vectorized",
+    identifiers: Iterable[str] | None = None,
+    station_id: str | None = None,
+) -> pd.DataFrame:
+    """Clean ``df`` into long format: one row per observed part of each identifier.
+
+    Columns (see LONG_FORMAT_DTYPES): ``station_id`` (STATION, or
+    ``station_id`` when given), ``timestamp`` (DATE in UTC), ``identifier``,
+    ``part`` (FieldRule part index, 1 for value/quality fields), ``value``
+    (numeric value after scaling and sentinel removal), ``value_text`` (parts
+    whose value is text, such as letter codes), ``quality`` (the part's
+    quality flag) and ``qc_code`` (packed QC code, see QC_CODE_SIGNALS; 0
+    for parts without QC signals). Quality parts are folded into the
+    ``quality`` of the parts they govern, and parts with nothing observed
+    are left out.
+
+    Each identifier column is parsed over its non-null rows only, with the
+    same gates and engines as clean_noaa_dataframe, and the wide frame is
+    never built. Records whose ``raw_line`` fails the control-header or
+    record-length checks are rejected as in clean_noaa_dataframe and
+    contribute no rows. Rows are sorted by identifier, then timestamp.
+    """
+    if identifiers is not None:
+        df = df[select_identifier_columns(df.columns, identifiers)]
+    if station_id is not None or "STATION" not in df.columns:
+        stations = pd.Series(station_id, index=df.index, dtype="str")
+    else:
+        stations = df["STATION"].astype("str")
+    if "DATE" in df.columns:
+        timestamps = pd.to_datetime(df["DATE"], errors="coerce", utc=True, format="ISO8601")
+    else:
+        timestamps = pd.Series(pd.NaT, index=df.index, dtype=LONG_FORMAT_DTYPES["timestamp"])
+    rejected = _rejected_raw_lines(df)
+    frames = [
+        _long_observations(df[column], column, strict_mode, engine, stations, timestamps, rejected)
+        for column in _long_identifiers(df.columns, strict_mode)
+    ]
+    frames = [frame for frame in frames if frame is not None]
+    if not frames:
+        return pd.DataFrame(
+            {column: pd.Series(dtype=dtype) for column, dtype in LONG_FORMAT_DTYPES.items()}
+        )
+    long = pd.concat(frames, ignore_index=True).astype(LONG_FORMAT_DTYPES)
+    return long.sort_values(["identifier", "timestamp"], kind="stable", ignore_index=True)
+
+
+def _clean_frame(
+    df: pd.DataFrame,
+    keep_raw: bool,
+    strict_mode: bool,
+    engine: ParseEngine,
+    log_examples: int,
+    workers: int | None,
+    parse_columns: dict[str, bool] | None = None,
+    drop_add: bool | None = None,
+    finalize: bool = True,
+) -> tuple[pd.DataFrame, ParseReport]:
+    """Body of clean_noaa_dataframe for one frame or row shard.
+
+    ``parse_columns`` and ``drop_add`` carry decisions made on the full frame
+    so every shard expands the same columns; columns missing from
+    ``parse_columns`` (the REM-derived ones) are sampled locally. Shards are
+    cleaned with ``finalize=False`` and keep internal column names until
+    they are stitched.
+    """
+    report = ParseReport(max_examples=log_examples)
     cleaned = df.copy()
     rejected_mask = pd.Series(False, index=cleaned.index)
     raw_line_col = "raw_line" if "raw_line" in cleaned.columns else ("RAW_LINE" if "RAW_LINE" in cleaned.columns else None)
     if raw_line_col is not None:
         cleaned["__parse_error"] = pd.Series(pd.NA, index=cleaned.index, dtype="object")
 
-        control_error = cleaned[raw_line_col].apply(_validate_control_header)
+        control_error, mismatch_mask = _validate_raw_lines(cleaned[raw_line_col])
         control_error_mask = control_error.notna()
         if control_error_mask.any():
             rejected_mask = rejected_mask | control_error_mask
@@ -1114,8 +3202,10 @@ def clean_noaa_dataframe(
                 logger.warning(
                     f"[PARSE_STRICT] Rejected {int(error_count)} record(s): {error_name}"
                 )
+                report.record(
+                    raw_line_col, None, "control_header", str(error_name), count=int(error_count)
+                )
 
-        mismatch_mask = cleaned[raw_line_col].apply(_record_length_mismatch)
         if mismatch_mask.any():
             rejected_mask = rejected_mask | mismatch_mask
             no_prior_error = mismatch_mask & cleaned["__parse_error"].isna()
@@ -1123,27 +3213,22 @@ def clean_noaa_dataframe(
             logger.warning(
                 f"[PARSE_STRICT] Rejected {int(mismatch_mask.sum())} record(s): record_length_mismatch"
             )
+            report.record(
+                raw_line_col, None, "record_length_mismatch", "record_length_mismatch",
+                count=int(mismatch_mask.sum()),
+            )
 
     if "ADD" in cleaned.columns:
-        add_series = cleaned["ADD"].astype(str).str.strip().str.upper()
-        add_mask = add_series.replace("", pd.NA).dropna().eq("ADD")
-        if add_mask.empty or add_mask.all():
+        if _add_marker_redundant(cleaned["ADD"]) if drop_add is None else drop_add:
             cleaned = cleaned.drop(columns=["ADD"])
 
     # Priority parsing: handle REM before generic expansion to preserve typed parsing (step 2)
     processed_columns = set()
     if "REM" in cleaned.columns:
-        remark_types = []
-        remark_texts = []
-        for value in cleaned["REM"]:
-            remark_type, remark_text = _parse_remark(value)
-            remark_types.append(remark_type)
-            remark_texts.append(remark_text)
-        cleaned["REM__type"] = remark_types
-        cleaned["REM__text"] = remark_texts
+        cleaned["REM__type"], cleaned["REM__text"] = _parse_remark_column(cleaned["REM"])
         processed_columns.add("REM")
 
-    expansion_frames: list[pd.DataFrame] = []
+    expansion_columns: list[str] = []
 
     for column in cleaned.columns:
         # Skip columns already processed by priority parsing
@@ -1159,6 +3244,10 @@ def clean_noaa_dataframe(
                 logger.warning(
                     f"[PARSE_STRICT] Skipping malformed section identifier token: {column}"
                 )
+                report.record(
+                    column, None, "malformed_section_identifier", "column skipped",
+                    count=int(cleaned[column].notna().sum()),
+                )
                 continue
 
             known_identifier = (
@@ -1169,65 +3258,116 @@ def clean_noaa_dataframe(
             if not known_identifier:
             # Skip expansion for unknown identifiers, keep raw column
                 logger.warning(f"[PARSE_STRICT] Skipping unknown identifier: {column}")
+                report.record(
+                    column, None, "unknown_identifier", "column skipped",
+                    count=int(cleaned[column].notna().sum()),
+                )
                 continue
 
-        series = cleaned[column]
-        if not pd.api.types.is_object_dtype(series) and not pd.api.types.is_string_dtype(series):
-            continue
-        sample = series.dropna().astype(str).head(200)
-        if sample.empty or not _should_parse_column(sample):
+        parse = parse_columns.get(column) if parse_columns is not None else None
+        if not (_has_comma_payload(cleaned[column]) if parse is None else parse):
             continue
 
-        parsed_rows = []
-        for row_idx, value in series.fillna("").astype(str).items():
-            if rejected_mask.loc[row_idx]:
-                parsed_rows.append({})
-                continue
-            if value == "":
-                parsed_rows.append({})
-                continue
-            payload = clean_value_quality(value, column, strict_mode=strict_mode)
-            parsed_rows.append(payload)
+        expansion_columns.append(column)
+
+    rejected = rejected_mask.to_numpy(dtype=bool)
+    tasks = [
+        (
+            cleaned[column].to_numpy(dtype=object),
+            rejected,
+            column,
+            strict_mode,
+            engine,
+            log_examples,
+        )
+        for column in expansion_columns
+    ]
+    if workers is not None and workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            results = list(pool.map(_expand_column_task, *zip(*tasks)))
+    else:
+        results = [_expand_column_task(*task) for task in tasks]
 
-        expanded = pd.DataFrame(parsed_rows, index=cleaned.index)
+    expansion_frames: list[pd.DataFrame] = []
+    for expanded, column_report in results:
+        expanded.index = cleaned.index
+        column_report.log_summary()
+        report.merge(column_report)
         expansion_frames.append(expanded)
-        if not keep_raw:
-            cleaned = cleaned.drop(columns=[column])
+    if not keep_raw:
+        cleaned = cleaned.drop(columns=expansion_columns)
 
     if expansion_frames:
         cleaned = pd.concat([cleaned] + expansion_frames, axis=1)
 
     # QNN parsing (REM already handled in priority parsing above)
     if "QNN" in cleaned.columns:
-        qnn_elements = []
-        qnn_flags = []
-        qnn_values = []
-        for value in cleaned["QNN"]:
-            element_ids, source_flags, data_values = _parse_qnn(value)
-            qnn_elements.append(element_ids)
-            qnn_flags.append(source_flags)
-            qnn_values.append(data_values)
-        cleaned["QNN__elements"] = qnn_elements
-        cleaned["QNN__source_flags"] = qnn_flags
-        cleaned["QNN__data_values"] = qnn_values
+        (
+            cleaned["QNN__elements"],
+            cleaned["QNN__source_flags"],
+            cleaned["QNN__data_values"],
+        ) = _parse_qnn_column(cleaned["QNN"])
+
+    cleaned = _sweep_missing_sentinels(cleaned)
+    cleaned = _normalize_control_fields(cleaned)
 
+    if not finalize:
+        return cleaned, report
+    return _finalize_columns(cleaned), report
+
+
+# _is_missing_numeric as a regex: only 9s once "." and "+" are removed, at least two of them.
+_MISSING_NUMERIC_PATTERN = r"^[+.]*9[+.]*9[+.9]*$"
+
+
+def _sweep_missing_sentinels(cleaned: pd.DataFrame) -> pd.DataFrame:
+    """Null the all-nines sentinels left in text columns after expansion.
+
+    Only columns allowed by can_hold_missing_sentinel are scanned. Other
+    object columns get the same dtype inference as the scanned ones, and
+    Arrow string columns without sentinels are left untouched.
+    """
+    updates: dict[str, pd.Series] = {}
     for column in cleaned.columns:
         series = cleaned[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            continue
         if not pd.api.types.is_object_dtype(series) and not pd.api.types.is_string_dtype(series):
             continue
-        cleaned[column] = series.apply(
-            lambda value: None
-            if isinstance(value, str) and _is_missing_numeric(value)
-            else value
-        )
+        scan = can_hold_missing_sentinel(column)
+        arrow_text = series.dtype == ARROW_STRING_DTYPE
+        sentinels = np.zeros(0, dtype=np.int64)
+        if scan or arrow_text:
+            values, positions = _column_text(series)
+            if scan:
+                matched = pc.match_substring_regex(values, _MISSING_NUMERIC_PATTERN)
+                sentinels = positions[matched.to_numpy(zero_copy_only=False)]
+        if not len(sentinels):
+            if arrow_text and (series.empty or len(positions)):
+                continue
+            if pd.api.types.is_object_dtype(series):
+                inferred = series.infer_objects()
+                if inferred.dtype != series.dtype:
+                    updates[column] = inferred
+                continue
+        values = series.to_numpy(dtype=object, copy=True)
+        values[sentinels] = None
+        updates[column] = pd.Series(values, index=series.index).infer_objects()
+    for column, series in updates.items():
+        cleaned[column] = series
+    return cleaned
 
-    cleaned = _normalize_control_fields(cleaned)
 
+def _finalize_columns(cleaned: pd.DataFrame) -> pd.DataFrame:
+    """Rename to friendly columns and add row-level usability metrics."""
     rename_map = {col: to_friendly_column(col) for col in cleaned.columns}
     if any(key != value for key, value in rename_map.items()):
         cleaned = cleaned.rename(columns=rename_map)
+    return _add_usability_metrics(cleaned)
+
 
-    # Add row-level usability metrics based on QC columns
+def _add_usability_metrics(cleaned: pd.DataFrame) -> pd.DataFrame:
+    """Add row-level usability metrics based on the ``__qc_pass`` columns."""
     qc_pass_columns = [col for col in cleaned.columns if col.endswith("__qc_pass")]
     if qc_pass_columns:
         # Create row summaries
@@ -1239,5 +3379,166 @@ def clean_noaa_dataframe(
             if total_metrics > 0
             else 0.0
         )
-
     return cleaned
+
+
+# ── Row sharding ─────────────────────────────────────────────────────────
+#
+# Raw shards travel to workers as Arrow IPC streams: raw NOAA frames are text
+# columns that Arrow holds in contiguous buffers, which avoids pickling one
+# Python object per cell. Cleaned shards come back through the pool as
+# frames because their mixed-type object columns (numeric parts that fall
+# back to raw text, QNN lists) have no lossless Arrow representation.
+
+def _shard_payload(block: pd.DataFrame) -> bytes | pd.DataFrame:
+    try:
+        table = pa.Table.from_pandas(block, preserve_index=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return block
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _shard_from_payload(payload: bytes | pd.DataFrame, dtypes: pd.Series) -> pd.DataFrame:
+    if isinstance(payload, pd.DataFrame):
+        return payload
+    block = pa.ipc.open_stream(payload).read_all().to_pandas()
+    for column, dtype in dtypes.items():
+        if block[column].dtype != dtype:
+            block[column] = block[column].astype(dtype)
+    return block
+
+
+def _clean_shard_task(
+    payload: bytes | pd.DataFrame,
+    dtypes: pd.Series,
+    keep_raw: bool,
+    strict_mode: bool,
+    engine: ParseEngine,
+    log_examples: int,
+    parse_columns: dict[str, bool],
+    drop_add: bool | None,
+) -> tuple[pd.DataFrame, ParseReport]:
+    block = _shard_from_payload(payload, dtypes)
+    return _clean_frame(
+        block, keep_raw, strict_mode, engine, log_examples, None, parse_columns, drop_add,
+        finalize=False,
+    )
+
+
+def _merge_column_order(orders: list[list[str]]) -> list[str]:
+    """Union of column lists, inserting columns new to the union after their predecessor."""
+    merged: list[str] = []
+    known: set[str] = set()
+    for order in orders:
+        previous: str | None = None
+        for column in order:
+            if column not in known:
+                merged.insert(merged.index(previous) + 1 if previous is not None else 0, column)
+                known.add(column)
+            previous = column
+    return merged
+
+
+_QNN_OUTPUT_COLUMNS = ("QNN__elements", "QNN__source_flags", "QNN__data_values")
+
+
+def _expansion_source(column: str, sources: set[str]) -> str | None:
+    """Return the expanded source column that produced ``column`` (longest prefix wins)."""
+    if column in _QNN_OUTPUT_COLUMNS:
+        return None
+    parts = column.split("__")
+    for size in range(len(parts) - 1, 0, -1):
+        prefix = "__".join(parts[:size])
+        if prefix in sources:
+            return prefix
+    return None
+
+
+def _stitch_column_order(orders: list[list[str]], sources: list[str]) -> list[str]:
+    """Column order of an unsharded run, rebuilt from per-shard column lists.
+
+    A single pass lays out the input columns, then one block of expanded keys
+    per source column in source order (keys in first-appearance order), then
+    the QNN and other trailing columns.
+    """
+    source_set = set(sources)
+    heads: list[list[str]] = []
+    tails: list[list[str]] = []
+    blocks: dict[str, list[str]] = {source: [] for source in sources}
+    for order in orders:
+        head: list[str] = []
+        tail: list[str] = []
+        in_blocks = False
+        for column in order:
+            source = _expansion_source(column, source_set)
+            if source is not None:
+                in_blocks = True
+                if column not in blocks[source]:
+                    blocks[source].append(column)
+            else:
+                (tail if in_blocks else head).append(column)
+        heads.append(head)
+        tails.append(tail)
+    expanded = [column for source in sources for column in blocks[source]]
+    return _merge_column_order(heads) + expanded + _merge_column_order(tails)
+
+
+def _stitch_shards(frames: list[pd.DataFrame], sources: list[str]) -> pd.DataFrame:
+    """Concatenate cleaned shards under one schema, then rename and add usability metrics.
+
+    Columns absent from a shard are null for its rows. Columns whose dtype
+    differs between shards (e.g. a value column that was all-missing in one
+    shard) or that some shard lacks are re-inferred so they match an
+    unsharded run.
+    """
+    columns = _stitch_column_order([list(frame.columns) for frame in frames], sources)
+    stitched = pd.concat(frames, axis=0, sort=False).reindex(columns=columns)
+    for column in columns:
+        dtypes = [str(frame[column].dtype) for frame in frames if column in frame.columns]
+        if len(dtypes) < len(frames) or len(set(dtypes)) > 1:
+            stitched[column] = stitched[column].infer_objects()
+    return _finalize_columns(_qc_as_categories(stitched))
+
+
+def _clean_sharded(
+    df: pd.DataFrame,
+    shard_rows: int,
+    keep_raw: bool,
+    strict_mode: bool,
+    engine: ParseEngine,
+    log_examples: int,
+    workers: int | None,
+) -> tuple[pd.DataFrame, ParseReport]:
+    """Clean contiguous row blocks of ``df`` (in worker processes if requested) and stitch them."""
+    dtypes = df.dtypes
+    parse_columns = {column: _has_comma_payload(df[column]) for column in df.columns}
+    drop_add = _add_marker_redundant(df["ADD"]) if "ADD" in df.columns else None
+    tasks = [
+        (
+            _shard_payload(df.iloc[start : start + shard_rows]),
+            dtypes,
+            keep_raw,
+            strict_mode,
+            engine,
+            log_examples,
+            parse_columns,
+            drop_add,
+        )
+        for start in range(0, len(df), shard_rows)
+    ]
+    if workers is not None and workers > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            results = list(pool.map(_clean_shard_task, *zip(*tasks)))
+    else:
+        results = [_clean_shard_task(*task) for task in tasks]
+    report = ParseReport(max_examples=log_examples)
+    for _, shard_report in results:
+        report.merge(shard_report)
+    # Expansion runs over the input columns in order, then over the REM-derived
+    # columns that priority parsing appends.
+    sources = [column for column in df.columns if column != "REM" and parse_columns[column]]
+    sources += ["REM__type", "REM__text"]
+    return _stitch_shards([cleaned for cleaned, _ in results], sources), report
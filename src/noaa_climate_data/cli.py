@@ -8,7 +8,8 @@ from pathlib import Path
 
 import pandas as pd
 
-from .constants import DEFAULT_END_YEAR, DEFAULT_START_YEAR
+from .constants import DEFAULT_END_YEAR, DEFAULT_START_YEAR, MAX_DOWNLOAD_CONCURRENCY
+from .noaa_client import NoaaTransport, StationFileCache
 from .pipeline import (
     build_data_file_list,
     build_location_ids,
@@ -20,6 +21,32 @@ from .pipeline import (
 )
 
 
+def _identifier_list(value: str) -> list[str]:
+    return [token.strip().upper() for token in value.split(",") if token.strip()]
+
+
+def _print_transport_summary(transport: NoaaTransport) -> None:
+    summary = transport.summary()
+    transport.reset()
+    if summary.empty:
+        return
+    print("HTTP requests:")
+    print(summary.to_string())
+
+
+def _station_cache(cache_dir: Path | None) -> StationFileCache | None:
+    return StationFileCache(cache_dir) if cache_dir is not None else None
+
+
+def _print_cache_summary(cache: StationFileCache | None) -> None:
+    if cache is None:
+        return
+    print(
+        f"Cache {cache.cache_dir}: {cache.hits} hits, "
+        f"{cache.revalidated} revalidated, {cache.downloads} downloaded."
+    )
+
+
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="NOAA Global Hourly pipeline")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -97,13 +124,13 @@ def _parse_args() -> argparse.Namespace:
         "--checkpoint-every",
         type=int,
         default=100,
-        help="Write checkpoint copies every N locations",
+        help="Sync the station journal to disk every N locations",
     )
     location_parser.add_argument(
         "--checkpoint-dir",
         type=Path,
         default=None,
-        help="Directory to write checkpoint copies",
+        help="Directory for the append-only station journal",
     )
     location_parser.add_argument(
         "--start-year",
@@ -139,6 +166,21 @@ def _parse_args() -> argparse.Namespace:
         default=8.0,
         help="Maximum delay (seconds) for exponential backoff",
     )
+    location_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Stations to fetch metadata for at once "
+            f"(at most {MAX_DOWNLOAD_CONCURRENCY} requests in flight)"
+        ),
+    )
+    location_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Cache yearly station CSVs here and reuse them on later runs",
+    )
 
     process_parser = subparsers.add_parser(
         "process-location", help="Download and clean a station's data"
@@ -214,6 +256,36 @@ def _parse_args() -> argparse.Namespace:
         default=False,
         help="Disable strict parsing (allows unknown identifiers and malformed fields)",
     )
+    process_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for parallel column expansion (or row shards with --shard-rows)",
+    )
+    process_parser.add_argument(
+        "--shard-rows",
+        type=int,
+        default=None,
+        help="Clean contiguous blocks of this many rows independently (uses --workers)",
+    )
+    process_parser.add_argument(
+        "--identifiers",
+        type=_identifier_list,
+        default=None,
+        help="Comma-separated identifiers to clean (e.g. TMP,DEW,AA1); others are skipped",
+    )
+    process_parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=1,
+        help=f"Yearly CSVs to download at once (capped at {MAX_DOWNLOAD_CONCURRENCY})",
+    )
+    process_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Cache yearly station CSVs here and reuse them on later runs",
+    )
 
     pick_parser = subparsers.add_parser(
         "pick-location",
@@ -247,6 +319,18 @@ def _parse_args() -> argparse.Namespace:
         default=None,
         help="Random seed for station selection",
     )
+    pick_parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=1,
+        help=f"Yearly CSVs to download at once (capped at {MAX_DOWNLOAD_CONCURRENCY})",
+    )
+    pick_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Cache yearly station CSVs here and reuse them on later runs",
+    )
     pick_parser.add_argument(
         "--output-dir",
         type=Path,
@@ -282,6 +366,45 @@ def _parse_args() -> argparse.Namespace:
         default=None,
         help="Output directory for cleaned parquet (default: same as input)",
     )
+    clean_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for parallel column expansion (or row shards with --shard-rows)",
+    )
+    clean_parser.add_argument(
+        "--shard-rows",
+        type=int,
+        default=None,
+        help="Clean contiguous blocks of this many rows independently (uses --workers)",
+    )
+    clean_parser.add_argument(
+        "--identifiers",
+        type=_identifier_list,
+        default=None,
+        help="Comma-separated identifiers to clean (e.g. TMP,DEW,AA1); others are skipped",
+    )
+    clean_parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=100_000,
+        help="Rows cleaned and written per output row group (bounds peak memory)",
+    )
+    clean_parser.add_argument(
+        "--packed-qc",
+        action="store_true",
+        help="Write one uint8 QC code per part and row bitmasks instead of three QC columns",
+    )
+    clean_parser.add_argument(
+        "--long",
+        action="store_true",
+        help="Write LocationData_Long.parquet (one row per observed part) instead of the wide frame",
+    )
+    clean_parser.add_argument(
+        "--compact-dtypes",
+        action="store_true",
+        help="Write QC signals as categoricals/booleans and values as float32 where exact",
+    )
 
     aggregate_parser = subparsers.add_parser(
         "aggregate-parquet",
@@ -315,13 +438,16 @@ def main() -> None:
         run_dir.mkdir(parents=True, exist_ok=True)
         output_path = run_dir / "DataFileList.csv"
         counts_path = run_dir / "DataFileList_YEARCOUNT.csv"
-        file_list = build_data_file_list(
-            output_path,
-            sleep_seconds=args.sleep_seconds,
-            retries=args.retries,
-            backoff_base=args.backoff_base,
-            backoff_max=args.backoff_max,
-        )
+        with NoaaTransport() as transport:
+            file_list = build_data_file_list(
+                output_path,
+                sleep_seconds=args.sleep_seconds,
+                retries=args.retries,
+                backoff_base=args.backoff_base,
+                backoff_max=args.backoff_max,
+                transport=transport,
+            )
+        _print_transport_summary(transport)
         build_year_counts(file_list, counts_path, args.start_year, args.end_year)
         return
 
@@ -335,29 +461,37 @@ def main() -> None:
             raise FileNotFoundError(f"Missing {year_counts}")
         file_list = pd.read_csv(file_list_path) if file_list_path.exists() else None
         metadata_years = range(args.start_year, args.end_year + 1)
-        build_location_ids(
-            counts,
-            run_dir / "Stations.csv",
-            metadata_years=metadata_years,
-            file_list=file_list,
-            start_year=args.start_year,
-            end_year=args.end_year,
-            resume=args.resume,
-            start_index=args.start_index,
-            max_locations=args.max_locations,
-            checkpoint_every=args.checkpoint_every,
-            checkpoint_dir=args.checkpoint_dir,
-            sleep_seconds=args.sleep_seconds,
-            retries=args.retries,
-            backoff_base=args.backoff_base,
-            backoff_max=args.backoff_max,
-        )
+        cache = _station_cache(args.cache_dir)
+        with NoaaTransport() as transport:
+            build_location_ids(
+                counts,
+                run_dir / "Stations.csv",
+                metadata_years=metadata_years,
+                file_list=file_list,
+                start_year=args.start_year,
+                end_year=args.end_year,
+                resume=args.resume,
+                start_index=args.start_index,
+                max_locations=args.max_locations,
+                checkpoint_every=args.checkpoint_every,
+                checkpoint_dir=args.checkpoint_dir,
+                sleep_seconds=args.sleep_seconds,
+                retries=args.retries,
+                backoff_base=args.backoff_base,
+                backoff_max=args.backoff_max,
+                transport=transport,
+                cache=cache,
+                workers=args.workers,
+            )
+        _print_transport_summary(transport)
+        _print_cache_summary(cache)
         return
 
     if args.command == "process-location":
         output_dir: Path = args.output_dir
         output_dir.mkdir(parents=True, exist_ok=True)
         years = range(args.start_year, args.end_year + 1)
+        cache = _station_cache(args.cache_dir)
         outputs = process_location(
             args.file_name,
             years,
@@ -370,7 +504,13 @@ def main() -> None:
             sleep_seconds=args.sleep_seconds,
             add_unit_conversions=args.add_unit_conversions,
             strict_mode=not args.permissive,
+            workers=args.workers,
+            shard_rows=args.shard_rows,
+            identifiers=args.identifiers,
+            max_concurrency=args.max_concurrency,
+            cache=cache,
         )
+        _print_cache_summary(cache)
 
         outputs.raw.to_csv(output_dir / "LocationData_Raw.csv", index=False)
         outputs.cleaned.to_csv(output_dir / "LocationData_Cleaned.csv", index=False)
@@ -386,13 +526,17 @@ def main() -> None:
         if stations_csv is None:
             stations_csv = _latest_index_dir() / "Stations.csv"
         years = range(args.start_year, args.end_year + 1)
+        cache = _station_cache(args.cache_dir)
         pull_random_station_raw(
             stations_csv,
             years,
             output_dir,
             sleep_seconds=args.sleep_seconds,
             seed=args.seed,
+            max_concurrency=args.max_concurrency,
+            cache=cache,
         )
+        _print_cache_summary(cache)
         return
 
     if args.command == "clean-parquet":
@@ -405,6 +549,13 @@ def main() -> None:
             stations_csv=stations_csv,
             file_name=args.file_name,
             station_id=args.station_id,
+            workers=args.workers,
+            shard_rows=args.shard_rows,
+            identifiers=args.identifiers,
+            chunk_rows=args.chunk_rows,
+            packed_qc=args.packed_qc,
+            compact=args.compact_dtypes,
+            layout="long" if args.long else "wide",
         )
         return
 
@@ -4,9 +4,26 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 BASE_URL = "https://www.ncei.noaa.gov/data/global-hourly/access"
 
+# Politeness limit: HTTP requests to NCEI in flight at once across the whole
+# process, however many workers callers ask for.
+MAX_DOWNLOAD_CONCURRENCY = 4
+
+# Default size bound for the on-disk cache of yearly station CSVs (compressed).
+HTTP_CACHE_MAX_BYTES = 2 * 1024**3
+
+# Most recent requests a NoaaTransport keeps individually; older ones only
+# count towards its per-method totals.
+TRANSPORT_MAX_RECORDS = 1000
+
+# Metadata probes fetch only the start of a yearly CSV (header plus first row)
+# with a Range request, growing the range up to the maximum for long rows.
+METADATA_PROBE_BYTES = 4096
+METADATA_PROBE_MAX_BYTES = 65536
+
 QUALITY_FLAGS = {
     "0",
     "1",
@@ -391,6 +408,107 @@ ADDITIONAL_DATA_PREFIXES = {
     "AP",
 }
 
+# Fixed part widths (FLD LEN) of the additional-data elements in the fixed-width
+# ISD archive files, excluding the 3-character identifier. Two-letter keys cover
+# every member of a repeated family; exact identifiers take precedence (CO1 vs
+# CO2-CO9). EQD elements (Q01-N99) all share EQD_PART_WIDTHS.
+ADDITIONAL_DATA_PART_WIDTHS: dict[str, tuple[int, ...]] = {
+    "AA": (2, 4, 1, 1),
+    "AB1": (5, 1, 1),
+    "AC1": (1, 1, 1),
+    "AD1": (5, 1, 4, 4, 4, 1),
+    "AE1": (2, 1, 2, 1, 2, 1, 2, 1),
+    "AG1": (1, 3),
+    "AH": (3, 4, 1, 6, 1),
+    "AI": (3, 4, 1, 6, 1),
+    "AJ1": (4, 1, 1, 6, 1, 1),
+    "AK1": (4, 1, 6, 1),
+    "AL": (2, 3, 1, 1),
+    "AM1": (4, 1, 4, 4, 4, 1),
+    "AN1": (3, 4, 1, 1),
+    "AO": (2, 4, 1, 1),
+    "AP": (4, 1, 1),
+    "AT": (2, 2, 4, 1),
+    "AU": (1, 1, 2, 1, 1, 1, 1),
+    "AW": (2, 1),
+    "AX": (2, 1, 2, 1),
+    "AY": (1, 1, 2, 1),
+    "AZ": (1, 1, 2, 1),
+    "CB": (2, 6, 1, 1),
+    "CF": (4, 1, 1),
+    "CG": (6, 1, 1),
+    "CH": (2, 4, 1, 1, 4, 1, 1),
+    "CI1": (5, 1, 1, 5, 1, 1, 5, 1, 1, 5, 1, 1),
+    "CN1": (4, 1, 1, 4, 1, 1, 4, 1, 1),
+    "CN2": (5, 1, 1, 5, 1, 1, 2, 1, 1),
+    "CN3": (6, 1, 1, 6, 1, 1),
+    "CN4": (1, 1, 1, 4, 1, 1, 3, 1, 1, 3, 1, 1),
+    "CO1": (2, 3),
+    "CO": (3, 5),
+    "CR1": (5, 1, 1),
+    "CT": (5, 1, 1),
+    "CU": (5, 1, 1, 4, 1, 1),
+    "CV": (5, 1, 1, 4, 1, 1, 5, 1, 1, 4, 1, 1),
+    "CW1": (5, 1, 1, 5, 1, 1),
+    "CX": (6, 1, 1, 4, 1, 1, 4, 1, 1, 4, 1, 1),
+    "ED1": (2, 1, 4, 1),
+    "GA": (2, 1, 6, 1, 2, 1),
+    "GD": (1, 2, 1, 6, 1, 1),
+    "GE1": (1, 6, 6, 6),
+    "GF1": (2, 2, 1, 2, 1, 2, 1, 5, 1, 2, 1, 2, 1),
+    "GG": (2, 1, 5, 1, 2, 1, 2, 1),
+    "GH1": (5, 1, 1, 5, 1, 1, 5, 1, 1, 5, 1, 1),
+    "GJ1": (4, 1),
+    "GK1": (3, 1),
+    "GL1": (5, 1),
+    "GM1": (4, 4, 2, 1, 4, 2, 1, 4, 2, 1, 4, 1),
+    "GN1": (4, 4, 1, 4, 1, 4, 1, 4, 1, 3, 1),
+    "GO1": (4, 4, 1, 4, 1, 4, 1),
+    "GP1": (4, 4, 2, 3, 4, 2, 3, 4, 2, 3),
+    "GQ1": (4, 4, 1, 4, 1),
+    "GR1": (4, 4, 1, 4, 1),
+    "HL1": (3, 1),
+    "IA1": (2, 1),
+    "IA2": (3, 5, 1),
+    "IB1": (5, 1, 1, 5, 1, 1, 5, 1, 1, 4, 1, 1),
+    "IB2": (5, 1, 1, 4, 1, 1),
+    "IC1": (2, 4, 1, 1, 3, 1, 1, 4, 1, 1, 4, 1, 1),
+    "KA": (3, 1, 5, 1),
+    "KB": (3, 1, 5, 1),
+    "KC": (1, 1, 5, 6, 1),
+    "KD": (3, 1, 4, 1),
+    "KE1": (2, 1, 2, 1, 2, 1, 2, 1),
+    "KF1": (5, 1),
+    "KG": (3, 1, 5, 1, 1),
+    "MA1": (5, 1, 5, 1),
+    "MD1": (1, 1, 3, 1, 4, 1),
+    "ME1": (1, 4, 1),
+    "MF1": (5, 1, 5, 1),
+    "MG1": (5, 1, 5, 1),
+    "MH1": (5, 1, 5, 1),
+    "MK1": (5, 6, 1, 5, 6, 1),
+    "MV": (2, 1),
+    "MW": (2, 1),
+    "OA": (1, 2, 4, 1),
+    "OB": (3, 4, 1, 1, 3, 1, 1, 5, 1, 1, 5, 1, 1),
+    "OC1": (4, 1),
+    "OD": (1, 2, 3, 4, 1),
+    "OE": (1, 2, 5, 3, 4, 1),
+    "RH": (3, 1, 3, 1, 1),
+    "SA1": (4, 1),
+    "ST1": (1, 5, 1, 4, 1, 2, 1, 1, 1),
+    "UA1": (1, 2, 3, 1, 2, 1),
+    "UG1": (2, 3, 3, 1),
+    "UG2": (2, 3, 3, 1),
+    "WA1": (1, 3, 1, 1),
+    "WD1": (2, 3, 2, 1, 1, 1, 2, 1, 3, 3, 1),
+    "WG1": (2, 2, 2, 2, 2, 1),
+    "WJ1": (3, 5, 2, 2, 5, 1, 1),
+}
+EQD_PART_WIDTHS: tuple[int, ...] = (6, 1, 6)
+# Archive identifiers whose parsed column uses a different name.
+ARCHIVE_IDENTIFIER_COLUMNS: dict[str, str] = {"HL1": "HAIL"}
+
 DEFAULT_START_YEAR = 2000
 DEFAULT_END_YEAR = 2019
 
@@ -490,6 +608,20 @@ QC_REASON_ENUM = frozenset(
 #   - usable_metric_count: Integer - count of True *__qc_pass values
 #   - usable_metric_fraction: Float [0, 1] - usable_metric_count / total *__qc_pass columns
 USABILITY_METRIC_INDICATORS = ["qc_pass"]
+#
+# Packed QC codes (clean_noaa_dataframe(packed_qc=True)):
+# One uint8 __qc_code per part replaces the __qc_pass/__qc_status/__qc_reason
+# triple; the code indexes this table and 0 marks rows without the part. A
+# row-level qc_pass_mask_<n> bitmask (uint64) sets bit i for the i-th
+# __qc_code column (in column order) when that metric passed.
+QC_CODE_SIGNALS: tuple[tuple[str, str | None] | None, ...] = (
+    None,
+    ("PASS", None),
+    ("INVALID", "MALFORMED_TOKEN"),
+    ("INVALID", "BAD_QUALITY_CODE"),
+    ("MISSING", "SENTINEL_MISSING"),
+    ("INVALID", "OUT_OF_RANGE"),
+)
 
 
 FIELD_RULES: dict[str, FieldRule] = {
@@ -5240,6 +5372,27 @@ def get_token_width_rules(identifier: str, part: int) -> dict[str, int | re.Patt
     return result if result else None
 
 
+def get_archive_part_widths(identifier: str) -> tuple[int, ...] | None:
+    """Get the fixed part widths of an additional-data element in ISD archive records.
+
+    Args:
+        identifier: 3-character archive identifier (e.g., 'AA1', 'CO2', 'Q01')
+
+    Returns:
+        Tuple of part widths (excluding the identifier), or None if unknown
+    """
+    if len(identifier) != 3 or not identifier[2].isdigit():
+        return None
+    widths = ADDITIONAL_DATA_PART_WIDTHS.get(identifier)
+    if widths is not None:
+        return widths
+    if identifier[0] in "QPRCDN" and identifier[1:].isdigit() and identifier[1:] != "00":
+        return EQD_PART_WIDTHS
+    if identifier not in KNOWN_IDENTIFIERS:
+        return None
+    return ADDITIONAL_DATA_PART_WIDTHS.get(identifier[:2])
+
+
 def _build_known_identifiers() -> set[str]:
     """Build comprehensive set of all valid NOAA identifiers for allowlist (A1).
     
@@ -5275,6 +5428,214 @@ def _build_known_identifiers() -> set[str]:
 KNOWN_IDENTIFIERS: set[str] = _build_known_identifiers()
 
 
+# ── Compiled parser plans ────────────────────────────────────────────────
+#
+# Parsing re-resolves the same rule metadata for every cell (alias lookup,
+# EQD/repeated validation, prefix scan, width rules, quality sets). A
+# ParserPlan resolves all of it once per identifier; plans are compiled lazily
+# and cached in PARSER_PLANS so the cleaning hot path does one dict lookup.
+
+
+@dataclass(frozen=True)
+class SpecialCaseRule:
+    """Row-level override: when every (part, token) condition matches, part
+    ``target_part`` is emitted as ``value``. Tokens compare stripped and
+    upper-cased."""
+
+    conditions: tuple[tuple[int, str], ...]
+    target_part: int
+    value: object
+
+
+@dataclass(frozen=True)
+class PartParserPlan:
+    index: int
+    key: str
+    rule: FieldPartRule
+    token_width: int | None
+    token_pattern: re.Pattern[str] | None
+    quality_part: int | None
+    allowed_quality: set[str]  # allowed flags for the quality part governing this part
+    fixed_width: int | None  # additional-data digit width (AA-AP families)
+
+
+@dataclass(frozen=True)
+class ParserPlan:
+    identifier: str
+    rule: FieldRule | None
+    parts: dict[int, PartParserPlan]
+    section_token_valid: bool | None
+    eqd_valid: bool | None
+    repeated_valid: bool | None
+    expected_part_count: int | None
+    quality_part: int | None  # shared quality part index, if exactly one
+    allowed_quality: set[str]  # allowed flags for ``quality_part``
+    value_quality: bool  # 2-part payloads use the value/quality layout
+    value_allowed_quality: set[str]
+    value_key: str
+    quality_key: str
+    is_eqd: bool
+    variable_direction: SpecialCaseRule | None = None
+    calm: tuple[SpecialCaseRule, ...] = ()
+
+    def part_key(self, index: int) -> str:
+        part = self.parts.get(index)
+        return part.key if part is not None else f"{self.identifier}__part{index}"
+
+
+PARSER_PLANS: dict[str, ParserPlan] = {}
+
+_VARIABLE_DIRECTION_RULES: dict[str, SpecialCaseRule] = {
+    "WND": SpecialCaseRule(conditions=((1, "999"), (3, "V")), target_part=1, value=None),
+}
+_CALM_RULES: dict[str, SpecialCaseRule] = {
+    "WND": SpecialCaseRule(conditions=((3, "9"), (4, "0000")), target_part=3, value="C"),
+    "OD": SpecialCaseRule(conditions=((3, "999"), (4, "0000")), target_part=3, value=0.0),
+    "OE": SpecialCaseRule(conditions=((3, "00000"), (4, "999")), target_part=4, value=0.0),
+}
+
+
+def _additional_data_fixed_width(prefix: str, part_rule: FieldPartRule | None) -> int | None:
+    if part_rule is None or part_rule.kind != "numeric":
+        return None
+    if prefix[:2] not in ADDITIONAL_DATA_PREFIXES:
+        return None
+    if not part_rule.missing_values:
+        return None
+    lengths = {len(value) for value in part_rule.missing_values if value.isdigit()}
+    return next(iter(lengths)) if len(lengths) == 1 else None
+
+
+def _quality_set_for(rule: FieldRule | None, quality_part: int) -> set[str]:
+    if rule is None:
+        return QUALITY_FLAGS
+    quality_rule = rule.parts.get(quality_part)
+    if quality_rule and quality_rule.allowed_quality:
+        return quality_rule.allowed_quality
+    return QUALITY_FLAGS
+
+
+def _compile_parser_plan(identifier: str) -> ParserPlan:
+    rule = get_field_rule(identifier)
+    parts: dict[int, PartParserPlan] = {}
+    for index, part_rule in sorted(rule.parts.items()) if rule else ():
+        quality_part = part_rule.quality_part
+        parts[index] = PartParserPlan(
+            index=index,
+            key=f"{identifier}__part{index}",
+            rule=part_rule,
+            token_width=part_rule.token_width,
+            token_pattern=part_rule.token_pattern,
+            quality_part=quality_part,
+            allowed_quality=(
+                _quality_set_for(rule, quality_part) if quality_part is not None else QUALITY_FLAGS
+            ),
+            fixed_width=_additional_data_fixed_width(identifier, part_rule),
+        )
+
+    quality_parts = {part.quality_part for part in parts.values() if part.quality_part is not None}
+    quality_part = next(iter(quality_parts)) if len(quality_parts) == 1 else None
+
+    first = parts.get(1)
+    value_quality = rule is not None and len(rule.parts) == 1 and first is not None and first.quality_part is not None
+    value_allowed_quality = QUALITY_FLAGS
+    if first is not None and first.quality_part is not None:
+        value_allowed_quality = _quality_set_for(rule, first.quality_part)
+        if value_allowed_quality == QUALITY_FLAGS and first.rule.allowed_quality:
+            value_allowed_quality = first.rule.allowed_quality
+
+    calm = tuple(
+        special for family, special in _CALM_RULES.items()
+        if identifier == family or (len(family) == 2 and identifier.startswith(family))
+    )
+    return ParserPlan(
+        identifier=identifier,
+        rule=rule,
+        parts=parts,
+        section_token_valid=is_valid_section_identifier_token(identifier),
+        eqd_valid=is_valid_eqd_identifier(identifier),
+        repeated_valid=is_valid_repeated_identifier(identifier),
+        expected_part_count=len(rule.parts) if rule else None,
+        quality_part=quality_part,
+        allowed_quality=(
+            _quality_set_for(rule, quality_part) if quality_part is not None else QUALITY_FLAGS
+        ),
+        value_quality=value_quality,
+        value_allowed_quality=value_allowed_quality,
+        value_key=f"{identifier}__value",
+        quality_key=f"{identifier}__quality",
+        is_eqd=(
+            len(identifier) == 3 and identifier[0] in "QPRCDN" and identifier[1:].isdigit()
+        ),
+        variable_direction=_VARIABLE_DIRECTION_RULES.get(identifier),
+        calm=calm,
+    )
+
+
+def get_parser_plan(identifier: str) -> ParserPlan:
+    """Return the compiled ParserPlan for *identifier*, compiling it on first use.
+
+    Plans are also built for unknown identifiers (``rule`` is None) so that
+    permissive parsing and the strict identifier gates share one lookup.
+    """
+    plan = PARSER_PLANS.get(identifier)
+    if plan is None:
+        plan = _compile_parser_plan(identifier)
+        PARSER_PLANS[identifier] = plan
+    return plan
+
+
+def _is_float_token(token: str) -> bool:
+    try:
+        float(token.lstrip("+"))
+    except ValueError:
+        return False
+    return True
+
+
+def _part_output_dtype(part_rule: FieldPartRule) -> str:
+    """Parts come out numeric when the token parses as a number, else as text."""
+    if part_rule.kind == "numeric":
+        return "float64"
+    tokens = part_rule.allowed_values
+    if part_rule.kind == "quality":
+        tokens = part_rule.allowed_quality or QUALITY_FLAGS
+    if tokens and all(_is_float_token(token) for token in tokens):
+        return "float64"
+    return "object"
+
+
+@lru_cache(maxsize=None)
+def get_output_columns(identifier: str) -> tuple[tuple[str, str], ...]:
+    """Return the ``(internal column, pandas dtype)`` pairs *identifier* expands to.
+
+    Derived from the identifier's FieldRule in the order the parser emits
+    them: value/quality fields give ``__value``, ``__quality`` and the QC
+    triple; multi-part fields give ``__direction_variable`` (WND), one
+    ``__partN`` per rule part, the QC triple of each numeric part and the
+    shared ``__quality`` column. Empty for identifiers without a rule.
+    """
+    plan = get_parser_plan(identifier)
+    if plan.rule is None:
+        return ()
+    qc_columns = ("qc_pass", "object"), ("qc_status", "category"), ("qc_reason", "category")
+    if plan.value_quality:
+        columns = [(plan.value_key, "float64"), (plan.quality_key, "str")]
+        columns += [(f"{identifier}__{suffix}", dtype) for suffix, dtype in qc_columns]
+        return tuple(columns)
+    columns = []
+    if plan.variable_direction is not None:
+        columns.append((f"{identifier}__direction_variable", "object"))
+    for part in plan.parts.values():
+        columns.append((part.key, _part_output_dtype(part.rule)))
+    for part in plan.parts.values():
+        if part.rule.kind == "numeric":
+            columns += [(f"{part.key}__{suffix}", dtype) for suffix, dtype in qc_columns]
+    if plan.quality_part is not None:
+        columns.append((plan.quality_key, "str"))
+    return tuple(columns)
+
+
 # ── Column classification helpers ────────────────────────────────────────
 
 _EXPANDED_COL_RE = re.compile(r"^(?P<field>[A-Z][A-Z0-9]*)__(?P<suffix>.+)$")
@@ -6226,6 +6587,97 @@ _INTERNAL_PATTERNS: list[tuple[re.Pattern[str], str]] = [
 
 _INTERNAL_COLUMN_MAP = {v: k for k, v in FRIENDLY_COLUMN_MAP.items()}
 
+# The pattern lists above stay the source of truth. They are indexed once by
+# their literal structure -- (family, suffix) for internal names, the stem
+# before the trailing index for friendly names -- so a lookup only tries the
+# few patterns sharing that key, in their original first-match-wins order.
+# Patterns whose shape is not recognised are kept in a linear fallback list.
+_FRIENDLY_PATTERN_SHAPE = re.compile(
+    r"\^(?P<stem>[A-Z]+)(?:(?P<literal>\d+)|\(\?P<idx>(?P<index_pattern>[^()]+)\))?"
+    r"__(?P<suffix>[a-z0-9_]+)\$"
+)
+_FRIENDLY_COLUMN_SHAPE = re.compile(r"^(?P<stem>[A-Z]+)(?P<index>\d*)__(?P<suffix>[a-z0-9_]+)$")
+_INTERNAL_PATTERN_SHAPE = re.compile(
+    r"\^(?P<stem>[a-z0-9_]*?)(?:(?P<literal>\d+)|\(\?P<idx>(?P<index_pattern>[^()]+)\))?\$"
+)
+_INTERNAL_COLUMN_SHAPE = re.compile(r"^(?P<stem>.*?)(?P<index>\d*)$")
+
+COLUMN_NAME_CACHE_SIZE = 16384
+
+
+@dataclass(frozen=True)
+class _IndexedPattern:
+    order: int
+    literal: str  # literal index digits ("" when the pattern has no index)
+    index_pattern: re.Pattern[str] | None
+    template: str
+
+
+@dataclass(frozen=True)
+class _ColumnPatternIndex:
+    column_shape: re.Pattern[str]
+    by_key: dict[tuple[str, str | None], list[_IndexedPattern]]
+    fallback: list[tuple[int, re.Pattern[str], str]]
+
+    def lookup(self, col: str) -> str | None:
+        hit: tuple[int, str] | None = None
+        match = self.column_shape.match(col)
+        if match is not None:
+            key = (match.group("stem"), match.groupdict().get("suffix"))
+            index = match.group("index")
+            for entry in self.by_key.get(key, ()):
+                if entry.index_pattern is None:
+                    matched = index == entry.literal
+                else:
+                    matched = entry.index_pattern.fullmatch(index) is not None
+                if matched:
+                    hit = (entry.order, entry.template.format(idx=index))
+                    break
+        for order, pattern, template in self.fallback:
+            if hit is not None and order > hit[0]:
+                break
+            fallback_match = pattern.match(col)
+            if fallback_match:
+                return template.format(**fallback_match.groupdict())
+        return hit[1] if hit is not None else None
+
+
+def _build_column_pattern_index(
+    patterns: list[tuple[re.Pattern[str], str]],
+    pattern_shape: re.Pattern[str],
+    column_shape: re.Pattern[str],
+) -> _ColumnPatternIndex:
+    by_key: dict[tuple[str, str | None], list[_IndexedPattern]] = {}
+    fallback: list[tuple[int, re.Pattern[str], str]] = []
+    for order, (pattern, template) in enumerate(patterns):
+        shape = pattern_shape.fullmatch(pattern.pattern)
+        index_pattern = shape.group("index_pattern") if shape else None
+        if (
+            shape is None
+            or pattern.flags & ~re.UNICODE
+            or (index_pattern is not None and shape.group("stem")[-1:].isdigit())
+        ):
+            fallback.append((order, pattern, template))
+            continue
+        key = (shape.group("stem"), shape.groupdict().get("suffix"))
+        by_key.setdefault(key, []).append(
+            _IndexedPattern(
+                order=order,
+                literal=shape.group("literal") or "",
+                index_pattern=re.compile(index_pattern) if index_pattern is not None else None,
+                template=template,
+            )
+        )
+    return _ColumnPatternIndex(column_shape=column_shape, by_key=by_key, fallback=fallback)
+
+
+_FRIENDLY_PATTERN_INDEX = _build_column_pattern_index(
+    _FRIENDLY_PATTERNS, _FRIENDLY_PATTERN_SHAPE, _FRIENDLY_COLUMN_SHAPE
+)
+_INTERNAL_PATTERN_INDEX = _build_column_pattern_index(
+    _INTERNAL_PATTERNS, _INTERNAL_PATTERN_SHAPE, _INTERNAL_COLUMN_SHAPE
+)
+
 FIELD_REGISTRY: dict[str, FieldRegistryEntry] = {}
 
 
@@ -6237,26 +6689,22 @@ def _parse_expanded_col(col: str) -> tuple[str, str] | None:
     return None
 
 
+@lru_cache(maxsize=COLUMN_NAME_CACHE_SIZE)
 def to_friendly_column(col: str) -> str:
     mapped = FRIENDLY_COLUMN_MAP.get(col)
     if mapped:
         return mapped
-    for pattern, template in _FRIENDLY_PATTERNS:
-        match = pattern.match(col)
-        if match:
-            return template.format(**match.groupdict())
-    return col
+    mapped = _FRIENDLY_PATTERN_INDEX.lookup(col)
+    return mapped if mapped is not None else col
 
 
+@lru_cache(maxsize=COLUMN_NAME_CACHE_SIZE)
 def to_internal_column(col: str) -> str:
     mapped = _INTERNAL_COLUMN_MAP.get(col)
     if mapped:
         return mapped
-    for pattern, template in _INTERNAL_PATTERNS:
-        match = pattern.match(col)
-        if match:
-            return template.format(**match.groupdict())
-    return col
+    mapped = _INTERNAL_PATTERN_INDEX.lookup(col)
+    return mapped if mapped is not None else col
 
 
 def _internal_name(prefix: str, part_idx: int, suffix: str) -> str:
@@ -6326,6 +6774,29 @@ def is_categorical_column(col: str) -> bool:
     return False
 
 
+# CSV control columns whose FIELD_RULES entry is filed under another code.
+_CONTROL_COLUMN_CODES: dict[str, str] = {"QUALITY_CONTROL": "QC_PROCESS"}
+_SENTINEL_SUFFIX_RE = re.compile(r"^(?:value|quality|part\d+)$")
+
+
+@lru_cache(maxsize=COLUMN_NAME_CACHE_SIZE)
+def can_hold_missing_sentinel(col: str) -> bool:
+    """True if *col* (an internal column name) can hold all-nines missing sentinels.
+
+    That is a raw identifier or control column with a FIELD_RULES entry, or
+    the ``__value``/``__partN``/``__quality`` expansion of one. Free text
+    (NAME, REM, QNN and their derived columns) and the ``__qc_*`` columns
+    are excluded.
+    """
+    if get_field_rule(_CONTROL_COLUMN_CODES.get(col, col)) is not None:
+        return True
+    parsed = _parse_expanded_col(col)
+    if parsed is None:
+        return False
+    field_prefix, suffix = parsed
+    return _SENTINEL_SUFFIX_RE.match(suffix) is not None and get_field_rule(field_prefix) is not None
+
+
 def get_agg_func(col: str) -> str:
     """Return the preferred aggregation function name for *col*.
 
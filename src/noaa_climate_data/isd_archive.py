@@ -0,0 +1,286 @@
+"""Reader for NOAA's fixed-width ISD archive files (``USAF-WBAN-YEAR.gz``)."""
+
+from __future__ import annotations
+
+from collections import Counter
+import gzip
+import logging
+import mmap
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .arrow_utils import arrow_string_types
+from .constants import ARCHIVE_IDENTIFIER_COLUMNS, REM_TYPE_CODES, get_archive_part_widths
+
+logger = logging.getLogger(__name__)
+
+# Part 02 control fields as (column, start, stop) byte offsets. Coordinates and
+# elevation keep their fixed-width signed tokens, which cleaning normalizes.
+_CONTROL_FIELDS = (
+    ("SOURCE", 27, 28),
+    ("LATITUDE", 28, 34),
+    ("LONGITUDE", 34, 41),
+    ("ELEVATION", 41, 46),
+    ("REPORT_TYPE", 46, 51),
+    ("CALL_SIGN", 51, 56),
+    ("QUALITY_CONTROL", 56, 60),
+)
+# Part 03 mandatory data elements, in record order from byte 60.
+_MANDATORY_FIELDS = (
+    ("WND", (3, 1, 1, 4, 1)),
+    ("CIG", (5, 1, 1, 1)),
+    ("VIS", (6, 1, 1, 1)),
+    ("TMP", (5, 1)),
+    ("DEW", (5, 1)),
+    ("SLP", (5, 1)),
+)
+_MANDATORY_START = 60
+_MANDATORY_END = 105
+_REMARK_TYPES = np.array(sorted(code.encode() for code in REM_TYPE_CODES), dtype="S3")
+
+
+def _load_archive(source: str | Path | bytes) -> np.ndarray:
+    """Return the archive bytes as a uint8 array; plain files are memory-mapped."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = bytes(source)
+        if data[:2] == b"\x1f\x8b":
+            data = gzip.decompress(data)
+        return np.frombuffer(data, dtype=np.uint8)
+    path = Path(source)
+    with path.open("rb") as handle:
+        magic = handle.read(2)
+    if magic == b"\x1f\x8b":
+        with gzip.open(path, "rb") as handle:
+            return np.frombuffer(handle.read(), dtype=np.uint8)
+    if path.stat().st_size == 0:
+        return np.zeros(0, dtype=np.uint8)
+    with path.open("rb") as handle:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    return np.frombuffer(mapped, dtype=np.uint8)
+
+
+def _line_bounds(buffer: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Start and end (exclusive, without CR/LF) offsets of every non-empty line."""
+    newlines = np.flatnonzero(buffer == 0x0A)
+    starts = np.concatenate([[0], newlines + 1]).astype(np.int64)
+    ends = np.concatenate([newlines, [len(buffer)]]).astype(np.int64)
+    carriage = (ends > starts) & (buffer[np.maximum(ends - 1, 0)] == 0x0D) if len(buffer) else ends > starts
+    ends = ends - carriage
+    keep = ends > starts
+    return starts[keep], ends[keep]
+
+
+def _slices(buffer: np.ndarray, starts: np.ndarray, stops: np.ndarray) -> pa.Array:
+    """Gather ``buffer[starts[i]:stops[i]]`` for every i into one Arrow string array."""
+    lengths = np.maximum(stops - starts, 0)
+    offsets = np.zeros(len(starts) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    index = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1], dtype=np.int64)
+    values = pa.LargeBinaryArray.from_buffers(
+        pa.large_binary(),
+        len(starts),
+        [None, pa.py_buffer(offsets), pa.py_buffer(np.ascontiguousarray(buffer[index]))],
+    )
+    try:
+        return values.cast(pa.large_string())
+    except pa.ArrowInvalid:
+        return pa.array([value.decode("latin-1") for value in values.to_pylist()], type=pa.large_string())
+
+
+def _gather(buffer: np.ndarray, positions: np.ndarray, width: int) -> np.ndarray:
+    """Copy ``width`` bytes at each position into an (n, width) matrix.
+
+    Positions too close to the end of the buffer are clamped; callers mask
+    those rows out.
+    """
+    if len(buffer) < width:
+        return np.zeros((len(positions), width), dtype=np.uint8)
+    windows = np.lib.stride_tricks.sliding_window_view(buffer, width)
+    return windows[np.minimum(positions, len(buffer) - width)]
+
+
+def _tokens(buffer: np.ndarray, positions: np.ndarray, width: int) -> np.ndarray:
+    """Fixed-width byte tokens at ``positions`` as an ``S{width}`` array."""
+    return np.ascontiguousarray(_gather(buffer, positions, width)).view(f"S{width}").ravel()
+
+
+def _part_layout(widths: tuple[int, ...], start: int = 0) -> np.ndarray:
+    """Layout for comma-joining fixed-width parts that begin at column ``start`` (see _fixed_strings)."""
+    layout: list[int] = []
+    offset = start
+    for width in widths:
+        if layout:
+            layout.append(-ord(","))
+        layout.extend(range(offset, offset + width))
+        offset += width
+    return np.array(layout, dtype=np.int64)
+
+
+# DATE as YYYY-MM-DDTHH:MM:00 from the DATE and TIME control fields.
+_DATE_LAYOUT = np.array(
+    [15, 16, 17, 18, -ord("-"), 19, 20, -ord("-"), 21, 22, -ord("T"), 23, 24, -ord(":"), 25, 26]
+    + [-ord(":"), -ord("0"), -ord("0")],
+    dtype=np.int64,
+)
+
+
+def _fixed_strings(matrix: np.ndarray, layout: np.ndarray, valid: np.ndarray | None = None) -> pa.Array:
+    """Build one fixed-width string per row of a byte matrix.
+
+    Each ``layout`` entry is a column of ``matrix``, or a negated literal byte
+    (``-ord(",")``) to insert. Rows not ``valid`` are null.
+    """
+    literal = layout < 0
+    matrix = np.ascontiguousarray(matrix[:, np.maximum(layout, 0)])
+    matrix[:, literal] = -layout[literal]
+    offsets = np.arange(len(matrix) + 1, dtype=np.int64) * len(layout)
+    validity = None
+    if valid is not None and not valid.all():
+        validity = pa.py_buffer(np.packbits(valid, bitorder="little"))
+    values = pa.LargeBinaryArray.from_buffers(
+        pa.large_binary(), len(matrix), [validity, pa.py_buffer(offsets), pa.py_buffer(matrix)]
+    )
+    try:
+        return values.cast(pa.large_string())
+    except pa.ArrowInvalid:
+        return pa.array(
+            [None if value is None else value.decode("latin-1") for value in values.to_pylist()],
+            type=pa.large_string(),
+        )
+
+
+def _scatter(values: pa.Array, rows: np.ndarray, size: int) -> pa.Array:
+    """Place ``values`` at ``rows`` of a length-``size`` array; other rows are null."""
+    index = np.full(size, -1, dtype=np.int64)
+    index[rows] = np.arange(len(rows))
+    return values.take(pa.array(index, mask=index < 0))
+
+
+def _remark_ends(buffer: np.ndarray, positions: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Follow chained ``<type><length><text>`` remarks and return where each section ends."""
+    positions = positions.copy()
+    pending = np.arange(len(positions))
+    while len(pending):
+        at = positions[pending]
+        fits = at + 6 <= ends[pending]
+        pending, at = pending[fits], at[fits]
+        if not len(pending):
+            break
+        length_bytes = buffer[at[:, None] + np.arange(3, 6)]
+        is_remark = np.isin(_tokens(buffer, at, 3), _REMARK_TYPES) & (
+            (length_bytes >= 0x30) & (length_bytes <= 0x39)
+        ).all(axis=1)
+        pending, at, length_bytes = pending[is_remark], at[is_remark], length_bytes[is_remark]
+        length = (length_bytes.astype(np.int64) - 0x30) @ np.array([100, 10, 1])
+        positions[pending] = np.minimum(at + 6 + length, ends[pending])
+    return positions
+
+
+def read_isd_archive(source: str | Path | bytes, keep_raw_line: bool = False) -> pd.DataFrame:
+    """Read a fixed-width ISD archive file into the CSV access column layout.
+
+    ``source`` is a path to a ``USAF-WBAN-YEAR`` or ``USAF-WBAN-YEAR.gz`` file
+    (gzip is detected from the content) or the file's bytes. Uncompressed files
+    are memory-mapped. Control and mandatory fields are cut from fixed byte
+    offsets; additional-data elements are tokenized by their 3-character
+    identifier, one element position per round across all records, and emitted
+    as comma-joined parts in a column named after the identifier. ``REM`` holds
+    the remarks section and ``QNN`` the original-observation section, as in the
+    CSV files. Every column is a string column ready for
+    ``clean_noaa_dataframe``; ``keep_raw_line=True`` adds ``raw_line`` so the
+    control header and record length are validated during cleaning.
+    """
+    buffer = _load_archive(source)
+    starts, ends = _line_bounds(buffer)
+    size = len(starts)
+    lengths = ends - starts
+
+    head = _gather(buffer, starts, _MANDATORY_END)
+
+    def fixed(start: int, stop: int) -> pa.Array:
+        return _fixed_strings(head, np.arange(start, stop), lengths >= stop)
+
+    columns: dict[str, pa.Array] = {
+        "STATION": fixed(4, 15),
+        "DATE": _fixed_strings(head, _DATE_LAYOUT, lengths >= 27),
+    }
+    for name, start, stop in _CONTROL_FIELDS:
+        columns[name] = fixed(start, stop)
+    offset = _MANDATORY_START
+    for name, widths in _MANDATORY_FIELDS:
+        stop = offset + sum(widths)
+        columns[name] = _fixed_strings(head, _part_layout(widths, offset), lengths >= stop)
+        offset = stop
+
+    elements: dict[str, list[tuple[np.ndarray, pa.Array]]] = {}
+    skipped: Counter[str] = Counter()
+    cursor = np.minimum(starts + _MANDATORY_END, ends)
+    active = np.flatnonzero(cursor + 3 <= ends)
+    has_add = _tokens(buffer, cursor[active], 3) == b"ADD"
+    cursor[active[has_add]] += 3
+    active = np.flatnonzero(cursor + 3 <= ends)
+    while len(active):
+        tokens = _tokens(buffer, cursor[active], 3)
+        for token in np.unique(tokens):
+            rows = active[tokens == token]
+            identifier = token.decode("latin-1")
+            if identifier == "EQD":
+                cursor[rows] += 3
+                continue
+            if identifier in {"REM", "QNN"}:
+                body = cursor[rows] + 3
+                stop = _remark_ends(buffer, body, ends[rows]) if identifier == "REM" else ends[rows]
+                values = _slices(buffer, body, stop)
+                if identifier == "QNN":
+                    values = pc.binary_join_element_wise(
+                        pa.scalar("QNN", pa.large_string()), values, pa.scalar("", pa.large_string())
+                    )
+                elements.setdefault(identifier, []).append((rows, values))
+                cursor[rows] = stop
+                continue
+            widths = get_archive_part_widths(identifier)
+            fits = (
+                cursor[rows] + 3 + sum(widths) <= ends[rows]
+                if widths is not None
+                else np.zeros(len(rows), dtype=bool)
+            )
+            if not fits.all():
+                skipped[identifier] += int((~fits).sum())
+                cursor[rows[~fits]] = ends[rows[~fits]]
+                rows = rows[fits]
+            if len(rows):
+                values = _fixed_strings(
+                    _gather(buffer, cursor[rows] + 3, sum(widths)), _part_layout(widths)
+                )
+                column = ARCHIVE_IDENTIFIER_COLUMNS.get(identifier, identifier)
+                elements.setdefault(column, []).append((rows, values))
+                cursor[rows] += 3 + sum(widths)
+        active = active[cursor[active] + 3 <= ends[active]]
+
+    for identifier, count in sorted(skipped.items()):
+        logger.warning(
+            f"Stopped reading additional data at {count} record(s): "
+            f"unknown or truncated identifier {identifier!r}"
+        )
+
+    def element_order(column: str) -> tuple[int, str]:
+        if column == "REM":
+            return 1, column
+        if column == "QNN":
+            return 3, column
+        is_eqd = len(column) == 3 and column[0] in "QPRCDN" and column[1:].isdigit()
+        return (2 if is_eqd else 0), column
+
+    for column in sorted(elements, key=element_order):
+        chunks = elements[column]
+        rows = np.concatenate([chunk_rows for chunk_rows, _ in chunks])
+        values = pa.concat_arrays([chunk_values for _, chunk_values in chunks])
+        columns[column] = _scatter(values, rows, size)
+    if keep_raw_line:
+        columns["raw_line"] = _slices(buffer, starts, ends)
+
+    return pa.table(columns).to_pandas(types_mapper=arrow_string_types)
@@ -2,15 +2,30 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from io import BytesIO, StringIO
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Mapping, Sequence
 
+import gzip
+import json
+import os
+import threading
 import time
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 
-from .constants import BASE_URL
+from .constants import (
+    BASE_URL,
+    HTTP_CACHE_MAX_BYTES,
+    MAX_DOWNLOAD_CONCURRENCY,
+    METADATA_PROBE_BYTES,
+    METADATA_PROBE_MAX_BYTES,
+    TRANSPORT_MAX_RECORDS,
+)
 
 
 @dataclass(frozen=True)
@@ -22,6 +37,334 @@ class StationMetadata:
     file_name: str
 
 
+# Shared by every transport so that concurrent callers together stay within
+# MAX_DOWNLOAD_CONCURRENCY requests in flight. Only the request itself holds
+# a slot; pacing sleeps and parsing happen outside it.
+_REQUEST_SLOTS = threading.BoundedSemaphore(MAX_DOWNLOAD_CONCURRENCY)
+
+
+@dataclass(frozen=True)
+class RequestRecord:
+    method: str
+    url: str
+    status: int | None
+    bytes_received: int
+    seconds: float
+
+
+_SUMMARY_COLUMNS = ["requests", "errors", "bytes_received", "seconds"]
+
+
+class NoaaTransport:
+    """Pooled HTTP access to the NCEI access tree.
+
+    One ``requests.Session`` is shared by every call so TCP/TLS connections
+    are kept alive and reused; ``pool_size`` bounds the connections held per
+    host, which should cover the download concurrency in use. Every request
+    is counted towards per-method totals (see summary), and the latest
+    ``max_records`` are kept in ``records`` with their status, bytes
+    received and elapsed time (status is None when the request failed
+    before a response arrived). ``reset`` clears both.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 8,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 60.0,
+        session: requests.Session | None = None,
+        max_records: int = TRANSPORT_MAX_RECORDS,
+    ) -> None:
+        self.session = session if session is not None else requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.timeout = (connect_timeout, read_timeout)
+        self._records: deque[RequestRecord] = deque(maxlen=max_records)
+        self._totals: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> NoaaTransport:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.session.close()
+
+    @property
+    def records(self) -> list[RequestRecord]:
+        """The most recent requests, oldest first."""
+        with self._lock:
+            return list(self._records)
+
+    def reset(self) -> None:
+        """Forget the recorded requests and totals."""
+        with self._lock:
+            self._records.clear()
+            self._totals.clear()
+
+    def _record(
+        self,
+        method: str,
+        url: str,
+        status: int | None,
+        bytes_received: int,
+        started: float,
+    ) -> None:
+        record = RequestRecord(
+            method=method,
+            url=url,
+            status=status,
+            bytes_received=bytes_received,
+            seconds=time.perf_counter() - started,
+        )
+        error = status is None or status >= 400
+        with self._lock:
+            self._records.append(record)
+            totals = self._totals.setdefault(method, [0, 0, 0, 0.0])
+            totals[0] += 1
+            totals[1] += error
+            totals[2] += bytes_received
+            totals[3] += record.seconds
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+    ) -> requests.Response:
+        started = time.perf_counter()
+        with _REQUEST_SLOTS:
+            try:
+                response = self.session.request(
+                    method, url, headers=headers, timeout=self.timeout
+                )
+            except requests.RequestException:
+                self._record(method, url, None, 0, started)
+                raise
+        self._record(method, url, response.status_code, len(response.content), started)
+        return response
+
+    def head(self, url: str) -> requests.Response:
+        return self.request("HEAD", url)
+
+    def get_bytes(self, url: str) -> bytes:
+        response = self.request("GET", url)
+        response.raise_for_status()
+        return response.content
+
+    def get_text(self, url: str) -> str:
+        response = self.request("GET", url)
+        response.raise_for_status()
+        return response.text
+
+    def get_range(self, url: str, length: int) -> tuple[int, bytes]:
+        """GET the first ``length`` bytes of ``url`` with a ``Range`` header.
+
+        Returns the status and body. A 206 body is read to the end so the
+        connection goes back to the pool; a server that ignores the range and
+        answers 200 is cut off after ``length`` bytes.
+        """
+        started = time.perf_counter()
+        body = bytearray()
+        with _REQUEST_SLOTS:
+            try:
+                response = self.session.get(
+                    url,
+                    headers={"Range": f"bytes=0-{length - 1}"},
+                    timeout=self.timeout,
+                    stream=True,
+                )
+            except requests.RequestException:
+                self._record("GET", url, None, 0, started)
+                raise
+            with response:
+                if response.ok:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        body += chunk
+                        if response.status_code != 206 and len(body) >= length:
+                            break
+        self._record("GET", url, response.status_code, len(body), started)
+        return response.status_code, bytes(body[:length])
+
+    def summary(self) -> pd.DataFrame:
+        """Request count, errors, bytes and time per HTTP method since the last reset."""
+        with self._lock:
+            totals = {method: list(values) for method, values in sorted(self._totals.items())}
+        summary = pd.DataFrame.from_dict(totals, orient="index", columns=_SUMMARY_COLUMNS)
+        summary.index.name = "method"
+        summary = summary.astype({"requests": "int64", "errors": "int64", "bytes_received": "int64"})
+        summary["mean_ms"] = summary["seconds"] / summary["requests"] * 1000
+        return summary
+
+
+_DEFAULT_TRANSPORT: NoaaTransport | None = None
+_DEFAULT_TRANSPORT_LOCK = threading.Lock()
+
+
+def default_transport() -> NoaaTransport:
+    """Process-wide transport used when callers do not pass their own."""
+    global _DEFAULT_TRANSPORT
+    with _DEFAULT_TRANSPORT_LOCK:
+        if _DEFAULT_TRANSPORT is None:
+            _DEFAULT_TRANSPORT = NoaaTransport()
+        return _DEFAULT_TRANSPORT
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    etag: str | None
+    last_modified: str | None
+    content_length: int | None
+
+
+class StationFileCache:
+    """On-disk cache of yearly station CSVs keyed by (year, normalized name).
+
+    Bodies are stored gzip-compressed next to a JSON sidecar holding the
+    ``ETag``, ``Last-Modified`` and ``Content-Length`` they were served with.
+    Years before ``current_year`` are closed and never change, so their
+    entries are returned without contacting the server; newer years are
+    revalidated with a conditional GET and a 304 reuses the stored body.
+    Empty bodies are never stored, and an empty entry on disk is a miss.
+    Once the compressed bodies exceed ``max_bytes`` the least recently used
+    entries are evicted (file mtimes track use). The cache keeps a running
+    total of the body sizes, so the directory is only scanned on the first
+    store and when that total exceeds the cap.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int = HTTP_CACHE_MAX_BYTES,
+        current_year: int | None = None,
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.current_year = (
+            current_year if current_year is not None else datetime.now(timezone.utc).year
+        )
+        self.hits = 0
+        self.revalidated = 0
+        self.downloads = 0
+        self._lock = threading.Lock()
+        self._total_bytes: int | None = None
+
+    def _paths(self, year: int | str, file_name: str) -> tuple[Path, Path]:
+        stem = Path(normalize_station_file_name(file_name)).stem
+        year_dir = self.cache_dir / str(year)
+        return year_dir / f"{stem}.csv.gz", year_dir / f"{stem}.json"
+
+    def _load(self, year: int | str, file_name: str) -> tuple[bytes, CacheEntry] | None:
+        body_path, meta_path = self._paths(year, file_name)
+        try:
+            entry = CacheEntry(**json.loads(meta_path.read_text()))
+            body = gzip.decompress(body_path.read_bytes())
+            os.utime(body_path)
+        except (OSError, EOFError, TypeError, ValueError):
+            return None
+        if not body:
+            return None
+        if entry.content_length is not None and len(body) != entry.content_length:
+            return None
+        return body, entry
+
+    def _store(self, year: int | str, file_name: str, response: requests.Response) -> None:
+        body_path, meta_path = self._paths(year, file_name)
+        content_length = response.headers.get("Content-Length")
+        entry = CacheEntry(
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            content_length=(
+                int(content_length)
+                if content_length is not None and "Content-Encoding" not in response.headers
+                else None
+            ),
+        )
+        body = gzip.compress(response.content)
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._scan())
+            try:
+                replaced = body_path.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+            tmp_path = body_path.with_name(body_path.name + ".tmp")
+            tmp_path.write_bytes(body)
+            os.replace(tmp_path, body_path)
+            meta_path.write_text(json.dumps(asdict(entry)))
+            self._total_bytes += len(body) - replaced
+            if self._total_bytes > self.max_bytes:
+                self._evict(keep=body_path)
+
+    def _scan(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self.cache_dir.glob("*/*.csv.gz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self, keep: Path) -> None:
+        # Rescan rather than trust the running total, which does not see
+        # entries other processes added or removed.
+        entries = self._scan()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            path.with_name(path.name.removesuffix(".csv.gz") + ".json").unlink(missing_ok=True)
+            total -= size
+        self._total_bytes = total
+
+    def get(self, year: int | str, file_name: str) -> bytes | None:
+        """Return the cached body without any network access, if present."""
+        cached = self._load(year, file_name)
+        return None if cached is None else cached[0]
+
+    def fetch(
+        self,
+        year: int | str,
+        file_name: str,
+        url: str,
+        transport: NoaaTransport,
+    ) -> bytes:
+        """Return the body of ``url``, from the cache when it is still valid."""
+        cached = self._load(year, file_name)
+        if cached is not None and int(year) < self.current_year:
+            with self._lock:
+                self.hits += 1
+            return cached[0]
+        headers: dict[str, str] = {}
+        if cached is not None:
+            entry = cached[1]
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        response = transport.request("GET", url, headers=headers or None)
+        if cached is not None and response.status_code == 304:
+            with self._lock:
+                self.revalidated += 1
+            return cached[0]
+        response.raise_for_status()
+        if response.content:
+            self._store(year, file_name, response)
+        with self._lock:
+            self.downloads += 1
+        return response.content
+
+
 def fetch_station_metadata_for_years(
     file_name: str,
     years: Iterable[int],
@@ -29,8 +372,24 @@ def fetch_station_metadata_for_years(
     retries: int = 3,
     backoff_base: float = 0.5,
     backoff_max: float = 8.0,
+    transport: NoaaTransport | None = None,
+    cache: StationFileCache | None = None,
+    base_url: str = BASE_URL,
+    year_index: Mapping[str, Sequence[int]] | None = None,
 ) -> tuple[StationMetadata | None, int | None]:
-    """Fetch station metadata by trying multiple years in order."""
+    """Fetch station metadata by trying multiple years in order.
+
+    With a ``year_index`` (see ``build_station_year_index``) only the years in
+    ``years`` where the file is listed are probed, newest first; a station
+    missing from the index is not probed at all. Without one every year in
+    ``years`` is tried in the given order.
+    """
+    if year_index is not None:
+        listed = year_index.get(file_name)
+        if listed is None:
+            listed = year_index.get(normalize_station_file_name(file_name), ())
+        wanted = {int(year) for year in years}
+        years = [year for year in listed if year in wanted]
     for year in years:
         metadata = fetch_station_metadata(
             file_name,
@@ -38,6 +397,9 @@ def fetch_station_metadata_for_years(
             retries=retries,
             backoff_base=backoff_base,
             backoff_max=backoff_max,
+            transport=transport,
+            cache=cache,
+            base_url=base_url,
         )
         if metadata is not None:
             return metadata, int(year)
@@ -69,13 +431,14 @@ def _sleep_backoff(attempt: int, backoff_base: float, backoff_max: float) -> Non
 
 def _read_html_with_retries(
     url: str,
+    transport: NoaaTransport,
     retries: int,
     backoff_base: float,
     backoff_max: float,
 ) -> list[pd.DataFrame]:
     for attempt in range(retries + 1):
         try:
-            return pd.read_html(url)
+            return pd.read_html(StringIO(transport.get_text(url)))
         except Exception:
             if attempt >= retries:
                 return []
@@ -83,30 +446,57 @@ def _read_html_with_retries(
     return []
 
 
-def _read_csv_head_with_retries(
+def _probe_csv_head(
     url: str,
+    transport: NoaaTransport,
     retries: int,
     backoff_base: float,
     backoff_max: float,
+    probe_bytes: int = METADATA_PROBE_BYTES,
 ) -> pd.DataFrame | None:
-    for attempt in range(retries + 1):
+    """Read the header and first data row of ``url`` with range requests.
+
+    A 404 (no file for that year) or 416 (empty file) ends the probe with no
+    retry. The range grows when the first row does not fit, up to
+    METADATA_PROBE_MAX_BYTES; other failures are retried with backoff.
+    """
+    length = probe_bytes
+    attempt = 0
+    while True:
         try:
-            return pd.read_csv(url, nrows=1, dtype=str, low_memory=False)
-        except Exception:
-            if attempt >= retries:
+            status, body = transport.get_range(url, length)
+        except requests.RequestException:
+            status, body = None, b""
+        if status in (404, 416):
+            return None
+        if status in (200, 206):
+            lines = body.split(b"\n", 2)
+            if len(lines) > 2 or len(body) < length:
+                head = b"\n".join(lines[:2])
+                try:
+                    return pd.read_csv(BytesIO(head), nrows=1, dtype=str, low_memory=False)
+                except (ValueError, pd.errors.ParserError):
+                    return None
+            if length >= METADATA_PROBE_MAX_BYTES:
                 return None
-            _sleep_backoff(attempt, backoff_base, backoff_max)
-    return None
+            length = min(length * 4, METADATA_PROBE_MAX_BYTES)
+            continue
+        if attempt >= retries:
+            return None
+        _sleep_backoff(attempt, backoff_base, backoff_max)
+        attempt += 1
 
 
 def get_years(
     retries: int = 3,
     backoff_base: float = 0.5,
     backoff_max: float = 8.0,
+    transport: NoaaTransport | None = None,
 ) -> list[str]:
     """Fetch available year directories from NOAA access page."""
     tables = _read_html_with_retries(
         BASE_URL + "/",
+        transport or default_transport(),
         retries=retries,
         backoff_base=backoff_base,
         backoff_max=backoff_max,
@@ -127,11 +517,13 @@ def get_file_list_for_year(
     retries: int = 3,
     backoff_base: float = 0.5,
     backoff_max: float = 8.0,
+    transport: NoaaTransport | None = None,
 ) -> list[str]:
     """Fetch available CSV filenames for a given year directory."""
     url = f"{BASE_URL}/{year}/"
     tables = _read_html_with_retries(
         url,
+        transport or default_transport(),
         retries=retries,
         backoff_base=backoff_base,
         backoff_max=backoff_max,
@@ -157,6 +549,7 @@ def build_file_list(
     retries: int = 3,
     backoff_base: float = 0.5,
     backoff_max: float = 8.0,
+    transport: NoaaTransport | None = None,
 ) -> pd.DataFrame:
     """Build a dataframe with YEAR and FileName columns."""
     frames: list[pd.DataFrame] = []
@@ -166,6 +559,7 @@ def build_file_list(
             retries=retries,
             backoff_base=backoff_base,
             backoff_max=backoff_max,
+            transport=transport,
         )
         if not files:
             continue
@@ -195,9 +589,20 @@ def count_years_per_file(
     return counts
 
 
-def url_for(year: int | str, file_name: str) -> str:
+def build_station_year_index(file_list: pd.DataFrame) -> dict[str, tuple[int, ...]]:
+    """Map each normalized file name to the years it is listed under, newest first."""
+    years = pd.to_numeric(file_list["YEAR"], errors="coerce")
+    listed = pd.DataFrame({"FileName": file_list["FileName"], "YEAR": years}).dropna()
+    names = listed["FileName"].astype(str).map(normalize_station_file_name)
+    return {
+        name: tuple(sorted(set(group.astype(int)), reverse=True))
+        for name, group in listed["YEAR"].groupby(names)
+    }
+
+
+def url_for(year: int | str, file_name: str, base_url: str = BASE_URL) -> str:
     normalized = normalize_station_file_name(file_name)
-    return f"{BASE_URL}/{year}/{normalized}"
+    return f"{base_url}/{year}/{normalized}"
 
 
 def normalize_station_file_name(file_name: str) -> str:
@@ -223,51 +628,40 @@ def normalize_station_file_name(file_name: str) -> str:
     return f"{name}.csv"
 
 
-def _url_exists(
-    url: str,
-    timeout: int = 20,
-    retries: int = 3,
-    backoff_base: float = 0.5,
-    backoff_max: float = 8.0,
-) -> bool:
-    for attempt in range(retries + 1):
-        try:
-            response = requests.head(url, timeout=timeout)
-        except requests.RequestException:
-            response = None
-        if response is not None and response.status_code == 200:
-            return True
-        if response is not None and response.status_code == 404:
-            return False
-        if attempt >= retries:
-            return False
-        _sleep_backoff(attempt, backoff_base, backoff_max)
-    return False
-
-
 def fetch_station_metadata(
     file_name: str,
     year: int,
     retries: int = 3,
     backoff_base: float = 0.5,
     backoff_max: float = 8.0,
+    transport: NoaaTransport | None = None,
+    cache: StationFileCache | None = None,
+    base_url: str = BASE_URL,
 ) -> StationMetadata | None:
-    """Fetch station metadata by reading the first row of a CSV file."""
+    """Fetch station metadata by reading the first row of a CSV file.
+
+    The row comes from a single ranged GET of the file's first bytes (see
+    ``_probe_csv_head``), or from ``cache`` without any request when it
+    already holds the yearly file. A cached body that cannot be parsed is
+    treated as a cache miss.
+    """
+    transport = transport or default_transport()
     normalized = normalize_station_file_name(file_name)
-    url = url_for(year, normalized)
-    if not _url_exists(
-        url,
-        retries=retries,
-        backoff_base=backoff_base,
-        backoff_max=backoff_max,
-    ):
-        return None
-    frame = _read_csv_head_with_retries(
-        url,
-        retries=retries,
-        backoff_base=backoff_base,
-        backoff_max=backoff_max,
-    )
+    cached = cache.get(year, normalized) if cache is not None else None
+    frame = None
+    if cached is not None:
+        try:
+            frame = pd.read_csv(BytesIO(cached), nrows=1, dtype=str, low_memory=False)
+        except (ValueError, pd.errors.ParserError):
+            frame = None
+    if frame is None:
+        frame = _probe_csv_head(
+            url_for(year, normalized, base_url=base_url),
+            transport,
+            retries=retries,
+            backoff_base=backoff_base,
+            backoff_max=backoff_max,
+        )
     if frame is None:
         return None
     if frame.empty:
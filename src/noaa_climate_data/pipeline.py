@@ -2,18 +2,44 @@
 
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
 from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
 from typing import Iterable, Literal
+import json
+import os
+import threading
 import time
 import math
 import re
 
 import pandas as pd
 import numpy as np
-
-from .cleaning import clean_noaa_dataframe
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .cleaning import (
+    _conform_to_schema,
+    _fallbacks_as_text,
+    _long_identifiers,
+    _rejected_raw_lines,
+    _stream_schema,
+    _stream_template,
+    _text_fallback_columns,
+    clean_noaa_dataframe,
+    clean_noaa_long,
+    compact_dtypes,
+    iter_clean_noaa,
+    memory_savings,
+    pack_qc,
+    select_identifier_columns,
+)
 from .constants import (
+    BASE_URL,
     DEFAULT_END_YEAR,
     DEFAULT_START_YEAR,
     get_agg_func,
@@ -23,9 +49,13 @@ from .constants import (
     to_internal_column,
 )
 from .noaa_client import (
+    NoaaTransport,
+    StationFileCache,
     StationMetadata,
     build_file_list,
+    build_station_year_index,
     count_years_per_file,
+    default_transport,
     fetch_station_metadata,
     fetch_station_metadata_for_years,
     get_years,
@@ -150,6 +180,8 @@ def pull_random_station_raw(
     output_dir: Path,
     sleep_seconds: float = 0.0,
     seed: int | None = None,
+    max_concurrency: int = 1,
+    cache: StationFileCache | None = None,
 ) -> Path:
     station = pick_random_station(stations_csv, seed=seed)
     file_name = str(station["FileName"])
@@ -158,6 +190,8 @@ def pull_random_station_raw(
         years,
         sleep_seconds=sleep_seconds,
         log_years=True,
+        max_concurrency=max_concurrency,
+        cache=cache,
     )
     if raw.empty:
         raise ValueError("No raw data returned for selected station.")
@@ -177,14 +211,31 @@ def clean_parquet_file(
     file_name: str | None = None,
     station_id: str | None = None,
     strict_mode: bool = True,
+    workers: int | None = None,
+    shard_rows: int | None = None,
+    identifiers: Iterable[str] | None = None,
+    chunk_rows: int = 100_000,
+    packed_qc: bool = False,
+    compact: bool = False,
+    layout: Literal["wide", "long"] = "wide",
 ) -> Path:
-    raw = pd.read_parquet(raw_parquet)
-    cleaned = clean_noaa_dataframe(raw, keep_raw=True, strict_mode=strict_mode)
-    cleaned = _extract_time_columns(cleaned)
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be a positive integer")
+    raw = pq.ParquetFile(raw_parquet)
+    columns = None
+    if identifiers is not None:
+        # Unrequested identifier columns are never read from disk.
+        columns = select_identifier_columns(raw.schema_arrow.names, identifiers)
     target_dir = output_dir or raw_parquet.parent
     target_dir.mkdir(parents=True, exist_ok=True)
-    output_path = target_dir / "LocationData_Cleaned.parquet"
-    cleaned.to_parquet(output_path, index=False)
+    if layout == "long":
+        output_path = target_dir / "LocationData_Long.parquet"
+        _write_long_parquet(raw, columns, output_path, strict_mode, station_id)
+    else:
+        output_path = target_dir / "LocationData_Cleaned.parquet"
+        _write_wide_parquet(
+            raw, columns, output_path, strict_mode, workers, shard_rows, chunk_rows, packed_qc, compact
+        )
     if stations_csv is not None:
         if station_id is None:
             station_id = raw_parquet.parent.name
@@ -197,6 +248,95 @@ def clean_parquet_file(
     return output_path
 
 
+def _write_wide_parquet(
+    raw: pq.ParquetFile,
+    columns: list[str] | None,
+    output_path: Path,
+    strict_mode: bool,
+    workers: int | None,
+    shard_rows: int | None,
+    chunk_rows: int,
+    packed_qc: bool,
+    compact: bool,
+) -> None:
+    # A first pass over the distinct raw values fixes the output schema, so
+    # each cleaned chunk is written as one row group of the same file. The
+    # schema comes from those values rather than the registry, so permissive
+    # expansions of unknown identifiers and raw-text fallbacks are kept.
+    template = clean_noaa_dataframe(
+        _stream_template(raw.iter_batches(batch_size=chunk_rows, columns=columns), strict_mode),
+        keep_raw=True,
+        strict_mode=strict_mode,
+    )
+    stream_schema = _stream_schema(template.dtypes)
+    template = _conform_to_schema(template, stream_schema)
+    text_columns = _text_fallback_columns(template)
+    template = _fallbacks_as_text(template, text_columns)
+    if packed_qc:
+        template = pack_qc(template)
+    compact_schema = compact_dtypes(template).dtypes if compact else None
+    schema = _cleaned_arrow_schema(template if compact_schema is None else template.astype(compact_schema))
+    bytes_before = bytes_after = 0
+    with pq.ParquetWriter(output_path, schema) as writer:
+        for cleaned in iter_clean_noaa(
+            raw.iter_batches(batch_size=chunk_rows, columns=columns),
+            keep_raw=True,
+            strict_mode=strict_mode,
+            workers=workers,
+            shard_rows=shard_rows,
+            schema=stream_schema,
+        ):
+            cleaned = _fallbacks_as_text(cleaned, text_columns)
+            if packed_qc:
+                cleaned = pack_qc(cleaned)
+            if compact_schema is not None:
+                # The template holds every distinct raw value, so its compact
+                # dtypes fit every chunk.
+                compacted = cleaned.astype(compact_schema.to_dict())
+                savings = memory_savings(cleaned, compacted)
+                bytes_before += int(savings["bytes_before"].sum())
+                bytes_after += int(savings["bytes_after"].sum())
+                cleaned = compacted
+            cleaned = _extract_time_columns(cleaned)
+            writer.write_table(pa.Table.from_pandas(cleaned, schema=schema, preserve_index=False))
+    if compact_schema is not None:
+        print(
+            f"Compact dtypes: {bytes_before / 1e6:.1f} MB -> {bytes_after / 1e6:.1f} MB "
+            f"in memory for the converted columns."
+        )
+
+
+def _write_long_parquet(
+    raw: pq.ParquetFile,
+    columns: list[str] | None,
+    output_path: Path,
+    strict_mode: bool,
+    station_id: str | None,
+) -> None:
+    """Write clean_noaa_long output one identifier column at a time.
+
+    Identifiers are written in sorted order, so the file is sorted by
+    identifier and then timestamp and row-group statistics on
+    ``identifier`` let readers skip other elements. STATION, DATE and the
+    raw_line rejections are read once and shared by every identifier.
+    """
+    names = columns or raw.schema_arrow.names
+    keys = [name for name in ("STATION", "DATE") if name in names]
+    raw_lines = [name for name in ("raw_line", "RAW_LINE") if name in names][:1]
+    base = raw.read(columns=keys + raw_lines).to_pandas()
+    kept = ~_rejected_raw_lines(base)
+    base = base.loc[kept, keys]
+    empty = clean_noaa_long(pd.DataFrame(columns=keys), station_id=station_id)
+    schema = pa.Schema.from_pandas(empty, preserve_index=False)
+    with pq.ParquetWriter(output_path, schema) as writer:
+        for identifier in sorted(_long_identifiers(names, strict_mode)):
+            values = raw.read(columns=[identifier]).column(0).to_pandas()
+            frame = base.assign(**{identifier: values[kept]})
+            long = clean_noaa_long(frame, strict_mode=strict_mode, station_id=station_id)
+            if not long.empty:
+                writer.write_table(pa.Table.from_pandas(long, schema=schema, preserve_index=False))
+
+
 def aggregate_parquet_placeholder(*_: object, **__: object) -> None:
     raise NotImplementedError("Aggregation from parquet is not implemented yet.")
 
@@ -207,11 +347,13 @@ def build_data_file_list(
     retries: int = 3,
     backoff_base: float = 0.5,
     backoff_max: float = 8.0,
+    transport: NoaaTransport | None = None,
 ) -> pd.DataFrame:
     years = get_years(
         retries=retries,
         backoff_base=backoff_base,
         backoff_max=backoff_max,
+        transport=transport,
     )
     file_list = build_file_list(
         years,
@@ -219,6 +361,7 @@ def build_data_file_list(
         retries=retries,
         backoff_base=backoff_base,
         backoff_max=backoff_max,
+        transport=transport,
     )
     file_list.to_csv(output_csv, index=False)
     return file_list
@@ -235,6 +378,64 @@ def build_year_counts(
     return counts
 
 
+def _journal_path(output_csv: Path, checkpoint_dir: Path | None) -> Path:
+    return (checkpoint_dir or output_csv.parent) / f"{output_csv.stem}_journal.jsonl"
+
+
+def _read_journal(journal: Path) -> list[dict[str, object]]:
+    """Return the journaled rows, cutting off a line torn by an interrupted write.
+
+    The file is truncated after the last complete line so that rows appended
+    by the resumed run are not stranded behind the fragment; the torn
+    station is refetched.
+    """
+    rows: list[dict[str, object]] = []
+    valid_bytes = 0
+    with journal.open("rb") as handle:
+        for line in handle:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                rows.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+            valid_bytes += len(line)
+    if valid_bytes < journal.stat().st_size:
+        with journal.open("r+b") as handle:
+            handle.truncate(valid_bytes)
+    return rows
+
+
+def _ordered_results(
+    candidates: Iterable[tuple[int, str]],
+    fetch: Callable[[str], tuple[StationMetadata | None, int | None]],
+    workers: int,
+) -> Iterator[tuple[int, str, tuple[StationMetadata | None, int | None]]]:
+    """Run ``fetch`` over ``candidates`` on ``workers`` threads, yielding in input order.
+
+    At most ``2 * workers`` fetches are queued ahead of the consumer, so a
+    caller that stops early wastes only that window.
+    """
+    if workers == 1:
+        for idx, file_name in candidates:
+            yield idx, file_name, fetch(file_name)
+        return
+    pending: deque[tuple[int, str, Future]] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        try:
+            for idx, file_name in candidates:
+                pending.append((idx, file_name, pool.submit(fetch, file_name)))
+                if len(pending) >= 2 * workers:
+                    idx, file_name, future = pending.popleft()
+                    yield idx, file_name, future.result()
+            while pending:
+                idx, file_name, future = pending.popleft()
+                yield idx, file_name, future.result()
+        finally:
+            for *_, future in pending:
+                future.cancel()
+
+
 def build_location_ids(
     year_counts: pd.DataFrame,
     output_csv: Path,
@@ -252,12 +453,32 @@ def build_location_ids(
     retries: int = 3,
     backoff_base: float = 0.5,
     backoff_max: float = 8.0,
+    transport: NoaaTransport | None = None,
+    cache: StationFileCache | None = None,
+    workers: int = 1,
 ) -> pd.DataFrame:
+    """Fetch metadata for every station in ``year_counts`` and write Stations.csv.
+
+    Each completed station is appended to a journal
+    (``<stem>_journal.jsonl`` in ``checkpoint_dir``, default next to
+    ``output_csv``), which is compacted into ``output_csv`` at the end and then
+    removed. A resumed run reads both, so an interrupted run loses at most the
+    station being written. With ``workers`` > 1 stations are fetched on a
+    thread pool, whose HTTP requests share the MAX_DOWNLOAD_CONCURRENCY
+    limit, but consumed in input order, so rows, ``LegacyID`` and
+    ``max_locations`` match a serial run exactly. When ``file_list`` is
+    given, each station is probed only for the ``metadata_years`` it is
+    listed under, newest first.
+    """
     full_coverage = year_counts
     rows: list[dict[str, object]] = []
     processed: set[str] = set()
     total = len(full_coverage)
     year_summary: dict[str, tuple[int | None, int | None, int | None]] = {}
+    year_index: dict[str, tuple[int, ...]] | None = None
+    if workers < 1:
+        raise ValueError("workers must be a positive integer")
+    journal = _journal_path(output_csv, checkpoint_dir)
     if resume and output_csv.exists():
         existing = pd.read_csv(output_csv)
         if not existing.empty:
@@ -268,6 +489,15 @@ def build_location_ids(
                 f"Resuming Stations.csv: {len(rows)} rows already written; "
                 f"{len(processed)} stations will be skipped."
             )
+    if resume and journal.exists():
+        journaled = [
+            row for row in _read_journal(journal) if str(row["FileName"]) not in processed
+        ]
+        rows.extend(journaled)
+        processed.update(str(row["FileName"]) for row in journaled)
+        print(f"Resuming journal {journal}: {len(journaled)} rows recovered.")
+    elif journal.exists():
+        journal.unlink()
     metadata_years = list(metadata_years)
     if not metadata_years:
         raise ValueError("metadata_years must contain at least one year")
@@ -292,84 +522,101 @@ def build_location_ids(
             )
             for _, row in grouped.iterrows()
         }
+        year_index = build_station_year_index(file_list)
+    first_counts = year_counts.drop_duplicates("FileName")
+    years_per_file = dict(zip(first_counts["FileName"], first_counts["No_Of_Years"]))
 
-    new_count = 0
-    print(
-        f"Starting metadata fetch for {total} stations "
-        f"(start_index={start_index}, max_locations={max_locations})."
-    )
-    for idx, file_name in enumerate(full_coverage["FileName"], start=1):
-        if idx <= start_index:
-            continue
-        if max_locations is not None and new_count >= max_locations:
-            break
-        if file_name in processed:
-            continue
-        metadata, metadata_year = fetch_station_metadata_for_years(
+    pacer = _RequestPacer(sleep_seconds if workers > 1 else 0.0)
+
+    def fetch(file_name: str) -> tuple[StationMetadata | None, int | None]:
+        pacer.wait()
+        return fetch_station_metadata_for_years(
             file_name,
             metadata_years,
             sleep_seconds=sleep_seconds,
             retries=retries,
             backoff_base=backoff_base,
             backoff_max=backoff_max,
+            transport=transport,
+            cache=cache,
+            year_index=year_index,
         )
-        if metadata is None or metadata_year is None:
-            continue
-        station_id = Path(normalize_station_file_name(metadata.file_name)).stem
-        metadata_complete = all(
-            value is not None
-            for value in (
-                metadata.latitude,
-                metadata.longitude,
-                metadata.elevation,
-                metadata.name,
+
+    candidates = (
+        (idx, file_name)
+        for idx, file_name in enumerate(full_coverage["FileName"], start=1)
+        if idx > start_index and file_name not in processed
+    )
+    if max_locations is not None and max_locations <= 0:
+        candidates = iter(())
+
+    new_count = 0
+    print(
+        f"Starting metadata fetch for {total} stations "
+        f"(start_index={start_index}, max_locations={max_locations}, workers={workers})."
+    )
+    journal.parent.mkdir(parents=True, exist_ok=True)
+    results = _ordered_results(candidates, fetch, workers)
+    with journal.open("a") as handle, closing(results):
+        for idx, file_name, (metadata, metadata_year) in results:
+            if file_name in processed:
+                continue
+            if metadata is None or metadata_year is None:
+                continue
+            station_id = Path(normalize_station_file_name(metadata.file_name)).stem
+            metadata_complete = all(
+                value is not None
+                for value in (
+                    metadata.latitude,
+                    metadata.longitude,
+                    metadata.elevation,
+                    metadata.name,
+                )
             )
-        )
-        first_year, last_year, year_count = year_summary.get(file_name, (None, None, None))
-        row: dict[str, object] = {
-            "ID": station_id,
-            "FileName": metadata.file_name,
-            "LATITUDE": metadata.latitude,
-            "LONGITUDE": metadata.longitude,
-            "ELEVATION": metadata.elevation,
-            "NAME": metadata.name,
-            "No_Of_Years": int(
-                year_counts.loc[year_counts["FileName"] == file_name, "No_Of_Years"].iloc[0]
-            ),
-            "FIRST_YEAR": first_year,
-            "LAST_YEAR": last_year,
-            "YEAR_COUNT": year_count,
-            "METADATA_YEAR": metadata_year,
-            "METADATA_COMPLETE": metadata_complete,
-            "raw_data_pulled": False,
-            "data_cleaned": False,
-            "data_aggregated": False,
-        }
-        if include_legacy_id:
-            row["LegacyID"] = idx
-        rows.append(
-            row
-        )
-        processed.add(file_name)
-        new_count += 1
-        print(
-            f"Fetched {file_name} (year={metadata_year}) -> "
-            f"{len(rows)}/{total} total, {new_count} new."
-        )
-        if checkpoint_every and (len(rows) % checkpoint_every == 0):
-            frame = pd.DataFrame(rows)
-            frame.to_csv(output_csv, index=False)
-            target_dir = checkpoint_dir or output_csv.parent
-            checkpoint_path = target_dir / f"{output_csv.stem}_checkpoint_{len(rows):05d}.csv"
-            frame.to_csv(checkpoint_path, index=False)
+            first_year, last_year, year_count = year_summary.get(file_name, (None, None, None))
+            row: dict[str, object] = {
+                "ID": station_id,
+                "FileName": metadata.file_name,
+                "LATITUDE": metadata.latitude,
+                "LONGITUDE": metadata.longitude,
+                "ELEVATION": metadata.elevation,
+                "NAME": metadata.name,
+                "No_Of_Years": int(years_per_file[file_name]),
+                "FIRST_YEAR": first_year,
+                "LAST_YEAR": last_year,
+                "YEAR_COUNT": year_count,
+                "METADATA_YEAR": metadata_year,
+                "METADATA_COMPLETE": metadata_complete,
+                "raw_data_pulled": False,
+                "data_cleaned": False,
+                "data_aggregated": False,
+            }
+            if include_legacy_id:
+                row["LegacyID"] = idx
+            rows.append(
+                row
+            )
+            handle.write(json.dumps(row) + "\n")
+            handle.flush()
+            processed.add(file_name)
+            new_count += 1
             print(
-                f"Progress: {len(rows)}/{total} rows saved "
-                f"(new this run: {new_count})."
+                f"Fetched {file_name} (year={metadata_year}) -> "
+                f"{len(rows)}/{total} total, {new_count} new."
             )
-        if sleep_seconds > 0:
-            time.sleep(sleep_seconds)
+            if checkpoint_every and (len(rows) % checkpoint_every == 0):
+                os.fsync(handle.fileno())
+                print(
+                    f"Progress: {len(rows)}/{total} rows saved "
+                    f"(new this run: {new_count})."
+                )
+            if max_locations is not None and new_count >= max_locations:
+                break
+            if sleep_seconds > 0 and workers == 1:
+                time.sleep(sleep_seconds)
     frame = pd.DataFrame(rows)
     frame.to_csv(output_csv, index=False)
+    journal.unlink()
     print(
         f"Finished metadata fetch. Total rows: {len(rows)} "
         f"(new this run: {new_count})."
@@ -377,31 +624,123 @@ def build_location_ids(
     return frame
 
 
+class _RequestPacer:
+    """Space request starts ``interval`` seconds apart across threads."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def wait(self) -> None:
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def _download_year(
+    file_name: str,
+    year: int,
+    base_url: str,
+    transport: NoaaTransport,
+    cache: StationFileCache | None = None,
+    pacer: _RequestPacer | None = None,
+) -> pd.DataFrame | None:
+    if pacer is not None:
+        pacer.wait()
+    try:
+        url = url_for(year, file_name, base_url=base_url)
+        if cache is not None:
+            body = cache.fetch(year, file_name, url, transport)
+        else:
+            body = transport.get_bytes(url)
+        frame = pd.read_csv(BytesIO(body), dtype=str, low_memory=False)
+    except Exception:
+        return None
+    if frame.empty:
+        return None
+    frame["YEAR"] = year
+    return frame
+
+
 def download_location_data(
     file_name: str,
     years: Iterable[int],
     sleep_seconds: float = 0.0,
     log_years: bool = False,
+    max_concurrency: int = 1,
+    base_url: str = BASE_URL,
+    transport: NoaaTransport | None = None,
+    cache: StationFileCache | None = None,
 ) -> pd.DataFrame:
+    """Download a station's yearly CSVs and stack them in year order.
+
+    With ``max_concurrency`` above 1 the years are fetched by a thread pool,
+    never exceeding MAX_DOWNLOAD_CONCURRENCY requests across the process, and
+    ``sleep_seconds`` spaces request starts instead of following each fetch.
+    The result matches a serial download: frames in ``years`` order with a
+    YEAR column, skipping years that fail or come back empty. With a
+    ``cache`` the yearly bodies are served from and stored in it.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be a positive integer")
+    transport = transport or default_transport()
+    years = list(years)
+    if max_concurrency == 1 or len(years) <= 1:
+        results: list[pd.DataFrame | None] = []
+        for year in years:
+            results.append(_download_year(file_name, year, base_url, transport, cache))
+            if sleep_seconds > 0:
+                time.sleep(sleep_seconds)
+    else:
+        pacer = _RequestPacer(sleep_seconds)
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(years))) as pool:
+            results = list(
+                pool.map(
+                    lambda year: _download_year(
+                        file_name, year, base_url, transport, cache, pacer
+                    ),
+                    years,
+                )
+            )
     frames: list[pd.DataFrame] = []
-    for year in years:
-        url = url_for(year, file_name)
-        try:
-            frame = pd.read_csv(url, dtype=str, low_memory=False)
-        except Exception:
+    for year, frame in zip(years, results):
+        if frame is None:
             continue
-        if not frame.empty:
-            frame["YEAR"] = year
-            frames.append(frame)
-            if log_years:
-                print(f"Downloaded {file_name} for year {year} ({len(frame)} rows).")
-        if sleep_seconds > 0:
-            time.sleep(sleep_seconds)
+        frames.append(frame)
+        if log_years:
+            print(f"Downloaded {file_name} for year {year} ({len(frame)} rows).")
     if not frames:
         return pd.DataFrame()
     return pd.concat(frames, ignore_index=True)
 
 
+_TIME_COLUMNS = ("DATE", "Year", "MonthNum", "Day", "Hour")
+
+
+def _cleaned_arrow_schema(template: pd.DataFrame) -> pa.Schema:
+    """Arrow schema of cleaned chunks after _extract_time_columns.
+
+    Columns that are null throughout ``template`` only ever hold text, so
+    they are written as strings.
+    """
+    cleaned = pa.Schema.from_pandas(template, preserve_index=False)
+    timed = pa.Schema.from_pandas(_extract_time_columns(template), preserve_index=False)
+    fields = []
+    for field in timed:
+        if field.name not in _TIME_COLUMNS:
+            field = cleaned.field(field.name)
+        if pa.types.is_null(field.type):
+            field = field.with_type(pa.string())
+        fields.append(field)
+    return pa.schema(fields, metadata=timed.metadata)
+
+
 def _extract_time_columns(df: pd.DataFrame) -> pd.DataFrame:
     df = df.copy()
     date_series = pd.to_datetime(df["DATE"], errors="coerce", utc=True)
@@ -706,8 +1045,19 @@ def process_location(
     sleep_seconds: float = 0.0,
     add_unit_conversions: bool = False,
     strict_mode: bool = True,
+    workers: int | None = None,
+    shard_rows: int | None = None,
+    identifiers: Iterable[str] | None = None,
+    max_concurrency: int = 1,
+    cache: StationFileCache | None = None,
 ) -> LocationDataOutputs:
-    raw = download_location_data(file_name, years, sleep_seconds=sleep_seconds)
+    raw = download_location_data(
+        file_name,
+        years,
+        sleep_seconds=sleep_seconds,
+        max_concurrency=max_concurrency,
+        cache=cache,
+    )
     return process_location_from_raw(
         raw,
         location_id=location_id,
@@ -718,6 +1068,9 @@ def process_location(
         fixed_hour=fixed_hour,
         add_unit_conversions=add_unit_conversions,
         strict_mode=strict_mode,
+        workers=workers,
+        shard_rows=shard_rows,
+        identifiers=identifiers,
     )
 
 
@@ -731,6 +1084,9 @@ def process_location_from_raw(
     fixed_hour: int | None = None,
     add_unit_conversions: bool = False,
     strict_mode: bool = True,
+    workers: int | None = None,
+    shard_rows: int | None = None,
+    identifiers: Iterable[str] | None = None,
 ) -> LocationDataOutputs:
     if raw.empty:
         return LocationDataOutputs(
@@ -744,7 +1100,14 @@ def process_location_from_raw(
     raw = raw.copy()
     if "DATE" in raw.columns:
         raw["DATE_PARSED"] = pd.to_datetime(raw["DATE"], errors="coerce", utc=True)
-    cleaned = clean_noaa_dataframe(raw, keep_raw=True, strict_mode=strict_mode)
+    cleaned = clean_noaa_dataframe(
+        raw,
+        keep_raw=True,
+        strict_mode=strict_mode,
+        workers=workers,
+        shard_rows=shard_rows,
+        identifiers=identifiers,
+    )
     cleaned = _extract_time_columns(cleaned)
     if location_id is not None:
         cleaned["ID"] = location_id
@@ -10,22 +10,59 @@ from __future__ import annotations
 
 import re
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from noaa_climate_data.cleaning import (
+    ParseCache,
+    ParseReport,
+    _conform_to_schema,
+    _expand_column,
+    _ColumnBuffers,
+    _expand_column_memoized,
     _expand_parsed,
+    _fits_float32,
+    _stitch_column_order,
+    _sweep_missing_sentinels,
     _is_missing_value,
+    _parse_qnn,
+    _parse_qnn_column,
+    _parse_remark,
+    _parse_remark_column,
+    _stream_template,
     _quality_for_part,
+    _record_length_mismatch,
+    _validate_control_header,
+    _validate_raw_lines,
+    clean_arrow_table,
     clean_noaa_dataframe,
+    clean_noaa_long,
     clean_value_quality,
+    compact_dtypes,
+    decode_qc_codes,
     enforce_domain,
+    iter_clean_noaa,
+    memory_savings,
+    output_schema,
+    pack_qc,
     parse_field,
+    select_identifier_columns,
+    unpack_qc,
 )
 from noaa_climate_data.constants import (
+    FRIENDLY_COLUMN_MAP,
+    KNOWN_IDENTIFIERS,
+    PARSER_PLANS,
     SECTION_IDENTIFIER_WIDTH_RULE_IDENTIFIERS,
     FieldPartRule,
+    PartParserPlan,
+    can_hold_missing_sentinel,
+    get_expected_part_count,
     get_field_rule,
+    get_output_columns,
+    get_parser_plan,
     get_token_width_rules,
     to_friendly_column,
     to_internal_column,
@@ -4957,7 +4994,647 @@ class TestControlPosStrictEvidence:
         )
 
 
-class TestA2MalformedIdentifierFormat:
+class TestVectorizedRawLineValidation:
+    """_validate_raw_lines must reproduce the scalar control-header and record-length validators."""
+
+    @staticmethod
+    def _raw_lines() -> list[object]:
+        valid = TestControlPosStrictEvidence._build_raw_line(4)
+        mutate = TestControlPosStrictEvidence._mutate_slice
+        return [
+            valid,
+            valid + "\r\n",
+            valid + "X",
+            valid[:59],
+            valid[:3],
+            "",
+            mutate(valid, 1, 4, "00A4"),
+            mutate(valid, 1, 4, " 004"),
+            mutate(valid, 16, 23, "20240229"),
+            mutate(valid, 16, 23, "20230229"),
+            mutate(valid, 16, 23, "19000229"),
+            mutate(valid, 16, 23, "20241131"),
+            mutate(valid, 16, 23, "20240001"),
+            mutate(valid, 24, 27, "2400"),
+            mutate(valid, 24, 27, "1260"),
+            mutate(valid, 28, 28, "X"),
+            mutate(valid, 29, 34, "+99999"),
+            mutate(valid, 29, 34, "-99999"),
+            mutate(valid, 29, 34, "999999"),
+            mutate(valid, 29, 34, "+90001"),
+            mutate(valid, 29, 34, "+12A45"),
+            mutate(valid, 35, 41, "+-99999"),
+            mutate(valid, 35, 41, "+180001"),
+            mutate(valid, 42, 46, "99999"),
+            mutate(valid, 42, 46, "-0401"),
+            mutate(valid, 47, 51, "99999"),
+            mutate(valid, 47, 51, "SAO  "),
+            mutate(valid, 47, 51, "ZZZZZ"),
+            mutate(valid, 52, 56, "\u00e5JFK "),
+            mutate(valid, 57, 60, "9999"),
+            mutate(valid, 57, 60, "V04 "),
+            mutate(valid, 29, 34, "+12A45")[:58],
+        ]
+
+    @staticmethod
+    def _assert_matches_scalar(raw_lines: pd.Series) -> None:
+        control_error, mismatch = _validate_raw_lines(raw_lines)
+        expected_error = [_validate_control_header(value) for value in raw_lines]
+        expected_mismatch = [_record_length_mismatch(value) for value in raw_lines]
+        assert control_error.tolist() == expected_error
+        assert mismatch.tolist() == expected_mismatch
+        assert control_error.index.equals(raw_lines.index)
+
+    @pytest.mark.parametrize("dtype", [object, "str", "string"])
+    def test_matches_scalar_validators(self, dtype) -> None:
+        raw_lines = pd.Series(self._raw_lines(), dtype=dtype, index=range(100, 132))
+        self._assert_matches_scalar(raw_lines)
+
+    def test_nulls_and_non_string_values_match_scalar_validators(self) -> None:
+        raw_lines = pd.Series(self._raw_lines()[:4] + [None, float("nan"), pd.NA, 1234], dtype=object)
+        self._assert_matches_scalar(raw_lines)
+
+    def test_arrow_string_nulls_are_skipped(self) -> None:
+        raw_lines = pd.Series(self._raw_lines()[:2] + [None], dtype="str")
+        control_error, mismatch = _validate_raw_lines(raw_lines)
+        assert control_error.tolist() == [None, None, None]
+        assert mismatch.tolist() == [False, False, False]
+
+
+class TestVectorizedRemarkQnnParsing:
+    """_parse_remark_column and _parse_qnn_column must reproduce the scalar REM/QNN parsers."""
+
+    REMARKS = [
+        "MET125METAR KAVL 011230Z",
+        "  syn004BUFR ",
+        "SOD",
+        "HPD   ",
+        "XYZ free text",
+        "AW",
+        "",
+        " \t",
+        "nan",
+        "None",
+        "MET\u00e5 caf\u00e9",
+        "\u2003MET spaced",
+    ]
+    QNN = [
+        "QNNA0011B0021000123000456",
+        "qnn a0011 b0021 000123 000456",
+        "QNNA0011B0021",
+        "QNNA0011B0021000123",
+        "QNNA00-1000123",
+        "QNNZ0011000123",
+        "QNNA0011000123X",
+        "QNN",
+        "QNA0011000123",
+        "A0011000123",
+        "QNNA0011\u2003000123",
+        "QNNA0011B002",
+        "",
+        "nan",
+    ]
+
+    @staticmethod
+    def _expected(values: pd.Series, parser, parts: int) -> list[pd.Series]:
+        frame = pd.DataFrame(index=values.index)
+        parsed = [parser(value) for value in values]
+        for part in range(parts):
+            frame[part] = [result[part] for result in parsed]
+        return [frame[part] for part in range(parts)]
+
+    @pytest.mark.parametrize("dtype", [object, "str"])
+    def test_remark_matches_scalar_parser(self, dtype) -> None:
+        remarks = pd.Series(self.REMARKS + [None], dtype=dtype, index=range(50, 63))
+        for got, expected in zip(_parse_remark_column(remarks), self._expected(remarks, _parse_remark, 2)):
+            pd.testing.assert_series_equal(got, expected, check_names=False)
+
+    @pytest.mark.parametrize("dtype", [object, "str"])
+    def test_qnn_matches_scalar_parser(self, dtype) -> None:
+        qnn = pd.Series(self.QNN + [None], dtype=dtype, index=range(50, 65))
+        for got, expected in zip(_parse_qnn_column(qnn), self._expected(qnn, _parse_qnn, 3)):
+            pd.testing.assert_series_equal(got, expected, check_names=False)
+
+    def test_non_string_values_match_scalar_parsers(self) -> None:
+        values = pd.Series(["MET010TEXT", "QNNA0011000123", pd.NA, 1234, float("nan")], dtype=object)
+        for got, expected in zip(_parse_remark_column(values), self._expected(values, _parse_remark, 2)):
+            pd.testing.assert_series_equal(got, expected, check_names=False)
+        for got, expected in zip(_parse_qnn_column(values), self._expected(values, _parse_qnn, 3)):
+            pd.testing.assert_series_equal(got, expected, check_names=False)
+
+    def test_all_invalid_and_empty_columns_keep_list_dtypes(self) -> None:
+        elements, _, _ = _parse_qnn_column(pd.Series(["bad", None], dtype=object))
+        assert elements.dtype == object
+        assert elements.tolist() == [None, None]
+        remark_type, _ = _parse_remark_column(pd.Series([], dtype=object))
+        assert remark_type.dtype == "float64"
+
+    def test_clean_outputs_comma_joined_qnn_groups(self) -> None:
+        df = pd.DataFrame(
+            {
+                "TMP": ["+0250,1", "+0251,1"],
+                "REM": ["MET010METAR TEST", "plain remark"],
+                "QNN": ["QNNA0011B0021000123000456", "QNNA0011"],
+            }
+        )
+        cleaned = clean_noaa_dataframe(df)
+        assert cleaned.loc[0, "remarks_type_code"] == "MET"
+        assert cleaned.loc[1, "remarks_text"] == "plain remark"
+        assert cleaned["qnn_element_ids"].tolist() == ["A,B", "A"]
+        assert cleaned["qnn_source_flags"].tolist() == ["0011,0021", "0011"]
+        assert cleaned.loc[0, "qnn_data_values"] == "000123,000456"
+        assert pd.isna(cleaned.loc[1, "qnn_data_values"])
+
+
+class TestMissingSentinelSweep:
+    """The final all-nines sweep only touches registry field columns."""
+
+    def test_allowlist_covers_registry_fields_only(self) -> None:
+        for column in ["TMP", "AA1", "LATITUDE", "CALL_SIGN", "QUALITY_CONTROL", "AY1__part1", "TMP__quality", "Q01__part2"]:
+            assert can_hold_missing_sentinel(column), column
+        for column in ["NAME", "STATION", "REM", "REM__text", "QNN__data_values", "TMP__qc_reason", "raw_line", "ZZ1__part1"]:
+            assert not can_hold_missing_sentinel(column), column
+
+    def test_sentinels_nulled_in_allowlisted_columns(self) -> None:
+        frame = pd.DataFrame(
+            {
+                "AY1__part1": pd.Series(["99", "1", None], dtype=object),
+                "CALL_SIGN": pd.Series(["+99.9", "KAVL", "9"], dtype="str"),
+                "NAME": pd.Series(["9999", "A", "B"], dtype=object),
+                "REM__text": pd.Series(["999", "x", None], dtype="str"),
+            }
+        )
+        swept = _sweep_missing_sentinels(frame)
+        assert swept["AY1__part1"].isna().tolist() == [True, False, True]
+        assert swept["CALL_SIGN"].isna().tolist() == [True, False, False]
+        assert swept["NAME"].tolist() == ["9999", "A", "B"]
+        assert swept.loc[0, "REM__text"] == "999"
+
+    def test_dtypes_match_per_value_sweep(self) -> None:
+        frame = pd.DataFrame(
+            {
+                "AY1__part1": pd.Series(["99", "99"], dtype=object),
+                "TMP__part2": pd.Series(["1", None], dtype=object),
+                "NAME": pd.Series(["A", "B"], dtype=object),
+                "WND__direction_variable": pd.Series([True, False], dtype=object),
+                "AA1__part3": pd.Series([np.nan, np.nan], dtype="str"),
+            }
+        )
+        swept = _sweep_missing_sentinels(frame)
+        assert swept["AY1__part1"].dtype == object
+        assert swept["AY1__part1"].tolist() == [None, None]
+        assert isinstance(swept["TMP__part2"].dtype, pd.StringDtype)
+        assert isinstance(swept["NAME"].dtype, pd.StringDtype)
+        assert swept["WND__direction_variable"].dtype == bool
+        assert swept["AA1__part3"].dtype == "float64"
+
+    def test_clean_keeps_free_text_nines(self) -> None:
+        df = pd.DataFrame({"TMP": ["+0250,1"], "NAME": ["99999"], "REM": ["MET999"]})
+        cleaned = clean_noaa_dataframe(df)
+        assert cleaned.loc[0, "NAME"] == "99999"
+        assert cleaned.loc[0, "remarks_text"] == "999"
+
+
+class TestIdentifierSelection:
+    """Only requested identifier families are parsed; control columns always pass."""
+
+    def _frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "STATION": ["72315003812", "72315003812"],
+                "DATE": ["2024-02-01T12:30:00", "2024-02-01T13:30:00"],
+                "TMP": ["+0144,1", "+0150,1"],
+                "DEW": ["+0050,1", "+9999,9"],
+                "AA1": ["01,0000,9,1", "01,0010,9,1"],
+                "REM": ["MET010METAR TEST", None],
+                "YEAR": [2024, 2024],
+            }
+        )
+
+    def test_select_keeps_requested_and_non_identifier_columns(self) -> None:
+        columns = ["STATION", "DATE", "TMP", "DEW", "AA1", "Q01", "REM", "raw_line", "YEAR"]
+        assert select_identifier_columns(columns, ["TMP", "Q01"]) == [
+            "STATION", "DATE", "TMP", "Q01", "raw_line", "YEAR",
+        ]
+
+    def test_unknown_identifier_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unknown identifier\\(s\\): FOO"):
+            select_identifier_columns(["TMP"], ["TMP", "FOO"])
+
+    def test_unrequested_families_are_not_parsed(self) -> None:
+        cleaned = clean_noaa_dataframe(self._frame(), identifiers=["TMP"])
+        assert cleaned["temperature_c"].tolist() == pytest.approx([14.4, 15.0])
+        assert not any(column.startswith(("DEW", "AA1", "REM", "dew_point", "remarks")) for column in cleaned.columns)
+        assert cleaned["STATION"].tolist() == ["72315003812", "72315003812"]
+        assert cleaned["YEAR"].tolist() == [2024, 2024]
+
+    def test_selected_columns_match_full_clean(self) -> None:
+        frame = self._frame()
+        full = clean_noaa_dataframe(frame)
+        selected = clean_noaa_dataframe(frame, identifiers=["TMP", "AA1"])
+        for column in selected.columns:
+            if column.startswith(("temperature", "TMP", "AA1", "precip")):
+                pd.testing.assert_series_equal(selected[column], full[column], check_names=True)
+
+    def test_arrow_table_projection_matches_dataframe(self) -> None:
+        frame = self._frame()
+        expected = clean_noaa_dataframe(frame, identifiers=["DEW"])
+        result = clean_arrow_table(pa.Table.from_pandas(frame, preserve_index=False), identifiers=["DEW"])
+        assert "TMP" not in result.column_names
+        assert result.column_names == list(expected.columns)
+        assert result.column("dew_point_c").to_pylist()[0] == pytest.approx(5.0)
+
+
+class TestIterCleanNoaa:
+    """Chunked cleaning yields every chunk under one stable schema."""
+
+    def _chunks(self) -> list[pd.DataFrame]:
+        return [
+            pd.DataFrame({"TMP": ["+0144,1", "+0150,1"], "MW1": ["05,1", None]}),
+            pd.DataFrame({"TMP": ["+9999,9", None], "MW1": [None, None]}),
+            pd.DataFrame({"TMP": ["-0012,1", "+0020,1"], "MW1": ["61,1", "01,1"]}),
+        ]
+
+    def test_chunks_share_columns_and_dtypes(self) -> None:
+        chunks = list(iter_clean_noaa(self._chunks()))
+        assert len(chunks) == 3
+        for chunk in chunks[1:]:
+            assert list(chunk.columns) == list(chunks[0].columns)
+            assert chunk.dtypes.equals(chunks[0].dtypes)
+        assert chunks[0]["TMP__qc_pass"].dtype == object
+        assert chunks[1]["present_weather_code_1"].isna().all()
+        assert chunks[2]["present_weather_code_1"].tolist() == [61.0, 1.0]
+
+    def test_usability_metrics_use_the_schema_qc_columns(self) -> None:
+        expected = clean_noaa_dataframe(pd.concat(self._chunks(), ignore_index=True))
+        streamed = pd.concat(iter_clean_noaa(self._chunks()), ignore_index=True)
+        assert streamed["usable_metric_count"].dtype == "int64"
+        assert streamed["usable_metric_fraction"].tolist() == expected["usable_metric_fraction"].tolist()
+        pd.testing.assert_series_equal(streamed["temperature_c"], expected["temperature_c"])
+
+    def test_columns_outside_first_schema_are_dropped(self, caplog: pytest.LogCaptureFixture) -> None:
+        chunks = [
+            pd.DataFrame({"TMP": ["+0144,1"]}),
+            pd.DataFrame({"TMP": ["+0150,1"], "AA1": ["01,0000,9,1"]}),
+        ]
+        first, second = iter_clean_noaa(chunks)
+        assert list(second.columns) == list(first.columns)
+        assert "outside the schema" in caplog.text and "AA1" in caplog.text
+
+    def test_arrow_batches_with_template_schema(self) -> None:
+        raw = pd.concat(self._chunks()[1:], ignore_index=True)
+        batches = pa.Table.from_pandas(raw, preserve_index=False).to_batches(max_chunksize=2)
+        template = next(iter_clean_noaa([_stream_template(batches)]))
+        streamed = list(iter_clean_noaa(batches, schema=template.dtypes))
+        assert "present_weather_code_1" in template.columns
+        assert "present_weather_code_1" not in clean_noaa_dataframe(raw.iloc[:2]).columns
+        assert all(chunk.dtypes.equals(template.dtypes) for chunk in streamed)
+        assert streamed[1]["present_weather_code_1"].tolist() == [61.0, 1.0]
+
+    def test_permissive_default_schema_keeps_unknown_identifiers(self) -> None:
+        chunks = [
+            pd.DataFrame({"TMP": ["+0144,1"], "ZZ1": ["1,2,3"]}),
+            pd.DataFrame({"TMP": ["+0150,1"], "ZZ1": ["4,X,6"]}),
+        ]
+        first, second = iter_clean_noaa(chunks, strict_mode=False)
+        assert first["ZZ1__part2"].tolist() == [2.0]
+        assert second["ZZ1__part2"].tolist() == ["X"]
+        assert list(second.columns) == list(first.columns)
+
+
+class TestOutputSchema:
+    """The output schema is derived from the registry, not from the data."""
+
+    def test_identifier_columns_follow_parser_order(self) -> None:
+        assert get_output_columns("TMP") == (
+            ("TMP__value", "float64"),
+            ("TMP__quality", "str"),
+            ("TMP__qc_pass", "object"),
+            ("TMP__qc_status", "category"),
+            ("TMP__qc_reason", "category"),
+        )
+        assert [column for column, _ in get_output_columns("WND")][:3] == [
+            "WND__direction_variable", "WND__part1", "WND__part2",
+        ]
+        assert dict(get_output_columns("MW1")) == {
+            "MW1__part1": "float64", "MW1__part2": "object", "MW1__quality": "str",
+        }
+        assert get_output_columns("ZZ1") == ()
+
+    def test_schema_layout(self) -> None:
+        schema = output_schema(["STATION", "DATE", "LATITUDE", "ADD", "TMP", "MW1", "REM", "QNN", "YEAR"])
+        assert list(schema.index) == [
+            "STATION", "DATE", "LATITUDE", "TMP", "MW1", "REM", "QNN", "YEAR",
+            "remarks_type_code", "remarks_text",
+            "temperature_c", "temperature_quality_code", "TMP__qc_pass", "TMP__qc_status", "TMP__qc_reason",
+            "present_weather_code_1", "MW1__part2", "MW1__quality",
+            "qnn_element_ids", "qnn_source_flags", "qnn_data_values",
+            "row_has_any_usable_metric", "usable_metric_count", "usable_metric_fraction",
+        ]
+        assert schema["LATITUDE"] == "float64"
+        assert schema["YEAR"] == object
+        assert isinstance(schema["STATION"], pd.StringDtype)
+        assert schema["usable_metric_count"] == "int64"
+        dropped = output_schema(["DATE", "TMP", "REM"], keep_raw=False)
+        assert "TMP" not in dropped.index and "REM" in dropped.index and "DATE" in dropped.index
+
+    def test_cleaned_frames_conform_regardless_of_data(self) -> None:
+        columns = ["DATE", "TMP", "WND", "AA1"]
+        schema = output_schema(columns)
+        full = pd.DataFrame(
+            {
+                "DATE": ["20240201"],
+                "TMP": ["+0144,1"],
+                "WND": ["318,1,N,0061,1"],
+                "AA1": ["01,0000,9,1"],
+            }
+        )
+        empty = pd.DataFrame({column: [None] for column in columns}, dtype=object)
+        frames = [clean_noaa_dataframe(frame, schema=schema) for frame in (full, empty)]
+        for frame in frames:
+            assert list(frame.columns) == list(schema.index)
+            assert all(frame[column].dtype == dtype for column, dtype in schema.items())
+        assert frames[0].loc[0, "temperature_c"] == pytest.approx(14.4)
+        assert frames[0].loc[0, "wind_speed_ms"] == pytest.approx(6.1)
+        assert frames[1]["temperature_c"].isna().all()
+        assert frames[1].loc[0, "usable_metric_count"] == 0
+        combined = pd.concat(frames, ignore_index=True)
+        assert combined.dtypes.equals(frames[0].dtypes)
+
+    def test_schema_matches_unconformed_values(self) -> None:
+        df = pd.DataFrame(
+            {
+                "TMP": ["+0144,1", "+9999,9", "-0012,1"],
+                "WND": ["318,1,N,0061,1", "999,9,V,0000,1", "090,1,C,0000,1"],
+                "MW1": ["05,1", None, "61,1"],
+            }
+        )
+        cleaned = clean_noaa_dataframe(df)
+        conformed = clean_noaa_dataframe(df, schema=output_schema(df.columns))
+        assert set(cleaned.columns) <= set(conformed.columns)
+        for column in cleaned.columns:
+            expected = cleaned[column].astype(object).where(cleaned[column].notna(), None)
+            actual = conformed[column].astype(object).where(conformed[column].notna(), None)
+            assert actual.tolist() == expected.tolist(), column
+
+    def test_non_numeric_values_are_kept_with_warning(self, caplog: pytest.LogCaptureFixture) -> None:
+        schema = pd.Series({"TMP__part1": np.dtype("float64")}, dtype=object)
+        frame = pd.DataFrame({"TMP__part1": pd.Series([1.5, "J"], dtype=object)})
+        conformed = _conform_to_schema(frame, schema)
+        assert conformed["TMP__part1"].tolist() == [1.5, "J"]
+        assert "1 non-numeric value(s) kept as text" in caplog.text
+
+
+class TestCompactDtypes:
+    """The compact dtype policy keeps every value while shrinking the frame."""
+
+    @staticmethod
+    def _raw() -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "DATE": ["20240201"] * 4,
+                "TMP": ["+0144,1", "+9999,9", "-0050,A", None],
+                "WND": ["318,1,N,0061,1", "999,9,V,0010,1", None, "090,1,N,9999,9"],
+                "MW1": ["05,1", None, None, "61,M"],
+                "YEAR": [2024] * 4,
+            }
+        )
+
+    def test_dtypes_follow_the_registry(self) -> None:
+        cleaned = clean_noaa_dataframe(self._raw(), compact=True)
+        dtypes = cleaned.dtypes
+        assert dtypes["temperature_c"] == "float32"
+        assert dtypes["wind_speed_ms"] == "float32"
+        assert list(dtypes["TMP__qc_status"].categories) == sorted({"PASS", "INVALID", "MISSING"})
+        assert "SENTINEL_MISSING" in dtypes["TMP__qc_reason"].categories
+        assert isinstance(dtypes["temperature_quality_code"], pd.CategoricalDtype)
+        assert "A" in dtypes["temperature_quality_code"].categories
+        assert dtypes["TMP__qc_pass"] == "boolean"
+        assert dtypes["wind_direction_variable"] == "boolean"
+        # Untouched: raw text, passthrough and usability columns.
+        assert isinstance(dtypes["TMP"], pd.StringDtype)
+        assert dtypes["YEAR"] == "int64"
+        assert dtypes["row_has_any_usable_metric"] == bool
+        savings = cleaned.attrs["memory_savings"]
+        assert "temperature_c" in savings.index
+        pd.testing.assert_frame_equal(savings, memory_savings(clean_noaa_dataframe(self._raw()), cleaned))
+
+    def test_values_are_unchanged(self) -> None:
+        default = clean_noaa_dataframe(self._raw())
+        compact = clean_noaa_dataframe(self._raw(), compact=True)
+        assert list(compact.columns) == list(default.columns)
+        for column in default.columns:
+            if compact[column].dtype == "float32":
+                np.testing.assert_allclose(
+                    compact[column].astype(float), default[column].astype(float), atol=1e-5
+                )
+            else:
+                expected = default[column].astype(object).where(default[column].notna(), None)
+                actual = compact[column].astype(object).where(compact[column].notna(), None)
+                assert actual.tolist() == expected.tolist(), column
+
+    def test_float32_only_where_the_range_fits(self) -> None:
+        def part(rule: FieldPartRule, token_width: int | None = None) -> PartParserPlan:
+            return PartParserPlan(1, "X__part1", rule, token_width, None, None, set(), None)
+
+        assert _fits_float32(get_parser_plan("TMP").parts[1])
+        assert _fits_float32(part(FieldPartRule(scale=0.1), token_width=6))
+        assert not _fits_float32(part(FieldPartRule(scale=0.1), token_width=7))
+        assert not _fits_float32(part(FieldPartRule(min_value=0, max_value=99_999_999)))
+        # No range and no token width: the precision cannot be bounded.
+        assert not _fits_float32(part(FieldPartRule()))
+        frame = pd.DataFrame({"unknown_measurement": [1.5], "YEAR": [2024.0]})
+        assert compact_dtypes(frame).dtypes.tolist() == [np.dtype("float64")] * 2
+
+    def test_values_outside_the_categories_keep_their_dtype(self) -> None:
+        frame = pd.DataFrame(
+            {
+                "TMP__quality": pd.Series(["1", "X"], dtype="str"),
+                "TMP__qc_status": pd.Series(["PASS", "INVALID"], dtype="str"),
+                "TMP__qc_pass": pd.Series([True, "yes"], dtype=object),
+            }
+        )
+        compacted = compact_dtypes(frame)
+        assert isinstance(compacted["TMP__quality"].dtype, pd.StringDtype)
+        assert compacted["TMP__qc_pass"].dtype == object
+        assert isinstance(compacted["TMP__qc_status"].dtype, pd.CategoricalDtype)
+
+    def test_memory_savings_report(self) -> None:
+        before = pd.DataFrame(
+            {
+                "TMP__qc_status": pd.Series(["PASS"] * 1000, dtype=object),
+                "TMP__value": np.linspace(-10.0, 30.0, 1000),
+                "NAME": ["ASHEVILLE"] * 1000,
+            }
+        )
+        after = compact_dtypes(before)
+        report = memory_savings(before, after)
+        assert list(report.columns) == [
+            "dtype_before", "dtype_after", "bytes_before", "bytes_after", "bytes_saved",
+        ]
+        assert list(report.index) == ["TMP__qc_status", "TMP__value"]
+        assert report.loc["TMP__value", "bytes_saved"] == 4000
+        assert report.loc["TMP__qc_status", "dtype_after"] == "category"
+        assert (report["bytes_saved"] == report["bytes_before"] - report["bytes_after"]).all()
+
+
+class TestPackedQc:
+    """Packed QC codes carry the same signals as the three QC columns."""
+
+    @staticmethod
+    def _raw() -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "DATE": ["20240201"] * 4,
+                "TMP": ["+0144,1", "+9999,9", "+0144,3", None],
+                "WND": ["318,1,N,0061,1", "999,9,V,0010,1", None, "090,1,N,9999,9"],
+                "KA1": [None, "024,M,+0150,1", None, "024,M,+0700,1"],
+            }
+        )
+
+    def test_layout_and_codes(self) -> None:
+        default = clean_noaa_dataframe(self._raw())
+        packed = clean_noaa_dataframe(self._raw(), packed_qc=True)
+        assert not any(column.endswith(("__qc_pass", "__qc_status", "__qc_reason")) for column in packed)
+        codes = [column for column in packed.columns if column.endswith("__qc_code")]
+        assert codes == [
+            "TMP__qc_code", "WND__part1__qc_code", "WND__part4__qc_code",
+            "KA1__part1__qc_code", "KA1__part3__qc_code",
+        ]
+        assert packed.columns.get_loc("TMP__qc_code") == packed.columns.get_loc("temperature_quality_code") + 1
+        assert packed["TMP__qc_code"].dtype == np.uint8
+        # PASS, SENTINEL_MISSING, PASS, absent
+        assert packed["TMP__qc_code"].tolist() == [1, 4, 1, 0]
+        assert packed["KA1__part3__qc_code"].tolist() == [0, 1, 0, 5]
+        assert packed["qc_pass_mask_0"].tolist() == [0b00111, 0b11100, 0b00001, 0b01010]
+        assert packed["usable_metric_count"].tolist() == default["usable_metric_count"].tolist()
+        assert packed["usable_metric_fraction"].tolist() == default["usable_metric_fraction"].tolist()
+        assert packed["row_has_any_usable_metric"].tolist() == default["row_has_any_usable_metric"].tolist()
+
+    def test_unpack_restores_the_default_columns(self) -> None:
+        default = clean_noaa_dataframe(self._raw())
+        unpacked = unpack_qc(clean_noaa_dataframe(self._raw(), packed_qc=True))
+        assert list(unpacked.columns) == list(default.columns)
+        for column in default.columns:
+            expected = default[column].astype(object).where(default[column].notna(), None)
+            actual = unpacked[column].astype(object).where(unpacked[column].notna(), None)
+            assert actual.tolist() == expected.tolist(), column
+
+    def test_masks_span_several_words(self) -> None:
+        columns: dict[str, object] = {}
+        passed = [index % 3 == 0 for index in range(70)]
+        for index, ok in enumerate(passed):
+            columns[f"X{index}__qc_pass"] = [ok]
+            columns[f"X{index}__qc_status"] = ["PASS" if ok else "INVALID"]
+            columns[f"X{index}__qc_reason"] = [None if ok else "OUT_OF_RANGE"]
+        packed = pack_qc(pd.DataFrame(columns))
+        low, high = packed["qc_pass_mask_0"].iloc[0], packed["qc_pass_mask_1"].iloc[0]
+        bits = [bool(low >> index & 1) for index in range(64)] + [bool(high >> index & 1) for index in range(6)]
+        assert bits == passed
+        assert packed["usable_metric_count"].iloc[0] == sum(passed)
+        assert packed["usable_metric_fraction"].iloc[0] == pytest.approx(sum(passed) / 70)
+
+    def test_decode_qc_codes(self) -> None:
+        decoded = decode_qc_codes(pd.Series([0, 1, 2, 4], dtype=np.uint8))
+        assert decoded["qc_pass"].tolist() == [None, True, False, False]
+        assert decoded["qc_status"].tolist()[1:] == ["PASS", "INVALID", "MISSING"]
+        assert decoded["qc_reason"].isna().tolist() == [True, True, False, False]
+        assert decoded["qc_reason"].tolist()[2:] == ["MALFORMED_TOKEN", "SENTINEL_MISSING"]
+        assert decode_qc_codes(pd.Series([1, 5], dtype=np.uint8))["qc_pass"].dtype == bool
+        with pytest.raises(ValueError, match="unknown packed QC code 9"):
+            decode_qc_codes(pd.Series([9], dtype=np.uint8, name="TMP__qc_code"))
+
+    def test_unknown_signals_are_rejected(self) -> None:
+        frame = pd.DataFrame(
+            {"TMP__qc_pass": [False], "TMP__qc_status": ["INVALID"], "TMP__qc_reason": ["SOMETHING"]}
+        )
+        with pytest.raises(ValueError, match="no packed code"):
+            pack_qc(frame)
+
+    def test_frames_without_qc_columns_are_unchanged(self) -> None:
+        frame = pd.DataFrame({"DATE": ["20240201"], "NAME": ["ASHEVILLE"]})
+        assert pack_qc(frame) is frame
+
+
+class TestCleanNoaaLong:
+    """Long format: one row per observed part, parsed without the wide frame."""
+
+    @staticmethod
+    def _raw() -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "STATION": ["72315003812"] * 3,
+                "DATE": ["2024-02-01T01:00:00", "2024-02-01T00:00:00", "2024-02-01T02:00:00"],
+                "TMP": ["+0144,1", "+9999,9", None],
+                "WND": ["318,1,N,0061,1", None, "999,9,V,0010,1"],
+                "KA1": [None, None, "024,M,+0700,1"],
+                "REM": ["MET010METAR KAVL", None, None],
+            }
+        )
+
+    def test_columns_and_order(self) -> None:
+        long = clean_noaa_long(self._raw())
+        assert long.dtypes.astype(str).to_dict() == {
+            "station_id": "str", "timestamp": "datetime64[us, UTC]", "identifier": "str",
+            "part": "int8", "value": "float64", "value_text": "str", "quality": "str",
+            "qc_code": "uint8",
+        }
+        assert list(zip(long["identifier"], long["part"])) == [
+            ("KA1", 1), ("KA1", 2), ("KA1", 3),
+            ("TMP", 1), ("TMP", 1),
+            ("WND", 1), ("WND", 3), ("WND", 4), ("WND", 1), ("WND", 3), ("WND", 4),
+        ]
+        assert long.loc[long["identifier"] == "TMP", "timestamp"].dt.hour.tolist() == [0, 1]
+
+    def test_values_quality_and_qc_codes(self) -> None:
+        long = clean_noaa_long(self._raw())
+
+        def rows(identifier: str, part: int) -> pd.DataFrame:
+            return long[(long["identifier"] == identifier) & (long["part"] == part)]
+
+        tmp = rows("TMP", 1)
+        assert tmp["value"].isna().tolist() == [True, False]
+        assert tmp["value"].iloc[1] == pytest.approx(14.4)
+        assert tmp["quality"].tolist() == ["9", "1"]
+        assert tmp["qc_code"].tolist() == [4, 1]
+        wind_type = rows("WND", 3)
+        assert wind_type["value_text"].tolist() == ["N", "V"]
+        assert wind_type["qc_code"].tolist() == [0, 0]
+        assert rows("WND", 4)["value"].tolist() == pytest.approx([6.1, 1.0])
+        assert rows("WND", 1)["quality"].tolist() == ["1", "9"]
+        assert rows("KA1", 3)["qc_code"].tolist() == [5]
+
+    def test_matches_the_wide_output(self) -> None:
+        wide = clean_noaa_dataframe(self._raw())
+        long = clean_noaa_long(self._raw())
+        by_time = wide.set_index(pd.to_datetime(self._raw()["DATE"], utc=True))
+        for column, (identifier, part) in {
+            "temperature_c": ("TMP", 1),
+            "wind_speed_ms": ("WND", 4),
+            "extreme_temp_c_1": ("KA1", 3),
+        }.items():
+            rows = long[(long["identifier"] == identifier) & (long["part"] == part)]
+            expected = by_time[column].reindex(rows["timestamp"]).to_numpy(dtype=float)
+            np.testing.assert_allclose(rows["value"].to_numpy(), expected)
+
+    def test_identifier_selection_and_station_override(self) -> None:
+        long = clean_noaa_long(self._raw(), identifiers=["TMP"], station_id="X")
+        assert set(long["identifier"]) == {"TMP"}
+        assert long["station_id"].eq("X").all()
+        empty = clean_noaa_long(self._raw()[["STATION", "DATE", "REM"]])
+        assert empty.empty
+        assert list(empty.columns) == list(clean_noaa_long(self._raw()).columns)
+
+    def test_rejected_raw_lines_are_left_out(self) -> None:
+        valid_raw = TestControlRecordLengthValidation._build_raw_line(4)
+        df = self._raw().assign(
+            raw_line=[valid_raw, valid_raw[:-1], "BAD" + valid_raw[3:]],
+            TMP=["+0144,1", "+0150,1", "+0160,1"],
+        )
+        long = clean_noaa_long(df)
+        assert long["timestamp"].dt.hour.unique().tolist() == [1]
+        wide = clean_noaa_dataframe(df)
+        assert wide["temperature_c"].notna().tolist() == [True, False, False]
     """A2: Enforce exact identifier token format.
     
     Malformed identifiers (wrong digit count, invalid characters) should be rejected
@@ -6979,3 +7656,527 @@ class TestQCSignalsRegressions:
         # Check for at least one QC column (renamed to friendly name)
         qc_columns = [col for col in result.columns if "__qc_" in col]
         assert len(qc_columns) > 0
+
+
+# ── Vectorized vs reference parsing engine ──────────────────────────────
+
+
+def _parity_tokens(prefix: str) -> list[object]:
+    """Deterministic raw cells exercising sentinels, widths, domains and arity."""
+    rule = get_field_rule(prefix)
+    if rule is None:
+        return ["1,2", "99999,9", "ABC", "", None]
+    parts = [rule.parts[idx] for idx in sorted(rule.parts)]
+
+    def _token(part: FieldPartRule, variant: int) -> str:
+        width = part.token_width or 4
+        if variant == 0 and part.missing_values:
+            return sorted(part.missing_values)[0]
+        if variant == 1 and part.allowed_values:
+            return sorted(part.allowed_values)[0]
+        if variant == 1 and part.allowed_quality:
+            return sorted(part.allowed_quality)[-1]
+        if variant == 2:
+            return "9" * width
+        if variant == 3:
+            return "+" + "1" * width if part.kind == "numeric" else "X"
+        if variant == 4:
+            return "-" + "0" * (width - 1) + "5"
+        if variant == 5:
+            return " " + "2" * (width - 1)
+        if variant == 6:
+            return "3" * (width + 1)
+        return "0" * width
+
+    tokens: list[object] = [
+        ",".join(_token(part, variant) for part in parts) for variant in range(8)
+    ]
+    tokens.append(",".join(_token(part, 7) for part in parts[:-1]))
+    tokens.append(",".join(_token(part, 7) for part in parts) + ",1")
+    tokens.extend(["ABC,DEF", "", None])
+    return tokens
+
+
+_PARITY_IDENTIFIERS = sorted(
+    identifier
+    for identifier in KNOWN_IDENTIFIERS
+    if not (len(identifier) == 3 and identifier[0] in "QPRCDN" and identifier[1:].isdigit())
+) + ["Q01", "P01", "R01", "C01", "D01", "N01", "XX9", "Q100", "WNDX"]
+
+
+class TestVectorizedEngineParity:
+    """The vectorized column engine must match the per-cell reference engine."""
+
+    @pytest.mark.parametrize("strict_mode", [True, False])
+    @pytest.mark.parametrize("identifier", _PARITY_IDENTIFIERS)
+    def test_expand_column_matches_reference(self, identifier, strict_mode):
+        series = pd.Series(_parity_tokens(identifier), dtype=object)
+        rejected = pd.Series(False, index=series.index)
+        rejected.iloc[0] = True
+        reference = _expand_column(
+            series, identifier, strict_mode=strict_mode, rejected_mask=rejected, engine="reference"
+        )
+        vectorized = _expand_column(
+            series, identifier, strict_mode=strict_mode, rejected_mask=rejected, engine="vectorized"
+        )
+        pd.testing.assert_frame_equal(vectorized, reference)
+
+    @pytest.mark.parametrize("strict_mode", [True, False])
+    def test_clean_noaa_dataframe_engines_identical(self, strict_mode):
+        df = pd.DataFrame(
+            {
+                "STATION": ["01234599999"] * 6,
+                "DATE": ["2020-01-01T00:00:00"] * 6,
+                "WND": ["999,1,V,0050,1", "180,1,N,0050,1", "999,9,9,0000,1", "1,1,N,0050,1", "", None],
+                "TMP": ["+0123,1", "+9999,9", "-0050,3", " 012,1", "+01234,1", "0123"],
+                "VIS": ["999999,9,9,9", "200000,1,N,1", "016093,1,N,1", "", None, "1,2"],
+                "OD1": ["2,99,999,0000,1", "2,12,050,0100,1", None, "", "9,99,999,9999,9", "2,12"],
+                "Q01": ["000100,1,APC3", "999999,9,XXXX", None, "", "1,2,3", "000100,1,APC3"],
+                "REM": ["SYN12 remark", None, "MET999", "", "xx", None],
+            }
+        )
+        reference = clean_noaa_dataframe(df, strict_mode=strict_mode, engine="reference")
+        vectorized = clean_noaa_dataframe(df, strict_mode=strict_mode, engine="vectorized")
+        memoized = clean_noaa_dataframe(df, strict_mode=strict_mode, engine="memoized")
+        pd.testing.assert_frame_equal(vectorized, reference)
+        pd.testing.assert_frame_equal(memoized, reference)
+
+    def test_unknown_engine_rejected(self):
+        with pytest.raises(ValueError, match="Unknown parse engine"):
+            _expand_column(pd.Series(["1,2"]), "TMP", engine="bogus")
+
+
+class TestParallelColumnExpansion:
+    """workers= spreads identifier columns over a process pool without changing output."""
+
+    def _frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "STATION": ["01234599999"] * 4,
+                "WND": ["180,1,N,0050,1", "999,9,9,9999,9", "1,1,N,0050,1", None],
+                "TMP": ["+0123,1", "+01234,1", "+9999,9", "-0050,1"],
+                "VIS": ["016093,1,N,1", "999999,9,9,9", "", "1,2"],
+                "OD1": ["2,99,999,0000,1", None, "2,12,050,0100,1", "2,12"],
+            },
+            index=[10, 11, 12, 13],
+        )
+
+    @pytest.mark.parametrize("keep_raw", [True, False])
+    def test_workers_match_serial_output(self, keep_raw):
+        df = self._frame()
+        serial, serial_report = clean_noaa_dataframe(df, keep_raw=keep_raw, return_report=True)
+        parallel, parallel_report = clean_noaa_dataframe(
+            df, keep_raw=keep_raw, return_report=True, workers=2
+        )
+        pd.testing.assert_frame_equal(parallel, serial)
+        assert parallel_report.counts == serial_report.counts
+
+    def test_invalid_workers_rejected(self):
+        with pytest.raises(ValueError, match="workers"):
+            clean_noaa_dataframe(self._frame(), workers=0)
+
+
+def _null_normalized(frame: pd.DataFrame) -> pd.DataFrame:
+    return frame.astype(object).where(frame.notna(), None)
+
+
+class TestRowSharding:
+    """shard_rows cleans contiguous row blocks and stitches them under one schema."""
+
+    def _frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "STATION": ["01234599999"] * 6,
+                "DATE": [f"2020-01-01T0{hour}:00:00" for hour in range(6)],
+                "WND": ["180,1,N,0050,1", "999,9,9,9999,9", None, None, "1,1,N,0050,1", "090,1,N,0010,1"],
+                "TMP": ["+0123,1", "+01234,1", "+9999,9", "-0050,1", None, "+0011,1"],
+                "OD1": [None, None, None, None, "2,99,999,0000,1", "2,12,050,0100,1"],
+                "GA1": ["01,1,+01000,1,06,1", None, "01,1,+01000,1,06,1,9", None, None, None],
+                "REM": ["SYN12 remark", None, "MET999", "", "xx", None],
+            },
+            index=range(100, 106),
+        )
+
+    @pytest.mark.parametrize("strict_mode", [True, False])
+    @pytest.mark.parametrize("shard_rows", [1, 2, 4])
+    def test_sharded_matches_unsharded(self, strict_mode, shard_rows):
+        df = self._frame()
+        expected, expected_report = clean_noaa_dataframe(
+            df, strict_mode=strict_mode, return_report=True
+        )
+        sharded, report = clean_noaa_dataframe(
+            df, strict_mode=strict_mode, return_report=True, shard_rows=shard_rows
+        )
+        pd.testing.assert_index_equal(sharded.columns, expected.columns)
+        pd.testing.assert_series_equal(sharded.dtypes, expected.dtypes)
+        pd.testing.assert_frame_equal(_null_normalized(sharded), _null_normalized(expected))
+        assert report.counts == expected_report.counts
+
+    def test_usability_metrics_recomputed_after_stitch(self):
+        df = self._frame()
+        sharded = clean_noaa_dataframe(df, shard_rows=2)
+        qc_columns = [col for col in sharded.columns if col.endswith("__qc_pass")]
+        assert (sharded["usable_metric_fraction"] == sharded["usable_metric_count"] / len(qc_columns)).all()
+        expected = clean_noaa_dataframe(df)
+        pd.testing.assert_series_equal(sharded["usable_metric_count"], expected["usable_metric_count"])
+
+    def test_sharded_with_workers(self):
+        df = self._frame()
+        sharded = clean_noaa_dataframe(df, shard_rows=3, workers=2)
+        expected = clean_noaa_dataframe(df)
+        pd.testing.assert_frame_equal(_null_normalized(sharded), _null_normalized(expected))
+
+    def test_expansion_decided_on_full_frame(self):
+        df = pd.DataFrame({"TMP": ["+0123,1", "+0150,1", "0123", "0150"]})
+        sharded = clean_noaa_dataframe(df, shard_rows=2, keep_raw=False)
+        assert "TMP" not in sharded.columns
+        assert sharded["temperature_c"].isna().tolist() == [False, False, True, True]
+
+    def test_non_arrow_input_falls_back(self):
+        df = pd.DataFrame({"TMP": ["+0123,1", "+0150,1"], "MIXED": [1, "a"]}, dtype=object)
+        sharded = clean_noaa_dataframe(df, shard_rows=1)
+        assert sharded["MIXED"].tolist() == [1, "a"]
+
+    def test_stitched_order_follows_source_columns(self):
+        order = _stitch_column_order(
+            [
+                ["STATION", "WND", "TMP", "OD1", "WND__part1", "WND__part2", "TMP__value", "QNN__elements"],
+                ["STATION", "WND", "TMP", "OD1", "WND__part1", "WND__extra", "OD1__part1", "QNN__elements"],
+            ],
+            ["WND", "TMP", "OD1"],
+        )
+        assert order == [
+            "STATION", "WND", "TMP", "OD1",
+            "WND__part1", "WND__part2", "WND__extra", "TMP__value", "OD1__part1",
+            "QNN__elements",
+        ]
+
+    def test_invalid_shard_rows_rejected(self):
+        with pytest.raises(ValueError, match="shard_rows"):
+            clean_noaa_dataframe(self._frame(), shard_rows=0)
+
+
+class TestArrowTablePath:
+    """clean_arrow_table cleans a pyarrow Table through Arrow-backed strings."""
+
+    def _table(self) -> pa.Table:
+        return pa.table(
+            {
+                "STATION": ["01234599999", "01234599999", "01234599999"],
+                "DATE": ["2020-01-01T00:00:00", "2020-01-01T01:00:00", "2020-01-01T02:00:00"],
+                "TMP": ["+0123,1", "+9999,9", None],
+                "WND": ["180,1,N,0050,1", "999,9,9,9999,9", "090,1,N,0010,1"],
+                "VIS": ["016093,1,N,1", None, "999999,9,9,9"],
+            }
+        )
+
+    def test_matches_dataframe_api(self):
+        table = self._table()
+        cleaned = clean_arrow_table(table)
+        expected = clean_noaa_dataframe(table.to_pandas())
+        assert cleaned.column_names == list(expected.columns)
+        pd.testing.assert_frame_equal(
+            cleaned.to_pandas(), pa.Table.from_pandas(expected, preserve_index=False).to_pandas()
+        )
+
+    def test_string_outputs_stay_arrow_strings(self):
+        cleaned = clean_arrow_table(self._table())
+        station_type = cleaned.schema.field("STATION").type
+        assert pa.types.is_string(station_type) or pa.types.is_large_string(station_type)
+        assert cleaned.schema.field("temperature_c").type == pa.float64()
+
+    def test_mixed_permissive_parts_become_strings(self):
+        table = pa.table({"TMP": ["+0144,1", "+0150,1"], "ZZ1": ["1,2,3", "4,X,6"]})
+        cleaned = clean_arrow_table(table, strict_mode=False)
+        assert cleaned.schema.field("ZZ1__part1").type == pa.float64()
+        assert cleaned.column("ZZ1__part2").to_pylist() == ["2.0", "X"]
+
+    def test_vectorized_engine_accepts_arrow_and_object_strings(self):
+        values = ["+0123,1", " 012,1", "+01234,1", "", None]
+        arrow_backed = _expand_column(pd.Series(values, dtype="str"), "TMP")
+        object_backed = _expand_column(pd.Series(values, dtype=object), "TMP")
+        pd.testing.assert_frame_equal(arrow_backed, object_backed)
+
+
+class TestColumnBuffers:
+    """Typed expansion buffers keep the dtypes of the per-cell payload frames."""
+
+    def test_typed_columns_for_fully_populated_rows(self):
+        series = pd.Series(["+0123,1", "+9999,9", "-0050,1"], dtype=object)
+        expanded = _expand_column(series, "TMP")
+        assert expanded["TMP__value"].dtype == "float64"
+        assert expanded["TMP__qc_pass"].dtype == bool
+        assert expanded["TMP__qc_status"].tolist() == ["PASS", "MISSING", "PASS"]
+        assert expanded["TMP__qc_reason"].tolist()[1] == "SENTINEL_MISSING"
+
+    def test_absent_rows_fall_back_to_object_qc_pass(self):
+        series = pd.Series(["+0123,1", None], dtype=object)
+        expanded = _expand_column(series, "TMP")
+        assert expanded["TMP__qc_pass"].dtype == object
+        assert expanded["TMP__qc_pass"].tolist()[0] is True
+        assert pd.isna(expanded["TMP__qc_pass"].iloc[1])
+
+    def test_float_buffer_upgrades_to_object_for_text(self):
+        buffers = _ColumnBuffers(3)
+        buffers.write("X__part1", np.array([0]), np.array([1.5]))
+        buffers.write("X__part1", np.array([1, 2]), np.array(["A", None], dtype=object))
+        frame = buffers.frame(["X__part1"], pd.RangeIndex(3))
+        assert frame["X__part1"].tolist() == [1.5, "A", None]
+
+
+class TestMemoizedEngine:
+    """Distinct tokens are parsed once and shared through the LRU parse cache."""
+
+    @pytest.mark.parametrize("strict_mode", [True, False])
+    def test_expand_column_matches_reference(self, strict_mode):
+        cache = ParseCache()
+        for identifier in _PARITY_IDENTIFIERS:
+            tokens = _parity_tokens(identifier)
+            series = pd.Series(tokens + tokens[::-1], dtype=object)
+            rejected = pd.Series(False, index=series.index)
+            rejected.iloc[0] = True
+            reference = _expand_column(
+                series, identifier, strict_mode=strict_mode, rejected_mask=rejected, engine="reference"
+            )
+            memoized = _expand_column_memoized(
+                series, identifier, strict_mode=strict_mode, rejected_mask=rejected, cache=cache
+            )
+            pd.testing.assert_frame_equal(memoized, reference, obj=identifier)
+
+    def test_each_distinct_token_parsed_once(self):
+        cache = ParseCache()
+        series = pd.Series(["+0123,1", "+9999,9", "+0123,1", None, "+0123,1"], dtype=object)
+        _expand_column_memoized(series, "TMP", cache=cache)
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (0, 2, 2)
+
+    def test_cache_shared_across_columns_and_calls(self):
+        cache = ParseCache()
+        series = pd.Series(["+0123,1", "+9999,9"], dtype=object)
+        _expand_column_memoized(series, "TMP", cache=cache)
+        _expand_column_memoized(series, "TMP", cache=cache)
+        _expand_column_memoized(series, "DEW", cache=cache)
+        _expand_column_memoized(series, "TMP", strict_mode=False, cache=cache)
+        stats = cache.stats()
+        assert stats.hits == 2
+        assert stats.misses == 6
+        assert stats.hit_rate == pytest.approx(0.25)
+
+    def test_lru_eviction_respects_maxsize(self):
+        cache = ParseCache(maxsize=2)
+        cache.get_payload("+0010,1", "TMP", True)
+        cache.get_payload("+0020,1", "TMP", True)
+        cache.get_payload("+0010,1", "TMP", True)
+        cache.get_payload("+0030,1", "TMP", True)
+        assert len(cache) == 2
+        cache.get_payload("+0010,1", "TMP", True)
+        cache.get_payload("+0020,1", "TMP", True)
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (2, 4)
+
+    def test_clear_resets_counters(self):
+        cache = ParseCache()
+        cache.get_payload("+0010,1", "TMP", True)
+        cache.get_payload("+0010,1", "TMP", True)
+        cache.clear()
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (0, 0, 0)
+        assert stats.hit_rate == 0.0
+
+    def test_invalid_maxsize_rejected(self):
+        with pytest.raises(ValueError, match="maxsize"):
+            ParseCache(maxsize=0)
+
+
+class TestParserPlans:
+    """Compiled parser plans resolve the same metadata as the rule lookups."""
+
+    def test_plan_compiled_once_and_cached(self):
+        plan = get_parser_plan("TMP")
+        assert PARSER_PLANS["TMP"] is plan
+        assert get_parser_plan("TMP") is plan
+
+    @pytest.mark.parametrize("identifier", sorted(KNOWN_IDENTIFIERS))
+    def test_plan_matches_rule_lookups(self, identifier):
+        plan = get_parser_plan(identifier)
+        rule = get_field_rule(identifier)
+        assert plan.rule is rule
+        assert plan.expected_part_count == get_expected_part_count(identifier)
+        assert sorted(plan.parts) == (sorted(rule.parts) if rule else [])
+        for idx, part_plan in plan.parts.items():
+            width_rules = get_token_width_rules(identifier, idx) or {}
+            assert part_plan.token_width == width_rules.get("width")
+            assert part_plan.token_pattern == width_rules.get("pattern")
+            assert part_plan.key == f"{identifier}__part{idx}"
+
+    def test_wind_special_cases(self):
+        plan = get_parser_plan("WND")
+        assert plan.variable_direction is not None
+        assert plan.variable_direction.target_part == 1
+        assert [(special.target_part, special.value) for special in plan.calm] == [(3, "C")]
+
+    def test_calm_rules_apply_to_repeated_families(self):
+        assert [special.target_part for special in get_parser_plan("OD2").calm] == [3]
+        assert [special.target_part for special in get_parser_plan("OE1").calm] == [4]
+        assert get_parser_plan("TMP").calm == ()
+
+    def test_value_quality_layout(self):
+        assert get_parser_plan("TMP").value_quality is True
+        assert get_parser_plan("WND").value_quality is False
+        assert get_parser_plan("TMP").quality_part == 2
+
+    def test_unknown_identifier_plan_records_gates(self):
+        plan = get_parser_plan("Q100")
+        assert plan.rule is None
+        assert plan.eqd_valid is False
+        assert plan.parts == {}
+        assert plan.part_key(2) == "Q100__part2"
+
+
+def _linear_column_mapping(col: str, exact: dict[str, str], patterns) -> str:
+    """Pre-index mapper: exact map, then first matching pattern in list order."""
+    mapped = exact.get(col)
+    if mapped:
+        return mapped
+    for pattern, template in patterns:
+        match = pattern.match(col)
+        if match:
+            return template.format(**match.groupdict())
+    return col
+
+
+def _column_name_universe() -> list[str]:
+    import noaa_climate_data.constants as constants
+
+    names = set(FRIENDLY_COLUMN_MAP) | set(FRIENDLY_COLUMN_MAP.values())
+    indexes = ["", "0", "1", "2", "9", "01", "10", "12", "99", "x", "1a", "\u0663"]
+    for pattern, _ in constants._FRIENDLY_PATTERNS + constants._INTERNAL_PATTERNS:
+        source = pattern.pattern.lstrip("^").rstrip("$")
+        head, _, tail = re.sub(r"\(\?P<idx>[^()]+\)", "\0", source).partition("\0")
+        for index in indexes:
+            names.add(f"{head}{index}{tail}")
+            names.add(f"{head}{index}{tail}\n")
+            names.add(f"{head}{index}{tail}_extra")
+            names.add(f"X{head}{index}{tail}")
+    for identifier in KNOWN_IDENTIFIERS:
+        for suffix in ("value", "quality", "direction_variable"):
+            names.add(f"{identifier}__{suffix}")
+        for idx in range(1, 14):
+            names.add(f"{identifier}__part{idx}")
+            names.add(f"{identifier}__part{idx}__qc_pass")
+    return sorted(names)
+
+
+class TestIndexedColumnNameMapping:
+    """The indexed friendly/internal mapper matches the linear pattern scan."""
+
+    def test_every_name_maps_like_linear_scan(self):
+        import noaa_climate_data.constants as constants
+
+        internal_map = {v: k for k, v in FRIENDLY_COLUMN_MAP.items()}
+        mismatches = []
+        for name in _column_name_universe():
+            expected_friendly = _linear_column_mapping(
+                name, FRIENDLY_COLUMN_MAP, constants._FRIENDLY_PATTERNS
+            )
+            expected_internal = _linear_column_mapping(
+                name, internal_map, constants._INTERNAL_PATTERNS
+            )
+            expected_round_trip = _linear_column_mapping(
+                expected_friendly, internal_map, constants._INTERNAL_PATTERNS
+            )
+            actual = (
+                to_friendly_column(name),
+                to_internal_column(name),
+                to_internal_column(to_friendly_column(name)),
+            )
+            if actual != (expected_friendly, expected_internal, expected_round_trip):
+                mismatches.append(name)
+        assert mismatches == []
+
+    def test_round_trip_for_expanded_known_identifiers(self):
+        # Friendly names shared by AH/AI map back to the first family only.
+        for identifier in sorted(KNOWN_IDENTIFIERS):
+            for idx in range(1, 4):
+                internal = f"{identifier}__part{idx}"
+                friendly = to_friendly_column(internal)
+                if friendly == internal:
+                    continue
+                assert to_friendly_column(to_internal_column(friendly)) == friendly
+
+    def test_all_patterns_are_indexed(self):
+        import noaa_climate_data.constants as constants
+
+        assert constants._FRIENDLY_PATTERN_INDEX.fallback == []
+        assert constants._INTERNAL_PATTERN_INDEX.fallback == []
+
+    def test_lookups_are_memoized(self):
+        to_friendly_column.cache_clear()
+        to_friendly_column("AA1__part2")
+        to_friendly_column("AA1__part2")
+        info = to_friendly_column.cache_info()
+        assert info.hits >= 1
+        assert info.maxsize is not None
+
+
+class TestParseReport:
+    """Strict-mode rejections are aggregated per (identifier, part, reason)."""
+
+    @pytest.mark.parametrize("identifier", _PARITY_IDENTIFIERS)
+    def test_counts_identical_across_engines(self, identifier):
+        tokens = _parity_tokens(identifier)
+        series = pd.Series(tokens + tokens, dtype=object)
+        reports = {}
+        for engine in ("reference", "vectorized", "memoized"):
+            reports[engine] = ParseReport()
+            _expand_column(series, identifier, engine=engine, report=reports[engine])
+        assert reports["vectorized"].counts == reports["reference"].counts
+        assert reports["memoized"].counts == reports["reference"].counts
+
+    def test_repeated_rejections_logged_once_with_count(self, caplog):
+        df = pd.DataFrame({"TMP": ["+01234,1", "+01234,1", "+012,1", "+0123,1"]})
+        with caplog.at_level("WARNING"):
+            _, report = clean_noaa_dataframe(df, return_report=True)
+        assert report.counts[("TMP", 1, "token_width")] == 3
+        messages = [r.message for r in caplog.records if "Rejected TMP part 1" in r.message]
+        assert messages == [
+            "[PARSE_STRICT] Rejected TMP part 1: token width 3, expected 4 (1 value(s)); "
+            "token width 5, expected 4 (2 value(s))"
+        ]
+
+    def test_report_covers_record_and_column_rejections(self):
+        df = pd.DataFrame({"XYZ": ["1,2", "3,4"], "TMP": ["+0123,1", "1,2,3"]})
+        _, report = clean_noaa_dataframe(df, return_report=True)
+        assert report.counts[("XYZ", None, "unknown_identifier")] == 2
+        assert report.counts[("TMP", None, "extra_payload")] == 1
+        frame = report.to_frame()
+        assert list(frame.columns) == ["identifier", "part", "reason", "count"]
+        assert frame["count"].sum() == report.total == 3
+
+    def test_log_examples_samples_raw_values(self, caplog):
+        df = pd.DataFrame({"TMP": ["+01234,1", "+05678,1", "+09999,1", "+0123,1"]})
+        with caplog.at_level("WARNING"):
+            _, report = clean_noaa_dataframe(df, return_report=True, log_examples=2)
+        assert report.examples[("TMP", 1, "token_width")] == ["+01234,1", "+05678,1"]
+        examples = [r.message for r in caplog.records if "Example TMP part 1" in r.message]
+        assert len(examples) == 2
+
+    def test_no_examples_by_default(self):
+        df = pd.DataFrame({"TMP": ["+01234,1"]})
+        _, report = clean_noaa_dataframe(df, return_report=True)
+        assert report.examples == {}
+
+    def test_merge_adds_counts(self):
+        first = ParseReport()
+        first.record("TMP", 1, "token_width", "token width 5, expected 4", count=2)
+        second = ParseReport()
+        second.record("TMP", 1, "token_width", "token width 5, expected 4")
+        second.record("WND", None, "truncated_payload", "truncated payload", count=4)
+        first.merge(second)
+        assert first.counts[("TMP", 1, "token_width")] == 3
+        assert first.total == 7
+
+    def test_clean_value_quality_without_report_logs_each_rejection(self, caplog):
+        with caplog.at_level("WARNING"):
+            clean_value_quality("+01234,1", "TMP")
+        assert "[PARSE_STRICT] Rejected TMP part 1: token width 5, expected 4" in caplog.text
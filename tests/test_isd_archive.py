@@ -0,0 +1,125 @@
+"""Tests for the fixed-width ISD archive reader."""
+
+from __future__ import annotations
+
+import gzip
+import logging
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from noaa_climate_data.cleaning import clean_noaa_dataframe
+from noaa_climate_data.constants import get_archive_part_widths
+from noaa_climate_data.isd_archive import read_isd_archive
+
+_MANDATORY = (
+    "318" "1" "N" "0061" "1"
+    "22000" "1" "9" "N"
+    "016093" "1" "9" "9"
+    "+0144" "1"
+    "+0100" "1"
+    "10165" "1"
+)
+
+
+def _record(time: str = "1230", additional: str = "") -> str:
+    header = (
+        f"{len(additional):04d}" "723150" "03812" "20240201" + time
+        + "4" "+35432" "-082542" "+0661" "FM-15" "KAVL " "V02 "
+    )
+    return header + _MANDATORY + additional
+
+
+def _archive(*records: str) -> bytes:
+    return ("\n".join(records) + "\n").encode()
+
+
+class TestReadIsdArchive:
+    """Fixed-width records are cut into the CSV access column layout."""
+
+    def test_control_and_mandatory_columns(self) -> None:
+        frame = read_isd_archive(_archive(_record()))
+        row = frame.iloc[0]
+        assert list(frame.columns) == [
+            "STATION", "DATE", "SOURCE", "LATITUDE", "LONGITUDE", "ELEVATION",
+            "REPORT_TYPE", "CALL_SIGN", "QUALITY_CONTROL",
+            "WND", "CIG", "VIS", "TMP", "DEW", "SLP",
+        ]
+        assert row["STATION"] == "72315003812"
+        assert row["DATE"] == "2024-02-01T12:30:00"
+        assert row["REPORT_TYPE"] == "FM-15"
+        assert row["WND"] == "318,1,N,0061,1"
+        assert row["CIG"] == "22000,1,9,N"
+        assert row["VIS"] == "016093,1,9,9"
+        assert row["TMP"] == "+0144,1"
+        assert all(isinstance(dtype, pd.StringDtype) for dtype in frame.dtypes)
+
+    def test_additional_elements_are_tokenized_by_identifier(self) -> None:
+        frame = read_isd_archive(
+            _archive(
+                _record(additional="ADDAA101000091MW1051REMMET010METAR TESTEQDQ01+001231APC3  "),
+                _record(time="1330"),
+                _record(time="1430", additional="ADDGA1011+004501061REMSYN004BUFRQNNA0011B0021000123000456"),
+                _record(time="1530", additional="ADDHL10501"),
+            )
+        )
+        assert list(frame.columns[15:]) == ["AA1", "GA1", "HAIL", "MW1", "REM", "Q01", "QNN"]
+        assert frame.loc[0, "AA1"] == "01,0000,9,1"
+        assert frame.loc[0, "MW1"] == "05,1"
+        assert frame.loc[0, "REM"] == "MET010METAR TEST"
+        assert frame.loc[0, "Q01"] == "+00123,1,APC3  "
+        assert frame.loc[2, "GA1"] == "01,1,+00450,1,06,1"
+        assert frame.loc[2, "REM"] == "SYN004BUFR"
+        assert frame.loc[2, "QNN"] == "QNNA0011B0021000123000456"
+        assert frame.loc[3, "HAIL"] == "050,1"
+        assert frame.loc[1, ["AA1", "MW1", "REM", "QNN"]].isna().all()
+
+    def test_unknown_identifier_stops_additional_section(self, caplog: pytest.LogCaptureFixture) -> None:
+        with caplog.at_level(logging.WARNING, logger="noaa_climate_data.isd_archive"):
+            frame = read_isd_archive(_archive(_record(additional="ADDZZ9123AA101000091")))
+        assert "AA1" not in frame.columns
+        assert "unknown or truncated identifier 'ZZ9'" in caplog.text
+
+    def test_truncated_element_is_skipped(self, caplog: pytest.LogCaptureFixture) -> None:
+        with caplog.at_level(logging.WARNING, logger="noaa_climate_data.isd_archive"):
+            frame = read_isd_archive(_archive(_record(additional="ADDAA10100")))
+        assert "AA1" not in frame.columns
+        assert "'AA1'" in caplog.text
+
+    def test_gzip_and_plain_files_match(self, tmp_path: Path) -> None:
+        data = _archive(_record(additional="ADDMW1051"), _record(time="1330"))
+        plain = tmp_path / "723150-03812-2024"
+        plain.write_bytes(data.replace(b"\n", b"\r\n"))
+        compressed = tmp_path / "723150-03812-2024.gz"
+        compressed.write_bytes(gzip.compress(data))
+        expected = read_isd_archive(data)
+        pd.testing.assert_frame_equal(read_isd_archive(plain), expected)
+        pd.testing.assert_frame_equal(read_isd_archive(compressed), expected)
+        pd.testing.assert_frame_equal(read_isd_archive(gzip.compress(data)), expected)
+
+    def test_raw_line_is_kept_for_validation(self) -> None:
+        good = _record(additional="ADDMW1051")
+        bad = "0000" + good[4:]
+        frame = read_isd_archive(_archive(good, bad), keep_raw_line=True)
+        assert frame["raw_line"].tolist() == [good, bad]
+        cleaned = clean_noaa_dataframe(frame, keep_raw=False)
+        assert cleaned["__parse_error"].isna().tolist() == [True, False]
+
+    def test_output_cleans_like_csv_access_rows(self) -> None:
+        frame = read_isd_archive(_archive(_record(additional="ADDAA101000091HL10501")))
+        cleaned = clean_noaa_dataframe(frame, keep_raw=False)
+        assert cleaned.loc[0, "temperature_c"] == pytest.approx(14.4)
+        assert cleaned.loc[0, "wind_speed_ms"] == pytest.approx(6.1)
+
+
+class TestArchivePartWidths:
+    """Part widths of additional-data elements in the archive format."""
+
+    def test_family_and_exact_widths(self) -> None:
+        assert get_archive_part_widths("AA3") == (2, 4, 1, 1)
+        assert get_archive_part_widths("HL1") == (3, 1)
+        assert get_archive_part_widths("Q05") == (6, 1, 6)
+        assert get_archive_part_widths("Q00") is None
+        assert get_archive_part_widths("ZZ9") is None
+        assert get_archive_part_widths("AA") is None
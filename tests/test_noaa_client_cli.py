@@ -2,15 +2,30 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+import gzip
+import json
 import sys
+import os
+import threading
+import time
+import zlib
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
+import requests
 
-from noaa_climate_data import noaa_client
+from noaa_climate_data import noaa_client, pipeline
+from noaa_climate_data.cleaning import clean_noaa_dataframe, clean_noaa_long, unpack_qc
+from noaa_climate_data.constants import MAX_DOWNLOAD_CONCURRENCY, METADATA_PROBE_BYTES
+from noaa_climate_data.noaa_client import StationFileCache
 from noaa_climate_data.pipeline import LocationDataOutputs
 import noaa_climate_data.cli as cli
 
@@ -22,17 +37,114 @@ class _FakeDateTime:
         return datetime(2025, 1, 1, 0, 0, 0, tzinfo=tz)
 
 
+@dataclass
+class _StandIn:
+    """Local stand-in for the NCEI access tree, serving ``/<year>/<file>``."""
+
+    files: dict[str, bytes]
+    delay: float = 0.0
+    base_url: str = ""
+    starts: list[float] = field(default_factory=list)
+    clients: set[tuple[str, int]] = field(default_factory=set)
+    validators: list[str | None] = field(default_factory=list)
+    ignore_range: bool = False
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+@contextmanager
+def _noaa_stand_in(files: dict[str, bytes], delay: float = 0.0) -> Iterator[_StandIn]:
+    stand_in = _StandIn(files=files, delay=delay)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            with stand_in.lock:
+                stand_in.starts.append(time.monotonic())
+                stand_in.clients.add(self.client_address)
+                stand_in.validators.append(self.headers.get("If-None-Match"))
+                stand_in.in_flight += 1
+                stand_in.peak_in_flight = max(stand_in.peak_in_flight, stand_in.in_flight)
+            try:
+                time.sleep(stand_in.delay)
+                body = stand_in.files.get(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                etag = f'"{zlib.crc32(body):08x}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                requested = self.headers.get("Range")
+                if requested and not stand_in.ignore_range:
+                    last = min(int(requested.removeprefix("bytes=0-")), len(body) - 1)
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes 0-{last}/{len(body)}")
+                    body = body[: last + 1]
+                else:
+                    self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", "Mon, 01 Jan 2024 00:00:00 GMT")
+                self.send_header("Content-Type", "text/csv")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            finally:
+                with stand_in.lock:
+                    stand_in.in_flight -= 1
+
+        def log_message(self, *_: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    stand_in.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        yield stand_in
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def _yearly_csvs(file_name: str, years: range) -> dict[str, bytes]:
+    return {
+        f"/{year}/{file_name}": (
+            "STATION,DATE,TMP\n"
+            f"72315003812,{year}-01-01T00:00:00,\"+0100,1\"\n"
+            f"72315003812,{year}-01-01T01:00:00,\"+0110,1\"\n"
+        ).encode()
+        for year in years
+    }
+
+
 class TestNoaaClient:
     def test_get_years_parses_dirs(self, monkeypatch: pytest.MonkeyPatch) -> None:
         table = pd.DataFrame({0: ["2020/", "2021/", "bad/", "202A/", "2021/", None]})
-        monkeypatch.setattr(noaa_client.pd, "read_html", lambda url: [table])
-        years = noaa_client.get_years(retries=0)
+        transport = noaa_client.NoaaTransport()
+        monkeypatch.setattr(transport, "get_text", lambda url: "<table></table>")
+        monkeypatch.setattr(noaa_client.pd, "read_html", lambda html: [table])
+        years = noaa_client.get_years(retries=0, transport=transport)
         assert years == ["2020", "2021"]
 
     def test_get_file_list_for_year(self, monkeypatch: pytest.MonkeyPatch) -> None:
         table = pd.DataFrame({0: ["AAA.csv", "BBB.txt", None, "CCC.csv"]})
-        monkeypatch.setattr(noaa_client.pd, "read_html", lambda url: [table])
-        files = noaa_client.get_file_list_for_year("2020", retries=0)
+        transport = noaa_client.NoaaTransport()
+        requested: list[str] = []
+
+        def fake_get_text(url: str) -> str:
+            requested.append(url)
+            return "<table></table>"
+
+        monkeypatch.setattr(transport, "get_text", fake_get_text)
+        monkeypatch.setattr(noaa_client.pd, "read_html", lambda html: [table])
+        files = noaa_client.get_file_list_for_year("2020", retries=0, transport=transport)
+        assert requested == [f"{noaa_client.BASE_URL}/2020/"]
         assert files == ["AAA.csv", "CCC.csv"]
 
     def test_build_file_list(self, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -57,6 +169,20 @@ class TestNoaaClient:
         assert row_a["No_Of_Years"] == 2
         assert row_b["No_Of_Years"] == 1
 
+    def test_build_station_year_index(self) -> None:
+        file_list = pd.DataFrame(
+            {
+                "YEAR": ["2019", "2021", "2020", "bad", "2021", "2021"],
+                "FileName": ["A.csv", "A.csv", "723150-03812", "A.csv", "A.csv", "B.csv"],
+            }
+        )
+        index = noaa_client.build_station_year_index(file_list)
+        assert index == {
+            "A.csv": (2021, 2019),
+            "72315003812.csv": (2020,),
+            "B.csv": (2021,),
+        }
+
     def test_normalize_station_file_name(self) -> None:
         assert (
             noaa_client.normalize_station_file_name("723150-03812-2006.csv")
@@ -68,7 +194,6 @@ class TestNoaaClient:
         )
 
     def test_fetch_station_metadata(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setattr(noaa_client, "_url_exists", lambda *_args, **_kwargs: True)
         frame = pd.DataFrame(
             [
                 {
@@ -81,7 +206,7 @@ class TestNoaaClient:
         )
         monkeypatch.setattr(
             noaa_client,
-            "_read_csv_head_with_retries",
+            "_probe_csv_head",
             lambda *_args, **_kwargs: frame,
         )
         metadata = noaa_client.fetch_station_metadata("723150-03812-2006.csv", 2020, retries=0)
@@ -186,6 +311,7 @@ class TestCliCommands:
             called["output_csv"] = output_csv
             called["metadata_years"] = list(metadata_years)
             called["resume"] = kwargs.get("resume")
+            called["workers"] = kwargs.get("workers")
             return pd.DataFrame()
 
         monkeypatch.setattr(cli, "build_location_ids", fake_build_location_ids)
@@ -201,6 +327,8 @@ class TestCliCommands:
                 "--end-year",
                 "2001",
                 "--no-resume",
+                "--workers",
+                "4",
             ],
         )
         cli.main()
@@ -209,6 +337,7 @@ class TestCliCommands:
         assert called["output_csv"].resolve() == (base_dir / "Stations.csv").resolve()
         assert called["metadata_years"] == [2000, 2001]
         assert called["resume"] is False
+        assert called["workers"] == 4
 
     def test_cli_process_location_writes_outputs(
         self,
@@ -218,8 +347,10 @@ class TestCliCommands:
         monkeypatch.chdir(tmp_path)
         output_dir = tmp_path / "out"
         sample = pd.DataFrame({"value": [1]})
+        called: dict[str, object] = {}
 
-        def fake_process_location(*_: object, **__: object) -> LocationDataOutputs:
+        def fake_process_location(*_: object, **kwargs: object) -> LocationDataOutputs:
+            called.update(kwargs)
             return LocationDataOutputs(
                 raw=sample,
                 cleaned=sample,
@@ -242,10 +373,17 @@ class TestCliCommands:
                 "2020",
                 "--output-dir",
                 str(output_dir),
+                "--max-concurrency",
+                "2",
+                "--cache-dir",
+                str(tmp_path / "cache"),
             ],
         )
         cli.main()
 
+        assert called["max_concurrency"] == 2
+        assert isinstance(called["cache"], StationFileCache)
+        assert called["cache"].cache_dir == tmp_path / "cache"
         assert (output_dir / "LocationData_Raw.csv").exists()
         assert (output_dir / "LocationData_Cleaned.csv").exists()
         assert (output_dir / "LocationData_Hourly.csv").exists()
@@ -292,6 +430,8 @@ class TestCliCommands:
                 "0.25",
                 "--seed",
                 "7",
+                "--max-concurrency",
+                "3",
             ],
         )
         cli.main()
@@ -301,6 +441,8 @@ class TestCliCommands:
         assert called["output_dir"].resolve() == (tmp_path / "output").resolve()
         assert called["sleep_seconds"] == 0.25
         assert called["seed"] == 7
+        assert called["max_concurrency"] == 3
+        assert called["cache"] is None
 
     def test_cli_clean_parquet_invokes_cleaner(
         self,
@@ -345,3 +487,780 @@ class TestCliCommands:
         assert called["stations_csv"].resolve() == (base_dir / "Stations.csv").resolve()
         assert called["file_name"] == "TEST.csv"
         assert called["station_id"] == "TESTID"
+        assert called["workers"] is None
+        assert called["identifiers"] is None
+        assert called["chunk_rows"] == 100_000
+        assert called["packed_qc"] is False
+        assert called["compact"] is False
+        assert called["layout"] == "wide"
+
+    def test_cli_clean_parquet_passes_workers(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        raw_path = tmp_path / "raw.parquet"
+        raw_path.write_text("fake")
+
+        called: dict[str, object] = {}
+
+        def fake_clean_parquet_file(raw_parquet: Path, **kwargs: object) -> Path:
+            called.update(kwargs)
+            return tmp_path / "LocationData_Cleaned.parquet"
+
+        monkeypatch.setattr(cli, "clean_parquet_file", fake_clean_parquet_file)
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "prog",
+                "clean-parquet",
+                str(raw_path),
+                "--stations-csv",
+                str(tmp_path / "Stations.csv"),
+                "--workers",
+                "4",
+                "--shard-rows",
+                "500000",
+                "--identifiers",
+                "tmp, DEW,AA1",
+                "--chunk-rows",
+                "5000",
+                "--packed-qc",
+                "--compact-dtypes",
+                "--long",
+            ],
+        )
+        cli.main()
+
+        assert called["workers"] == 4
+        assert called["shard_rows"] == 500000
+        assert called["identifiers"] == ["TMP", "DEW", "AA1"]
+        assert called["chunk_rows"] == 5000
+        assert called["packed_qc"] is True
+        assert called["compact"] is True
+        assert called["layout"] == "long"
+
+
+class TestNoaaTransport:
+    """Pooled session, keep-alive and request counters."""
+
+    def test_requests_reuse_one_connection_and_are_recorded(self) -> None:
+        files = _yearly_csvs("72315003812.csv", range(2018, 2021))
+        with _noaa_stand_in(files) as stand_in, noaa_client.NoaaTransport() as transport:
+            raw = pipeline.download_location_data(
+                "72315003812.csv",
+                [2018, 2019, 2020, 2021],
+                base_url=stand_in.base_url,
+                transport=transport,
+            )
+        assert raw["YEAR"].drop_duplicates().tolist() == [2018, 2019, 2020]
+        assert len(stand_in.clients) == 1
+        assert [record.status for record in transport.records] == [200, 200, 200, 404]
+        served = sum(len(body) for body in files.values())
+        assert sum(record.bytes_received for record in transport.records[:3]) == served
+        summary = transport.summary()
+        assert summary.loc["GET", "requests"] == 4
+        assert summary.loc["GET", "errors"] == 1
+        assert summary.loc["GET", "seconds"] > 0
+
+    def test_get_range_reads_only_the_requested_prefix(self) -> None:
+        body = b"STATION,NAME\n" + b"72315003812,ASHEVILLE\n" * 20_000
+        files = {"/2020/72315003812.csv": body}
+        with _noaa_stand_in(files) as stand_in, noaa_client.NoaaTransport() as transport:
+            url = f"{stand_in.base_url}/2020/72315003812.csv"
+            assert transport.get_range(url, 100) == (206, body[:100])
+            assert transport.get_range(url, 50) == (206, body[:50])
+            stand_in.ignore_range = True
+            assert transport.get_range(url, 100) == (200, body[:100])
+        assert len(stand_in.clients) <= 2
+        assert [record.bytes_received for record in transport.records[:2]] == [100, 50]
+        assert transport.records[2].bytes_received < 20_000
+
+    def test_request_slots_are_shared_across_threads_and_transports(self) -> None:
+        files = {
+            f"/2020/S{number:02d}.csv": b"STATION,NAME\n72315003812,ASHEVILLE\n"
+            for number in range(12)
+        }
+        with _noaa_stand_in(files, delay=0.1) as stand_in:
+
+            def probe(number: int) -> int:
+                with noaa_client.NoaaTransport() as transport:
+                    url = f"{stand_in.base_url}/2020/S{number:02d}.csv"
+                    return transport.get_range(url, 100)[0]
+
+            threads = [
+                threading.Thread(target=probe, args=(number,)) for number in range(12)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert len(stand_in.starts) == 12
+        assert 1 < stand_in.peak_in_flight <= MAX_DOWNLOAD_CONCURRENCY
+
+    def test_failed_connection_is_recorded_without_status(self) -> None:
+        transport = noaa_client.NoaaTransport(connect_timeout=0.5)
+        with _noaa_stand_in({}) as stand_in:
+            url = f"{stand_in.base_url}/2020/missing.csv"
+        with pytest.raises(requests.RequestException):
+            transport.get_bytes(url)
+        assert transport.records[0].status is None
+        assert transport.summary().loc["GET", "errors"] == 1
+
+    def test_records_are_bounded_and_totals_survive_until_reset(self) -> None:
+        files = _yearly_csvs("72315003812.csv", range(2018, 2021))
+        with _noaa_stand_in(files) as stand_in:
+            with noaa_client.NoaaTransport(max_records=2) as transport:
+                for year in (2018, 2019, 2020, 2018):
+                    transport.request("GET", f"{stand_in.base_url}/{year}/72315003812.csv")
+        assert [record.url.rsplit("/", 2)[1] for record in transport.records] == ["2020", "2018"]
+        summary = transport.summary()
+        assert summary.loc["GET", "requests"] == 4
+        assert summary.loc["GET", "errors"] == 0
+        served = sum(len(body) for body in files.values()) + len(files["/2018/72315003812.csv"])
+        assert summary.loc["GET", "bytes_received"] == served
+        transport.reset()
+        assert transport.records == []
+        assert transport.summary().empty
+
+    def test_cli_summary_resets_the_transport(self, capsys: pytest.CaptureFixture[str]) -> None:
+        files = _yearly_csvs("72315003812.csv", range(2020, 2021))
+        with _noaa_stand_in(files) as stand_in, noaa_client.NoaaTransport() as transport:
+            transport.get_bytes(f"{stand_in.base_url}/2020/72315003812.csv")
+            cli._print_transport_summary(transport)
+            assert "HTTP requests:" in capsys.readouterr().out
+            assert transport.records == []
+            cli._print_transport_summary(transport)
+            assert capsys.readouterr().out == ""
+
+
+class TestMetadataProbe:
+    """Station metadata from one ranged GET per candidate year."""
+
+    _BODY = (
+        b"STATION,DATE,LATITUDE,LONGITUDE,ELEVATION,NAME,TMP\n"
+        b'72315003812,2020-01-01T00:00:00,35.4,-82.5,661.0,ASHEVILLE,"+0100,1"\n'
+    ) + b'72315003812,2020-01-01T01:00:00,35.4,-82.5,661.0,ASHEVILLE,"+0110,1"\n' * 5_000
+
+    def test_one_small_request_per_year(self) -> None:
+        files = {"/2021/72315003812.csv": self._BODY}
+        with _noaa_stand_in(files) as stand_in, noaa_client.NoaaTransport() as transport:
+            metadata, year = noaa_client.fetch_station_metadata_for_years(
+                "723150-03812",
+                [2019, 2020, 2021],
+                retries=0,
+                transport=transport,
+                base_url=stand_in.base_url,
+            )
+        assert year == 2021
+        assert metadata == noaa_client.StationMetadata(
+            latitude=35.4,
+            longitude=-82.5,
+            elevation=661.0,
+            name="ASHEVILLE",
+            file_name="72315003812.csv",
+        )
+        assert [(record.method, record.status) for record in transport.records] == [
+            ("GET", 404),
+            ("GET", 404),
+            ("GET", 206),
+        ]
+        assert transport.records[-1].bytes_received == METADATA_PROBE_BYTES
+        assert len(stand_in.clients) <= 3
+
+    def test_range_grows_for_long_first_row(self) -> None:
+        header = b"STATION,LATITUDE,NAME," + b",".join(b"C%04d" % index for index in range(1_500))
+        row = b"72315003812,35.4,ASHEVILLE," + b",".join(b"x" for _ in range(1_500))
+        files = {"/2020/72315003812.csv": header + b"\n" + (row + b"\n") * 10}
+        with _noaa_stand_in(files) as stand_in, noaa_client.NoaaTransport() as transport:
+            metadata = noaa_client.fetch_station_metadata(
+                "72315003812.csv", 2020, retries=0, transport=transport, base_url=stand_in.base_url
+            )
+        assert metadata is not None
+        assert metadata.latitude == 35.4
+        assert metadata.name == "ASHEVILLE"
+        assert [record.bytes_received for record in transport.records] == [
+            METADATA_PROBE_BYTES,
+            4 * METADATA_PROBE_BYTES,
+        ]
+
+    def test_server_ignoring_range_is_cut_off(self) -> None:
+        files = {"/2020/72315003812.csv": self._BODY}
+        with _noaa_stand_in(files) as stand_in, noaa_client.NoaaTransport() as transport:
+            stand_in.ignore_range = True
+            metadata = noaa_client.fetch_station_metadata(
+                "72315003812.csv", 2020, retries=0, transport=transport, base_url=stand_in.base_url
+            )
+        assert metadata is not None and metadata.name == "ASHEVILLE"
+        assert transport.records[0].status == 200
+        assert transport.records[0].bytes_received < len(self._BODY) // 10
+
+    def test_year_index_probes_listed_years_newest_first(self) -> None:
+        files = {"/2016/72315003812.csv": self._BODY, "/2019/72315003812.csv": self._BODY}
+        index = {"72315003812.csv": (2021, 2019, 2016)}
+        with _noaa_stand_in(files) as stand_in, noaa_client.NoaaTransport() as transport:
+            metadata, year = noaa_client.fetch_station_metadata_for_years(
+                "723150-03812",
+                range(2010, 2021),
+                retries=0,
+                transport=transport,
+                base_url=stand_in.base_url,
+                year_index=index,
+            )
+        assert metadata is not None
+        assert year == 2019
+        assert [record.url.rsplit("/", 2)[1] for record in transport.records] == ["2019"]
+
+    def test_station_missing_from_index_is_not_probed(self) -> None:
+        transport = noaa_client.NoaaTransport()
+        metadata, year = noaa_client.fetch_station_metadata_for_years(
+            "72315003812.csv",
+            range(2010, 2021),
+            retries=0,
+            transport=transport,
+            year_index={"OTHER.csv": (2020,)},
+        )
+        assert (metadata, year) == (None, None)
+        assert transport.records == []
+
+    def test_header_only_file_has_no_metadata(self) -> None:
+        files = {"/2020/72315003812.csv": b"STATION,LATITUDE,NAME\n"}
+        with _noaa_stand_in(files) as stand_in, noaa_client.NoaaTransport() as transport:
+            metadata = noaa_client.fetch_station_metadata(
+                "72315003812.csv", 2020, retries=0, transport=transport, base_url=stand_in.base_url
+            )
+        assert metadata is None
+        assert len(transport.records) == 1
+
+
+class TestStationFileCache:
+    """On-disk cache of yearly CSVs with conditional revalidation."""
+
+    def test_past_years_are_served_without_network(self, tmp_path: Path) -> None:
+        files = _yearly_csvs("72315003812.csv", range(2018, 2021))
+        cache = StationFileCache(tmp_path / "cache", current_year=2025)
+        with _noaa_stand_in(files) as stand_in:
+            first = pipeline.download_location_data(
+                "72315003812.csv", range(2018, 2021), base_url=stand_in.base_url, cache=cache
+            )
+            served = len(stand_in.starts)
+            second = pipeline.download_location_data(
+                "72315003812.csv", range(2018, 2021), base_url=stand_in.base_url, cache=cache
+            )
+        pd.testing.assert_frame_equal(second, first)
+        assert served == 3
+        assert len(stand_in.starts) == 3
+        assert (cache.downloads, cache.hits) == (3, 3)
+        stored = tmp_path / "cache" / "2019" / "72315003812.csv.gz"
+        assert stored.stat().st_size > 0
+        assert json.loads(stored.with_name("72315003812.json").read_text())["etag"]
+
+    def test_current_year_is_revalidated_with_etag(self, tmp_path: Path) -> None:
+        files = _yearly_csvs("72315003812.csv", range(2025, 2026))
+        cache = StationFileCache(tmp_path, current_year=2025)
+        with _noaa_stand_in(files) as stand_in, noaa_client.NoaaTransport() as transport:
+            url = f"{stand_in.base_url}/2025/72315003812.csv"
+            body = cache.fetch(2025, "72315003812.csv", url, transport)
+            assert cache.fetch(2025, "723150-03812", url, transport) == body
+            files["/2025/72315003812.csv"] = body + b'72315003812,2025-01-01T02:00:00,"+0120,1"\n'
+            updated = cache.fetch(2025, "72315003812.csv", url, transport)
+        assert stand_in.validators[0] is None
+        assert stand_in.validators[1] == stand_in.validators[2] == f'"{zlib.crc32(body):08x}"'
+        assert [record.status for record in transport.records] == [200, 304, 200]
+        assert transport.records[1].bytes_received == 0
+        assert updated == files["/2025/72315003812.csv"]
+        assert (cache.downloads, cache.revalidated) == (2, 1)
+        assert cache.get(2025, "72315003812.csv") == updated
+
+    def test_truncated_entry_is_refetched(self, tmp_path: Path) -> None:
+        files = _yearly_csvs("72315003812.csv", range(2020, 2021))
+        cache = StationFileCache(tmp_path, current_year=2025)
+        with _noaa_stand_in(files) as stand_in, noaa_client.NoaaTransport() as transport:
+            url = f"{stand_in.base_url}/2020/72315003812.csv"
+            body = cache.fetch(2020, "72315003812.csv", url, transport)
+            stored = tmp_path / "2020" / "72315003812.csv.gz"
+            stored.write_bytes(gzip.compress(body[:-5]))
+            assert cache.get(2020, "72315003812.csv") is None
+            assert cache.fetch(2020, "72315003812.csv", url, transport) == body
+        assert cache.downloads == 2
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path: Path) -> None:
+        names = ["A.csv", "B.csv", "C.csv", "D.csv"]
+        files = {f"/2020/{name}": os.urandom(4_000) for name in names}
+        cache = StationFileCache(tmp_path, max_bytes=10_000, current_year=2025)
+        with _noaa_stand_in(files) as stand_in, noaa_client.NoaaTransport() as transport:
+            for age, name in enumerate(names[:2], start=1):
+                cache.fetch(2020, name, f"{stand_in.base_url}/2020/{name}", transport)
+                stamp = time.time() - 1000 * age
+                os.utime(tmp_path / "2020" / f"{Path(name).stem}.csv.gz", (stamp, stamp))
+            assert cache.get(2020, "B.csv") is not None
+            cache.fetch(2020, "C.csv", f"{stand_in.base_url}/2020/C.csv", transport)
+        assert sorted(path.name for path in (tmp_path / "2020").glob("*.csv.gz")) == [
+            "B.csv.gz",
+            "C.csv.gz",
+        ]
+        assert not (tmp_path / "2020" / "A.json").exists()
+
+    def test_directory_is_scanned_only_when_over_the_cap(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        names = ["A.csv", "B.csv", "C.csv"]
+        files = {f"/2025/{name}": os.urandom(4_000) for name in names}
+        cache = StationFileCache(tmp_path, max_bytes=10_000, current_year=2025)
+        scan = cache._scan
+        scans = []
+        monkeypatch.setattr(cache, "_scan", lambda: scans.append(1) or scan())
+        with _noaa_stand_in(files) as stand_in, noaa_client.NoaaTransport() as transport:
+            for name in names[:2]:
+                cache.fetch(2025, name, f"{stand_in.base_url}/2025/{name}", transport)
+            files["/2025/A.csv"] = os.urandom(5_000)
+            cache.fetch(2025, "A.csv", f"{stand_in.base_url}/2025/A.csv", transport)
+            assert len(scans) == 1
+            cache.fetch(2025, "C.csv", f"{stand_in.base_url}/2025/C.csv", transport)
+        assert len(scans) == 2
+        stored = list((tmp_path / "2025").glob("*.csv.gz"))
+        assert len(stored) == 2
+        assert cache._total_bytes == sum(path.stat().st_size for path in stored)
+
+    def test_metadata_is_read_from_cached_file(self, tmp_path: Path) -> None:
+        body = b"STATION,LATITUDE,LONGITUDE,ELEVATION,NAME\n72315003812,35.4,-82.5,661.0,ASHEVILLE\n"
+        cache = StationFileCache(tmp_path, current_year=2025)
+        with _noaa_stand_in({"/2020/72315003812.csv": body}) as stand_in:
+            with noaa_client.NoaaTransport() as transport:
+                cache.fetch(2020, "72315003812.csv", f"{stand_in.base_url}/2020/72315003812.csv", transport)
+                metadata = noaa_client.fetch_station_metadata(
+                    "723150-03812-2020", 2020, retries=0, transport=transport, cache=cache
+                )
+        assert len(transport.records) == 1
+        assert metadata == noaa_client.StationMetadata(
+            latitude=35.4,
+            longitude=-82.5,
+            elevation=661.0,
+            name="ASHEVILLE",
+            file_name="72315003812.csv",
+        )
+
+    def test_empty_body_is_not_stored(self, tmp_path: Path) -> None:
+        cache = StationFileCache(tmp_path, current_year=2025)
+        with _noaa_stand_in({"/2020/72315003812.csv": b""}) as stand_in:
+            with noaa_client.NoaaTransport() as transport:
+                url = f"{stand_in.base_url}/2020/72315003812.csv"
+                assert cache.fetch(2020, "72315003812.csv", url, transport) == b""
+        assert not (tmp_path / "2020" / "72315003812.csv.gz").exists()
+        assert cache.get(2020, "72315003812.csv") is None
+
+    @pytest.mark.parametrize("stored", [b"", b"\n\n"])
+    def test_empty_cached_entry_falls_back_to_probe(
+        self, tmp_path: Path, stored: bytes
+    ) -> None:
+        body = b"STATION,LATITUDE,LONGITUDE,ELEVATION,NAME\n72315003812,35.4,-82.5,661.0,ASHEVILLE\n"
+        year_dir = tmp_path / "2020"
+        year_dir.mkdir()
+        (year_dir / "72315003812.csv.gz").write_bytes(gzip.compress(stored))
+        (year_dir / "72315003812.json").write_text(
+            json.dumps({"etag": None, "last_modified": None, "content_length": None})
+        )
+        cache = StationFileCache(tmp_path, current_year=2025)
+        with _noaa_stand_in({"/2020/72315003812.csv": body}) as stand_in:
+            with noaa_client.NoaaTransport() as transport:
+                metadata = noaa_client.fetch_station_metadata(
+                    "72315003812.csv",
+                    2020,
+                    retries=0,
+                    transport=transport,
+                    cache=cache,
+                    base_url=stand_in.base_url,
+                )
+        assert [record.status for record in transport.records] == [206]
+        assert metadata is not None
+        assert metadata.name == "ASHEVILLE"
+
+
+def _fake_metadata_fetch(
+    calls: list[str],
+    missing: frozenset[str] = frozenset(),
+    fail_on: str | None = None,
+) -> Callable[..., tuple[noaa_client.StationMetadata | None, int | None]]:
+    def fake(
+        file_name: str, years: list[int], **_: object
+    ) -> tuple[noaa_client.StationMetadata | None, int | None]:
+        calls.append(file_name)
+        # Uneven latencies so threaded fetches complete out of order.
+        time.sleep(0.01 * (int(file_name[1:3]) % 3))
+        if file_name == fail_on:
+            raise RuntimeError("connection reset")
+        if file_name in missing:
+            return None, None
+        number = int(file_name[1:3])
+        metadata = noaa_client.StationMetadata(
+            latitude=float(number),
+            longitude=-float(number),
+            elevation=10.0 * number,
+            name=f"STATION {number}",
+            file_name=file_name,
+        )
+        return metadata, years[number % len(years)]
+
+    return fake
+
+
+class TestBuildLocationIds:
+    """Threaded metadata fetch with an append-only journal."""
+
+    _COUNTS = pd.DataFrame(
+        {
+            "FileName": [f"S{number:02d}.csv" for number in range(1, 21)],
+            "No_Of_Years": [number % 7 + 1 for number in range(1, 21)],
+        }
+    )
+    _MISSING = frozenset({"S04.csv", "S09.csv", "S15.csv"})
+
+    def _build(self, output_csv: Path, **kwargs: object) -> pd.DataFrame:
+        return pipeline.build_location_ids(
+            self._COUNTS,
+            output_csv,
+            metadata_years=[2018, 2019, 2020],
+            **kwargs,
+        )
+
+    def test_parallel_rows_match_serial_run(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[str] = []
+        monkeypatch.setattr(
+            pipeline, "fetch_station_metadata_for_years", _fake_metadata_fetch(calls, self._MISSING)
+        )
+        serial = self._build(tmp_path / "serial" / "Stations.csv")
+        parallel = self._build(tmp_path / "parallel" / "Stations.csv", workers=4)
+        pd.testing.assert_frame_equal(parallel, serial)
+        assert parallel["LegacyID"].tolist() == [
+            number for number in range(1, 21) if f"S{number:02d}.csv" not in self._MISSING
+        ]
+        assert parallel["No_Of_Years"].tolist() == [
+            number % 7 + 1 for number in parallel["LegacyID"]
+        ]
+        pd.testing.assert_frame_equal(
+            pd.read_csv(tmp_path / "parallel" / "Stations.csv"),
+            pd.read_csv(tmp_path / "serial" / "Stations.csv"),
+        )
+        assert not (tmp_path / "parallel" / "Stations_journal.jsonl").exists()
+
+    def test_start_index_and_max_locations_match_serial_run(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[str] = []
+        monkeypatch.setattr(
+            pipeline, "fetch_station_metadata_for_years", _fake_metadata_fetch(calls, self._MISSING)
+        )
+        options = {"start_index": 2, "max_locations": 5}
+        serial = self._build(tmp_path / "serial" / "Stations.csv", **options)
+        assert calls == ["S03.csv", "S04.csv", "S05.csv", "S06.csv", "S07.csv", "S08.csv"]
+        parallel = self._build(tmp_path / "parallel" / "Stations.csv", workers=3, **options)
+        pd.testing.assert_frame_equal(parallel, serial)
+        assert parallel["LegacyID"].tolist() == [3, 5, 6, 7, 8]
+
+    def test_interrupted_run_resumes_from_journal(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        output_csv = tmp_path / "Stations.csv"
+        calls: list[str] = []
+        monkeypatch.setattr(
+            pipeline,
+            "fetch_station_metadata_for_years",
+            _fake_metadata_fetch(calls, self._MISSING, fail_on="S12.csv"),
+        )
+        with pytest.raises(RuntimeError, match="connection reset"):
+            self._build(output_csv, workers=3)
+        journal = tmp_path / "Stations_journal.jsonl"
+        assert not output_csv.exists()
+        journaled = [json.loads(line)["FileName"] for line in journal.read_text().splitlines()]
+        assert journaled == [
+            f"S{number:02d}.csv" for number in range(1, 12) if f"S{number:02d}.csv" not in self._MISSING
+        ]
+
+        calls.clear()
+        monkeypatch.setattr(
+            pipeline, "fetch_station_metadata_for_years", _fake_metadata_fetch(calls, self._MISSING)
+        )
+        resumed = self._build(output_csv, workers=3)
+        assert not set(calls) & set(journaled)
+        expected = self._build(tmp_path / "fresh" / "Stations.csv")
+        pd.testing.assert_frame_equal(resumed, expected)
+        assert not journal.exists()
+
+    def test_file_list_limits_probed_years(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        indexes: list[object] = []
+
+        def fake(file_name: str, years: list[int], **kwargs: object) -> tuple[None, None]:
+            indexes.append(kwargs["year_index"])
+            return None, None
+
+        monkeypatch.setattr(pipeline, "fetch_station_metadata_for_years", fake)
+        file_list = pd.DataFrame(
+            {"YEAR": [2018, 2020, 2019], "FileName": ["S01.csv", "S01.csv", "S02.csv"]}
+        )
+        self._build(tmp_path / "Stations.csv", file_list=file_list, max_locations=1)
+        assert indexes[0] == {"S01.csv": (2020, 2018), "S02.csv": (2019,)}
+        self._build(tmp_path / "Stations.csv", resume=False, max_locations=1)
+        assert indexes[-1] is None
+
+    def test_torn_journal_line_is_cut_before_resuming(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[str] = []
+        monkeypatch.setattr(
+            pipeline, "fetch_station_metadata_for_years", _fake_metadata_fetch(calls, self._MISSING)
+        )
+        expected = self._build(tmp_path / "fresh" / "Stations.csv")
+        rows = expected.head(2).to_dict(orient="records")
+        journal = tmp_path / "Stations_journal.jsonl"
+        journal.write_text(json.dumps(rows[0]) + "\n" + json.dumps(rows[1])[:25])
+        calls.clear()
+        monkeypatch.setattr(
+            pipeline,
+            "fetch_station_metadata_for_years",
+            _fake_metadata_fetch(calls, self._MISSING, fail_on="S08.csv"),
+        )
+        with pytest.raises(RuntimeError, match="connection reset"):
+            self._build(tmp_path / "Stations.csv", workers=2)
+        assert "S01.csv" not in calls
+        assert "S02.csv" in calls
+        journaled = [json.loads(line)["FileName"] for line in journal.read_text().splitlines()]
+        assert journaled == ["S01.csv", "S02.csv", "S03.csv", "S05.csv", "S06.csv", "S07.csv"]
+
+        calls.clear()
+        monkeypatch.setattr(
+            pipeline, "fetch_station_metadata_for_years", _fake_metadata_fetch(calls, self._MISSING)
+        )
+        resumed = self._build(tmp_path / "Stations.csv", workers=2)
+        assert not set(calls) & set(journaled)
+        pd.testing.assert_frame_equal(resumed, expected)
+
+
+class TestDownloadLocationData:
+    """Yearly downloads against a local HTTP stand-in."""
+
+    def test_concurrent_download_matches_serial_in_year_order(self) -> None:
+        files = _yearly_csvs("72315003812.csv", range(2018, 2024))
+        del files["/2020/72315003812.csv"]
+        years = list(range(2023, 2017, -1))
+        with _noaa_stand_in(files, delay=0.02) as stand_in:
+            serial = pipeline.download_location_data(
+                "72315003812.csv", years, base_url=stand_in.base_url
+            )
+            concurrent = pipeline.download_location_data(
+                "72315003812.csv", years, max_concurrency=4, base_url=stand_in.base_url
+            )
+        pd.testing.assert_frame_equal(concurrent, serial)
+        assert concurrent["YEAR"].drop_duplicates().tolist() == [2023, 2022, 2021, 2019, 2018]
+        assert concurrent["DATE"].str[:4].astype(int).tolist() == concurrent["YEAR"].tolist()
+
+    def test_concurrency_respects_global_limit(self) -> None:
+        files = _yearly_csvs("72315003812.csv", range(2000, 2012))
+        with _noaa_stand_in(files, delay=0.1) as stand_in:
+            raw = pipeline.download_location_data(
+                "72315003812.csv",
+                range(2000, 2012),
+                max_concurrency=50,
+                base_url=stand_in.base_url,
+            )
+        assert len(raw) == 24
+        assert 1 < stand_in.peak_in_flight <= MAX_DOWNLOAD_CONCURRENCY
+
+    def test_sleep_seconds_spaces_concurrent_request_starts(self) -> None:
+        files = _yearly_csvs("72315003812.csv", range(2000, 2005))
+        with _noaa_stand_in(files) as stand_in:
+            pipeline.download_location_data(
+                "72315003812.csv",
+                range(2000, 2005),
+                sleep_seconds=0.1,
+                max_concurrency=4,
+                base_url=stand_in.base_url,
+            )
+        # Starts are stamped by the server, so allow for connection set-up jitter.
+        gaps = [later - earlier for earlier, later in zip(stand_in.starts, stand_in.starts[1:])]
+        assert len(gaps) == 4
+        assert min(gaps) >= 0.08
+
+    def test_rejects_non_positive_concurrency(self) -> None:
+        with pytest.raises(ValueError, match="max_concurrency"):
+            pipeline.download_location_data("72315003812.csv", [2020], max_concurrency=0)
+
+
+class TestCleanParquetFile:
+    def test_identifiers_project_raw_columns(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        raw_path = tmp_path / "raw.parquet"
+        pd.DataFrame(
+            {
+                "DATE": ["20240201"],
+                "TMP": ["+0144,1"],
+                "DEW": ["+0050,1"],
+                "MW1": ["05,1"],
+            }
+        ).to_parquet(raw_path, index=False)
+
+        read_columns: list[object] = []
+
+        class SpyParquetFile(pq.ParquetFile):
+            def iter_batches(self, **kwargs: object):  # type: ignore[override]
+                read_columns.append(kwargs.get("columns"))
+                return super().iter_batches(**kwargs)
+
+        monkeypatch.setattr(pipeline.pq, "ParquetFile", SpyParquetFile)
+        output = pipeline.clean_parquet_file(raw_path, identifiers=["TMP"])
+
+        assert read_columns and all(columns == ["DATE", "TMP"] for columns in read_columns)
+        cleaned = pd.read_parquet(output)
+        assert cleaned.loc[0, "temperature_c"] == pytest.approx(14.4)
+        assert not any(column.startswith(("DEW", "MW1")) for column in cleaned.columns)
+
+    def test_permissive_mode_keeps_unknown_identifier_expansions(self, tmp_path: Path) -> None:
+        raw = pd.DataFrame(
+            {
+                "DATE": [f"202402{day:02d}" for day in range(1, 5)],
+                "TMP": ["+0144,1", "+0150,1", None, "+9999,9"],
+                "ZZ1": ["1,2,3", None, "4,X,6", "7,8,9"],
+            }
+        )
+        raw_path = tmp_path / "raw.parquet"
+        raw.to_parquet(raw_path, index=False)
+
+        output = pipeline.clean_parquet_file(raw_path, strict_mode=False, chunk_rows=2)
+
+        cleaned = pd.read_parquet(output)
+        assert pq.ParquetFile(output).num_row_groups == 2
+        parts = cleaned[["ZZ1__part1", "ZZ1__part2"]].astype(object)
+        assert parts.where(parts.notna(), None).values.tolist() == [
+            [1.0, "2.0"], [None, None], [4.0, "X"], [7.0, "8.0"],
+        ]
+        assert cleaned["temperature_c"].tolist()[:2] == [pytest.approx(14.4), pytest.approx(15.0)]
+
+    def test_chunks_are_written_as_row_groups_under_one_schema(self, tmp_path: Path) -> None:
+        raw = pd.DataFrame(
+            {
+                "DATE": [f"202402{day:02d}" for day in range(1, 11)],
+                "TMP": ["+0144,1", "+0150,1", "+9999,9", None, "-0012,1"] * 2,
+                "MW1": [None] * 7 + ["05,1", "61,1", None],
+                "REM": [None, "MET010METAR KAVL"] * 5,
+            }
+        )
+        raw_path = tmp_path / "raw.parquet"
+        raw.to_parquet(raw_path, index=False)
+
+        output = pipeline.clean_parquet_file(raw_path, chunk_rows=3)
+
+        assert pq.ParquetFile(output).num_row_groups == 4
+        cleaned = pd.read_parquet(output)
+        expected = pipeline._extract_time_columns(clean_noaa_dataframe(raw))
+        assert list(cleaned.columns) == list(expected.columns)
+        assert cleaned["present_weather_code_1"].tolist()[7:9] == [5.0, 61.0]
+        pd.testing.assert_series_equal(cleaned["temperature_c"], expected["temperature_c"])
+        assert cleaned["usable_metric_fraction"].tolist() == expected["usable_metric_fraction"].tolist()
+
+    def test_compact_dtypes_are_written_for_every_row_group(self, tmp_path: Path) -> None:
+        raw = pd.DataFrame(
+            {
+                "DATE": [f"202402{day:02d}" for day in range(1, 7)],
+                "TMP": ["+0144,1", "+9999,9", None, "-0012,A", None, "+0150,1"],
+                "MW1": [None, None, None, None, "05,1", "61,1"],
+            }
+        )
+        raw_path = tmp_path / "raw.parquet"
+        raw.to_parquet(raw_path, index=False)
+
+        output = pipeline.clean_parquet_file(raw_path, chunk_rows=2, compact=True)
+
+        schema = pq.read_schema(output)
+        assert schema.field("temperature_c").type == pa.float32()
+        assert pa.types.is_dictionary(schema.field("TMP__qc_status").type)
+        assert schema.field("TMP__qc_pass").type == pa.bool_()
+        cleaned = pd.read_parquet(output)
+        expected = clean_noaa_dataframe(raw)
+        assert cleaned["temperature_c"].tolist()[:1] == [pytest.approx(14.4)]
+        assert cleaned["TMP__qc_status"].astype(object).tolist() == expected["TMP__qc_status"].tolist()
+        assert cleaned["temperature_quality_code"].astype(object).tolist()[3] == "A"
+        assert cleaned["present_weather_code_1"].tolist()[4:] == [5.0, 61.0]
+
+    def test_packed_qc_row_groups_decode_to_the_default_layout(self, tmp_path: Path) -> None:
+        raw = pd.DataFrame(
+            {
+                "DATE": [f"202402{day:02d}" for day in range(1, 7)],
+                "TMP": ["+0144,1", "+9999,9", None, "-0012,1", None, "+0150,1"],
+                "MW1": [None, None, None, None, "05,1", "61,1"],
+                "KA1": [None, None, None, None, "024,M,+0150,1", "024,M,+9999,9"],
+            }
+        )
+        raw_path = tmp_path / "raw.parquet"
+        raw.to_parquet(raw_path, index=False)
+
+        output = pipeline.clean_parquet_file(raw_path, chunk_rows=2, packed_qc=True, compact=True)
+
+        schema = pq.read_schema(output)
+        assert schema.field("TMP__qc_code").type == pa.uint8()
+        assert schema.field("qc_pass_mask_0").type == pa.uint64()
+        assert "TMP__qc_status" not in schema.names
+        cleaned = pd.read_parquet(output)
+        expected = clean_noaa_dataframe(raw)
+        assert cleaned["usable_metric_count"].tolist() == expected["usable_metric_count"].tolist()
+        decoded = unpack_qc(cleaned)
+        for column in ("TMP__qc_status", "KA1__part3__qc_reason"):
+            actual = decoded[column].astype(object).where(decoded[column].notna(), None)
+            wanted = expected[column].astype(object).where(expected[column].notna(), None)
+            assert actual.tolist() == wanted.tolist()
+
+    def test_long_layout_is_sorted_by_identifier_then_timestamp(self, tmp_path: Path) -> None:
+        raw = pd.DataFrame(
+            {
+                "STATION": ["72315003812"] * 4,
+                "DATE": [
+                    "2024-02-01T02:00:00", "2024-02-01T00:00:00",
+                    "2024-02-01T01:00:00", "2024-02-01T03:00:00",
+                ],
+                "TMP": ["+0144,1", "+0150,1", None, "+9999,9"],
+                "MW1": [None, None, "05,1", None],
+                "NAME": ["ASHEVILLE"] * 4,
+            }
+        )
+        raw_path = tmp_path / "raw.parquet"
+        raw.to_parquet(raw_path, index=False)
+
+        output = pipeline.clean_parquet_file(raw_path, layout="long")
+
+        assert output.name == "LocationData_Long.parquet"
+        long = pd.read_parquet(output)
+        assert long["identifier"].tolist() == ["MW1", "TMP", "TMP", "TMP"]
+        tmp = long[long["identifier"] == "TMP"]
+        assert tmp["timestamp"].is_monotonic_increasing
+        assert tmp["value"].tolist()[:2] == [pytest.approx(15.0), pytest.approx(14.4)]
+        assert tmp["qc_code"].tolist() == [1, 1, 4]
+        assert long["station_id"].eq("72315003812").all()
+        assert pq.read_schema(output).field("qc_code").type == pa.uint8()
+
+    def test_long_layout_leaves_out_rejected_raw_lines(self, tmp_path: Path) -> None:
+        header = "0004723150038122024020112304+12345+123456+0123FM-15KJFK V02 "
+        valid_raw = header + "X" * 49
+        raw = pd.DataFrame(
+            {
+                "STATION": ["72315003812"] * 3,
+                "DATE": ["2024-02-01T00:00:00", "2024-02-01T01:00:00", "2024-02-01T02:00:00"],
+                "raw_line": [valid_raw, valid_raw[:-1], valid_raw],
+                "TMP": ["+0144,1", "+0150,1", None],
+                "MW1": [None, "05,1", "06,1"],
+            }
+        )
+        raw_path = tmp_path / "raw.parquet"
+        raw.to_parquet(raw_path, index=False)
+
+        long = pd.read_parquet(pipeline.clean_parquet_file(raw_path, layout="long"))
+
+        expected = clean_noaa_long(raw)
+        pd.testing.assert_frame_equal(long, expected)
+        assert long["identifier"].tolist() == ["MW1", "TMP"]
+        assert long["timestamp"].dt.hour.tolist() == [2, 0]
@@ -979,8 +979,30 @@ def control_column_from_if_test(test: ast.AST) -> str | None:
     return ast_literal_str(test.left)
 
 
+def calm_rule_keys(constants_path: Path) -> list[str]:
+    """Identifier/family keys of the compiled calm special cases (_CALM_RULES).
+
+    The calm checks used to be inline ``prefix == ...`` branches in
+    cleaning.py; since the ParserPlan refactor they are table entries in
+    constants.py that cleaning.py reaches through ``plan.calm``.
+    """
+    if not constants_path.exists():
+        return []
+    tree = ast.parse(constants_path.read_text(encoding="utf-8"), filename=str(constants_path))
+    for node in tree.body:
+        target = node.target if isinstance(node, ast.AnnAssign) else None
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+        if not (isinstance(target, ast.Name) and target.id == "_CALM_RULES"):
+            continue
+        if isinstance(node.value, ast.Dict):
+            return [key for key in (ast_literal_str(k) for k in node.value.keys) if key]
+    return []
+
+
 def parse_cleaning_index(cleaning_path: Path) -> CleaningIndex:
     source = cleaning_path.read_text(encoding="utf-8")
+    calm_keys = calm_rule_keys(cleaning_path.with_name("constants.py"))
     tree = ast.parse(source, filename=str(cleaning_path))
     index = CleaningIndex()
     lines = source.splitlines()
@@ -1018,6 +1040,19 @@ def parse_cleaning_index(cleaning_path: Path) -> CleaningIndex:
             elif call_name == "enforce_domain" and index.generic_domain_line is None:
                 index.generic_domain_line = node.lineno
 
+        # Compiled ParserPlan gates (plan.expected_part_count, part_plan.token_width).
+        # The strict arity/width checks read these plan attributes instead of
+        # calling the get_* lookups matched above.
+        if isinstance(node, ast.Attribute) and isinstance(node.ctx, ast.Load):
+            if node.attr == "expected_part_count":
+                if index.strict_arity_line is None:
+                    index.strict_arity_line = node.lineno
+                index.add_evidence("", "", "arity", "strict_gate", node.lineno, "low")
+            elif node.attr in {"token_width", "token_pattern"}:
+                if index.strict_width_line is None:
+                    index.strict_width_line = node.lineno
+                index.add_evidence("", "", "width", "strict_gate", node.lineno, "low")
+
         if isinstance(node, ast.If):
             prefix_value = ""
             prefix_family = ""
@@ -1167,6 +1202,10 @@ def parse_cleaning_index(cleaning_path: Path) -> CleaningIndex:
             index.add_evidence("", "OD", "domain", "special_case", line_no, "medium")
         if "is_oe_calm" in line and "=" in line:
             index.add_evidence("", "OE", "domain", "special_case", line_no, "medium")
+        if "plan.calm" in line:
+            for key in calm_keys:
+                ident = key if len(key) > 2 else ""
+                index.add_evidence(ident, identifier_family(key), "domain", "special_case", line_no, "medium")
 
         clamp_match = re.search(
             r'if\s+prefix\s*==\s*"([A-Z0-9]+)".*scaled\s*[<>]=?\s*([+-]?\d+(?:\.\d+)?)',